@@ -0,0 +1,3 @@
+"""Version of the route-to-art package; read by the CLI and the build."""
+
+__version__ = "0.1.0"
@@ -1,33 +1,31 @@
 """
-Configuration management for gpx-art.
+Configuration management for the gpx-art tool.
 
-Handles loading, validation, and access to configuration settings
-from YAML files with support for defaults and overrides.
+This module handles loading, validation, and merging of configuration
+from YAML files, with support for defaults and overrides.
 """
 
+import copy
+import functools
 import os
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
-import yaml
 
-
-class ConfigError(Exception):
-    """Exception raised for configuration errors."""
-    pass
-
-
-class Config:
+def _build_default_config() -> Dict[str, Any]:
     """
-    Configuration manager for gpx-art.
+    Build a fresh copy of the built-in default configuration.
     
-    Handles loading configuration from YAML files, validation, and
-    providing access to configuration values with appropriate defaults.
-    """
+    The structure is spelled out as a literal so that every call allocates
+    new nested dicts and lists without walking an existing structure.
     
-    # Default configuration structure
-    DEFAULT_CONFIG = {
+    Returns:
+        Newly allocated default configuration dictionary
+    """
+    return {
         "defaults": {
             "thickness": "medium",
             "color": "#000000",
@@ -59,389 +57,178 @@ class Config:
             }
         }
     }
+
+
+# Container types copied by _copy_tree; everything else in parsed YAML is shared
+_CONTAINER_TYPES = (dict, list)
+
+# Default configuration file locations, in search order after GPX_ART_CONFIG
+_HOME_CONFIG = os.path.expanduser("~/.gpx-art/config.yml")
+_CWD_CONFIG = "./gpx-art.yml"
+
+# Process-wide Config instances handed out by Config.get_shared(), keyed by
+# absolute config path and storing (mtime_ns, Config)
+_SHARED: Dict[str, Tuple[Optional[int], "Config"]] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _reset_shared() -> None:
+    """Drop shared Config instances and recreate the lock (used after fork())."""
+    global _SHARED_LOCK
+    _SHARED.clear()
+    _SHARED_LOCK = threading.Lock()
+
+
+# Forked children must not inherit the parent's shared instances or a held lock
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared)
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a file, treating any OS error as the file not existing.
     
-    # Valid values for enum-like settings
-    VALID_VALUES = {
-        "thickness": ["thin", "medium", "thick"],
-        "style": ["solid", "dashed"],
-        "markers.unit": ["miles", "km"],
-        "overlay.position": ["top-left", "top-right", "bottom-left", "bottom-right"],
-        "overlay.fields": ["distance", "duration", "elevation", "name", "date"],
-        "export.formats": ["png", "svg", "pdf"],
-        "export.page_size": [
-            "letter", "a4", 
-            "square-small", "square-medium", "square-large",
-            "landscape-small", "landscape-medium", "landscape-large"
-        ]
-    }
-    
-    def __init__(self, config_path: Optional[str] = None):
-        """
-        Initialize the configuration manager.
-        
-        Args:
-            config_path: Optional explicit path to a configuration file.
-                         If not provided, will search for config files in default locations.
-        """
-        self.config_path = config_path
-        self.config = self.load_config()
-    
-    def get_default_path(self) -> str:
-        """
-        Get the default configuration file path.
-        
-        Checks multiple locations in order:
-        1. GPX_ART_CONFIG environment variable
-        2. ~/.gpx-art/config.yml in user's home directory
-        3. ./gpx-art.yml in the current working directory
-        
-        Returns:
-            Path to the default configuration file
-        """
-        # Check environment variable first
-        if env_path := os.environ.get("GPX_ART_CONFIG"):
-            return env_path
-            
-        # Check user home directory
-        home_config = os.path.expanduser("~/.gpx-art/config.yml")
-        if os.path.exists(home_config):
-            return home_config
-            
-        # Check current directory
-        cwd_config = "./gpx-art.yml"
-        if os.path.exists(cwd_config):
-            return cwd_config
-            
-        # Return default path for potential writing
-        return home_config
-    
-    def load_config(self) -> Dict[str, Any]:
-        """
-        Load configuration from file, falling back to defaults when necessary.
-        
-        Returns:
-            Dictionary containing the merged and validated configuration
-            
-        Raises:
-            ConfigError: If configuration file exists but can't be loaded or contains invalid values
-        """
-        # Start with default configuration
-        config = self._deep_copy(self.DEFAULT_CONFIG)
-        
-        # Determine config path
-        path = self.config_path or self.get_default_path()
-        
-        # Try to load configuration file if it exists
-        if os.path.exists(path):
-            try:
-                with open(path, 'r') as f:
-                    user_config = yaml.safe_load(f)
-                    
-                if user_config is None:
-                    # Empty file
-                    logging.warning(f"Config file {path} is empty. Using defaults.")
-                    return config
-                    
-                if not isinstance(user_config, dict):
-                    raise ConfigError(f"Config file {path} is not a valid YAML dictionary.")
-                    
-                # Merge with defaults
-                config = self.merge_with_defaults(user_config)
-                
-                # Validate configuration
-                self._validate_config(config)
-                    
-            except yaml.YAMLError as e:
-                raise ConfigError(f"Error parsing config file {path}: {str(e)}")
-            except Exception as e:
-                if isinstance(e, ConfigError):
-                    raise
-                raise ConfigError(f"Error loading config from {path}: {str(e)}")
-        else:
-            logging.info(f"No config file found at {path}. Using defaults.")
-            
-        return config
-    
-    def merge_with_defaults(self, user_config: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Merge user configuration with default values.
-        
-        Args:
-            user_config: User-provided configuration dictionary
-            
-        Returns:
-            Dictionary with user values merged into defaults
-        """
-        # Make a deep copy of defaults to avoid modifying the class constant
-        result = self._deep_copy(self.DEFAULT_CONFIG)
-        
-        # Recursively merge user config into defaults
-        self._merge_dicts(result, user_config)
-        
-        return result
-    
-    def _merge_dicts(self, base: Dict[str, Any], override: Dict[str, Any]) -> None:
-        """
-        Recursively merge dictionaries, modifying base in place.
-        
-        Args:
-            base: Base dictionary to merge into
-            override: Dictionary with values to override base
-        """
-        for key, value in override.items():
-            # Handle nested dictionaries
-            if (
-                key in base and 
-                isinstance(base[key], dict) and 
-                isinstance(value, dict)
-            ):
-                self._merge_dicts(base[key], value)
-            else:
-                # Direct value assignment for non-dict values or mismatched types
-                base[key] = value
-    
-    def _deep_copy(self, obj: Any) -> Any:
-        """
-        Create a deep copy of an object.
+    Args:
+        path: Path to stat
         
-        Args:
-            obj: Object to copy
-            
-        Returns:
-            Deep copy of the object
-        """
-        if isinstance(obj, dict):
-            return {k: self._deep_copy(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._deep_copy(item) for item in obj]
-        else:
-            # For primitive values, return as is
-            return obj
+    Returns:
+        The stat result, or None if the path cannot be stat'ed
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _copy_tree(obj: Any) -> Any:
+    """
+    Copy the dicts and lists of a parsed config document.
     
-    def _validate_config(self, config: Dict[str, Any]) -> None:
-        """
-        Validate configuration values.
-        
-        Args:
-            config: Configuration dictionary to validate
-            
-        Raises:
-            ConfigError: If configuration contains invalid values
-        """
-        if "defaults" not in config:
-            raise ConfigError("Configuration must contain a 'defaults' section")
-            
-        defaults = config["defaults"]
-        
-        # Check enum values
-        self._validate_enum_value(defaults, "thickness")
-        self._validate_enum_value(defaults, "style")
-        
-        # Check markers config
-        if "markers" in defaults:
-            markers = defaults["markers"]
-            if not isinstance(markers, dict):
-                raise ConfigError("markers must be a dictionary")
-                
-            if "enabled" in markers and not isinstance(markers["enabled"], bool):
-                raise ConfigError("markers.enabled must be a boolean")
-                
-            self._validate_enum_value(markers, "unit", prefix="markers.")
-            
-            # Validate numeric values
-            self._validate_positive_number(markers, "interval")
-            self._validate_positive_number(markers, "size")
-            self._validate_positive_int(markers, "label_font_size")
-        
-        # Check overlay config
-        if "overlay" in defaults:
-            overlay = defaults["overlay"]
-            if not isinstance(overlay, dict):
-                raise ConfigError("overlay must be a dictionary")
-                
-            if "enabled" in overlay and not isinstance(overlay["enabled"], bool):
-                raise ConfigError("overlay.enabled must be a boolean")
-                
-            self._validate_enum_value(overlay, "position", prefix="overlay.")
-            
-            if "fields" in overlay:
-                if not isinstance(overlay["fields"], list):
-                    raise ConfigError("overlay.fields must be a list")
-                    
-                for field in overlay["fields"]:
-                    if field not in self.VALID_VALUES["overlay.fields"]:
-                        valid_values = ", ".join(self.VALID_VALUES["overlay.fields"])
-                        raise ConfigError(f"Invalid overlay field: {field}. Valid values: {valid_values}")
-                
-            # Validate numeric and color values
-            self._validate_positive_int(overlay, "font_size")
-            
-            if "background" in overlay and not isinstance(overlay["background"], bool):
-                raise ConfigError("overlay.background must be a boolean")
-                
-            self._validate_float_range(overlay, "bg_alpha", 0.0, 1.0)
-        
-        # Check export config
-        if "export" in defaults:
-            export = defaults["export"]
-            if not isinstance(export, dict):
-                raise ConfigError("export must be a dictionary")
-                
-            if "formats" in export:
-                if not isinstance(export["formats"], list):
-                    raise ConfigError("export.formats must be a list")
-                    
-                for fmt in export["formats"]:
-                    if fmt not in self.VALID_VALUES["export.formats"]:
-                        valid_values = ", ".join(self.VALID_VALUES["export.formats"])
-                        raise ConfigError(f"Invalid export format: {fmt}. Valid values: {valid_values}")
-            
-            # Validate numeric values
-            self._validate_positive_number(export, "width")
-            self._validate_positive_number(export, "height")
-            self._validate_positive_int(export, "dpi")
-            
-            # Validate page size
-            self._validate_enum_value(export, "page_size", prefix="export.")
+    Faster than copy.deepcopy() for YAML/JSON data: exact class checks skip
+    the isinstance() MRO walk, and scalars are only recursed into by their
+    parent comprehension, not via a call per value.
     
-    def _validate_enum_value(self, config: Dict[str, Any], key: str, prefix: str = "") -> None:
-        """
-        Validate that a value is one of the allowed enum values.
+    Args:
+        obj: Parsed configuration data
         
-        Args:
-            config: Configuration dictionary
-            key: Key to validate
-            prefix: Optional prefix for error messages and valid values lookup
-            
-        Raises:
-            ConfigError: If value is not in the allowed set
-        """
-        full_key = f"{prefix}{key}"
-        if key in config and full_key in self.VALID_VALUES:
-            value = config[key]
-            valid_values = self.VALID_VALUES[full_key]
-            if value not in valid_values:
-                valid_options = ", ".join(valid_values)
-                raise ConfigError(f"Invalid {full_key}: {value}. Valid options: {valid_options}")
+    Returns:
+        Copy of obj with fresh dicts and lists; other values are shared
+    """
+    if obj.__class__ is dict:
+        return {k: _copy_tree(v) if v.__class__ in _CONTAINER_TYPES else v for k, v in obj.items()}
+    if obj.__class__ is list:
+        return [_copy_tree(v) if v.__class__ in _CONTAINER_TYPES else v for v in obj]
+    return obj
+
+
+@functools.lru_cache(maxsize=None)
+def _import_yaml() -> Tuple[Any, Any, Any]:
+    """
+    Import PyYAML on first use, so runs without a config file never load it.
     
-    def _validate_positive_number(self, config: Dict[str, Any], key: str) -> None:
-        """
-        Validate that a value is a positive number.
-        
-        Args:
-            config: Configuration dictionary
-            key: Key to validate
-            
-        Raises:
-            ConfigError: If value is not a positive number
-        """
-        if key in config:
-            value = config[key]
-            if not isinstance(value, (int, float)):
-                raise ConfigError(f"{key} must be a number")
-                
-            if value <= 0:
-                raise ConfigError(f"{key} must be positive")
+    The LibYAML C bindings are preferred when PyYAML was built against libyaml.
     
-    def _validate_positive_int(self, config: Dict[str, Any], key: str) -> None:
-        """
-        Validate that a value is a positive integer.
-        
-        Args:
-            config: Configuration dictionary
-            key: Key to validate
-            
-        Raises:
-            ConfigError: If value is not a positive integer
-        """
-        if key in config:
-            value = config[key]
-            if not isinstance(value, int):
-                raise ConfigError(f"{key} must be an integer")
-                
-            if value <= 0:
-                raise ConfigError(f"{key} must be positive")
+    Returns:
+        Tuple of (yaml module, safe loader class, safe dumper class)
+    """
+    import yaml
+    try:
+        from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+    return yaml, SafeLoader, SafeDumper
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its path, modification time and size.
     
-    def _validate_float_range(self, config: Dict[str, Any], key: str, min_val: float, max_val: float) -> None:
-        """
-        Validate that a value is a float within the specified range.
-        
-        Args:
-            config: Configuration dictionary
-            key: Key to validate
-            min_val: Minimum allowed value (inclusive)
-            max_val: Maximum allowed value (inclusive)
-            
-        Raises:
-            ConfigError: If value is not in the allowed range
-        """
-        if key in config:
-            value = config[key]
-            if not isinstance(value, (int, float)):
-                raise ConfigError(f"{key} must be a number")
-                
-            if value < min_val or value > max_val:
-                raise ConfigError(f"{key} must be between {min_val} and {max_val}")
+    The mtime and size arguments are only part of the cache key, so an edited
+    file is parsed again. Callers must not mutate the returned object.
     
-    def get(self, key: str, default: Any = None) -> Any:
-        """
-        Get a configuration value by its key.
-        
-        Supports dot notation for nested values (e.g., 'defaults.export.formats').
+    Args:
+        path: Absolute path to the YAML file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
         
-        Args:
-            key: Configuration key to retrieve
-            default: Default value to return if key is not found
-            
-        Returns:
-            Configuration value or default if not found
-        """
-        # Start with the full config
-        current = self.config
-        
-        # Split the key path
-        parts = key.split('.')
-        
-        # Navigate through the path
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return default
-        
-        return current
-    
-    def get_defaults(self) -> Dict[str, Any]:
-        """
-        Get the defaults section of the configuration.
-        
-        Returns:
-            Dictionary containing default values
-        """
-        return self.config.get("defaults", {})
+    Returns:
+        The parsed YAML document
+    """
+    yaml, safe_loader, _ = _import_yaml()
+    # Read the whole file in one call rather than letting PyYAML pull small chunks
+    with open(path, 'r') as f:
+        raw = f.read()
+    return yaml.load(raw, Loader=safe_loader)
+
+
+def _dump_sample(config: Mapping[str, Any]) -> str:
+    """
+    Render a configuration as sample YAML file content.
     
-    def generate_sample(self) -> str:
-        """
-        Generate a sample configuration file content.
+    Args:
+        config: Configuration to render
         
-        Returns:
-            YAML string with sample configuration
-        """
-        return yaml.dump(self.DEFAULT_CONFIG, sort_keys=False, default_flow_style=False)
+    Returns:
+        YAML string
+    """
+    yaml, _, safe_dumper = _import_yaml()
+    return yaml.dump(
+        config,
+        sort_keys=False,
+        default_flow_style=False,
+        Dumper=safe_dumper
+    )
 
-"""
-Configuration management for the gpx-art tool.
 
-This module handles loading, validation, and merging of configuration
-from YAML files, with support for defaults and overrides.
-"""
+@functools.lru_cache(maxsize=1)
+def _builtin_sample() -> str:
+    """Render the built-in defaults once; they never change within a process."""
+    return _dump_sample(_build_default_config())
 
-import os
-import logging
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
 
-import yaml
+# Sentinel for keys absent from a configuration section
+_MISSING = object()
+
+
+def _walk(config: Mapping[str, Any], parts: Tuple[str, ...]) -> Any:
+    """
+    Look up a nested configuration value one key at a time.
+    
+    Args:
+        config: Configuration mapping to search
+        parts: Keys to follow, outermost first
+        
+    Returns:
+        The value found, or _MISSING if any key along the way is absent
+    """
+    current = config
+    for part in parts:
+        if not isinstance(current, (dict, MappingProxyType)):
+            return _MISSING
+        current = current.get(part, _MISSING)
+        if current is _MISSING:
+            return _MISSING
+    return current
+
+
+def _flatten(config: Mapping[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (dotted key, value) pairs for every leaf value in a nested config.
+    
+    Args:
+        config: Nested configuration mapping
+        prefix: Dotted key of the mapping within the full configuration
+        
+    Yields:
+        Tuples of dotted key and leaf (non-mapping) value
+    """
+    for key, value in config.items():
+        dotted_key = f"{prefix}{key}"
+        if isinstance(value, (dict, MappingProxyType)):
+            yield from _flatten(value, f"{dotted_key}.")
+        else:
+            yield dotted_key, value
 
 
 class ConfigError(Exception):
@@ -458,49 +245,47 @@ class Config:
     """
     
     # Default configuration structure
-    DEFAULT_CONFIG = {
-        "defaults": {
-            "thickness": "medium",
-            "color": "#000000",
-            "style": "solid",
-            "markers": {
-                "enabled": True,
-                "unit": "miles",
-                "interval": 1.0,
-                "size": 6.0,
-                "color": None,  # Use route color
-                "label_font_size": 8
-            },
-            "overlay": {
-                "enabled": True,
-                "fields": ["distance", "date"],
-                "position": "top-left",
-                "font_size": 10,
-                "font_color": "black",
-                "background": True,
-                "bg_color": "white",
-                "bg_alpha": 0.7
-            },
-            "export": {
-                "formats": ["png"],
-                "width": 9,
-                "height": 6,
-                "dpi": 300,
-                "page_size": "letter"
-            }
-        }
-    }
+    DEFAULT_CONFIG = _build_default_config()
+    
+    # Reference to the built-in defaults, used to detect a substituted DEFAULT_CONFIG
+    _BUILTIN_DEFAULT_CONFIG = DEFAULT_CONFIG
     
     # Valid values for enum-like options
     VALID_VALUES = {
-        "thickness": {"thin", "medium", "thick"},
-        "style": {"solid", "dashed"},
-        "markers.unit": {"miles", "km"},
-        "overlay.position": {"top-left", "top-right", "bottom-left", "bottom-right"},
-        "overlay.fields": {"distance", "duration", "elevation", "name", "date"},
-        "export.formats": {"png", "svg", "pdf"}
+        "thickness": frozenset({"thin", "medium", "thick"}),
+        "style": frozenset({"solid", "dashed"}),
+        "markers.unit": frozenset({"miles", "km"}),
+        "overlay.position": frozenset({"top-left", "top-right", "bottom-left", "bottom-right"}),
+        "overlay.fields": frozenset({"distance", "duration", "elevation", "name", "date"}),
+        "export.formats": frozenset({"png", "svg", "pdf"})
     }
     
+    # Valid values rendered once for error messages
+    _VALID_VALUE_STRINGS = {key: ", ".join(sorted(values)) for key, values in VALID_VALUES.items()}
+    
+    # Sections of 'defaults' that must be dictionaries when present
+    _SECTIONS = ("markers", "overlay", "export")
+    
+    # Keys whose default value is a nested dictionary; only these can need a recursive merge
+    _DICT_KEYS = frozenset({"defaults", *_SECTIONS})
+    
+    # Value checks applied by _validate_config, in order, as
+    # (dotted key within 'defaults', path from the config root, kind)
+    _CHECKS = tuple(
+        (key, ("defaults", *key.split(".")), kind)
+        for key, kind in (
+            ("thickness", "enum"),
+            ("style", "enum"),
+            ("markers.unit", "enum"),
+            ("overlay.position", "enum"),
+            ("overlay.fields", "enum_list"),
+            ("export.formats", "enum_list"),
+            ("export.width", "positive_number"),
+            ("export.height", "positive_number"),
+            ("export.dpi", "positive_int"),
+        )
+    )
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the configuration manager.
@@ -511,6 +296,87 @@ class Config:
         """
         self.config_path = config_path
         self.config = self.load_config()
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """
+        The loaded configuration.
+        
+        Callers may edit the returned dictionary in place, so the lookup
+        tables behind get() are rebuilt the next time they are used.
+        """
+        self._tables = None
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._tables = None
+    
+    def _lookup_tables(self) -> Tuple[Dict[str, Any], Mapping[str, Any]]:
+        """
+        Get the flat lookup tables for the configuration, building them if needed.
+        
+        The tables are private to the instance. They are dropped whenever
+        the configuration is replaced or handed out for editing, and are
+        rebuilt along with a fresh lookup cache for get().
+        
+        Returns:
+            Tuple of (dotted key -> leaf value table, read-only view of the
+            defaults leaves keyed relative to the defaults section)
+        """
+        tables = self._tables
+        if tables is None:
+            flat = dict(_flatten(self._config))
+            flat_defaults = MappingProxyType({
+                key[len("defaults."):]: leaf
+                for key, leaf in flat.items()
+                if key.startswith("defaults.")
+            })
+            self._resolve = functools.lru_cache(maxsize=64)(self._resolve_uncached)
+            tables = self._tables = (flat, flat_defaults)
+        return tables
+        
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all cached YAML parses and shared instances so the next load re-reads from disk."""
+        _parse_yaml_cached.cache_clear()
+        with _SHARED_LOCK:
+            _SHARED.clear()
+    
+    @classmethod
+    def get_shared(cls, config_path: Optional[str] = None) -> "Config":
+        """
+        Get a process-wide Config for a config file, loading it only once.
+        
+        The instance is reused until the file's modification time changes.
+        Callers share the returned object and must not modify its configuration.
+        
+        Args:
+            config_path: Path to config file. If None, uses default locations.
+            
+        Returns:
+            Shared Config instance
+            
+        Raises:
+            ConfigError: If the config file is invalid
+        """
+        if config_path:
+            path, stat = config_path, _stat_or_none(config_path)
+        else:
+            path, stat = cls._find_default_path()
+        
+        abs_path = os.path.abspath(path)
+        mtime_ns = stat.st_mtime_ns if stat is not None else None
+        
+        with _SHARED_LOCK:
+            entry = _SHARED.get(abs_path)
+            if entry is not None and entry[0] == mtime_ns:
+                return entry[1]
+            
+            config = cls(config_path=abs_path)
+            _SHARED[abs_path] = (mtime_ns, config)
+            return config
         
     def get_default_path(self) -> str:
         """
@@ -519,27 +385,37 @@ class Config:
         Returns:
             Path to the default configuration file location
         """
+        return self._find_default_path()[0]
+    
+    @staticmethod
+    def _find_default_path() -> Tuple[str, Optional[os.stat_result]]:
+        """
+        Locate the default configuration file with one stat() per candidate.
+        
+        Returns:
+            Tuple of (path, stat result), where the stat result is None if
+            the file does not exist
+        """
         # Check environment variable first
-        if env_path := os.environ.get("GPX_ART_CONFIG"):
-            return env_path
-            
-        # Check user's home directory
-        home_config = os.path.expanduser("~/.gpx-art/config.yml")
-        if os.path.exists(home_config):
-            return home_config
+        if env_path := os.environ.get("GPX_ART_CONFIG", "").strip():
+            return env_path, _stat_or_none(env_path)
             
-        # Check current directory
-        current_dir_config = "./gpx-art.yml"
-        if os.path.exists(current_dir_config):
-            return current_dir_config
+        # Check user's home directory, then the current directory
+        for candidate in (_HOME_CONFIG, _CWD_CONFIG):
+            stat = _stat_or_none(candidate)
+            if stat is not None:
+                return candidate, stat
             
         # No config file found, return the user home location (for potential writing)
-        return home_config
+        return _HOME_CONFIG, None
         
     def load_config(self) -> Dict[str, Any]:
         """
         Load configuration from file, falling back to defaults.
         
+        When no config file is found, or it is empty, a fresh copy of
+        DEFAULT_CONFIG is returned.
+        
         Returns:
             Dictionary containing the merged configuration
         
@@ -547,42 +423,47 @@ class Config:
             ConfigError: If the configuration file exists but cannot be loaded
                         or contains invalid values.
         """
-        # Start with default configuration
-        config = self.DEFAULT_CONFIG.copy()
-        
         # Determine config path
-        path = self.config_path or self.get_default_path()
+        if self.config_path:
+            path, stat = self.config_path, _stat_or_none(self.config_path)
+        else:
+            path, stat = self._find_default_path()
         
         # Try to load configuration file if it exists
-        if os.path.exists(path):
+        if stat is not None:
+            abs_path = os.path.abspath(path)
+            yaml = _import_yaml()[0]
             try:
-                with open(path, 'r') as f:
-                    user_config = yaml.safe_load(f)
+                user_config = _parse_yaml_cached(abs_path, stat.st_mtime_ns, stat.st_size)
                     
                 if user_config is None:
                     # Empty file
                     logging.warning(f"Config file {path} is empty. Using defaults.")
-                    return config
+                    return self._clone_defaults()
                     
                 if not isinstance(user_config, dict):
                     raise ConfigError(f"Config file {path} is not a valid YAML dictionary.")
                     
-                # Merge with defaults
-                config = self.merge_with_defaults(user_config)
+                # Merge with defaults (copying first so the cached parse is never mutated)
+                config = self.merge_with_defaults(_copy_tree(user_config))
                 
                 # Validate configuration
                 self._validate_config(config)
+                return config
                     
+            except FileNotFoundError:
+                # Removed between stat() and open(); treat it like a missing file
+                pass
             except yaml.YAMLError as e:
                 raise ConfigError(f"Error parsing config file {path}: {str(e)}")
             except Exception as e:
                 if isinstance(e, ConfigError):
                     raise
                 raise ConfigError(f"Error loading config from {path}: {str(e)}")
-        else:
-            logging.info(f"No config file found at {path}. Using defaults.")
-            
-        return config
+        
+        # No file: use a copy so edits never reach the class-level defaults
+        logging.info(f"No config file found at {path}. Using defaults.")
+        return self._clone_defaults()
     
     def merge_with_defaults(self, user_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -594,8 +475,22 @@ class Config:
         Returns:
             Merged configuration dictionary
         """
-        # Make a deep copy of defaults to avoid modifying the class constant
-        result = self._deep_copy(self.DEFAULT_CONFIG)
+        # Start from a fresh copy of defaults to avoid modifying the class constant
+        result = self._clone_defaults()
+        if not user_config:
+            return result
+        
+        # Common case: only top-level 'defaults' scalars are overridden, so a
+        # single dict update is enough and no recursion is needed
+        user_defaults = user_config.get("defaults")
+        if (
+            user_config.keys() <= {"defaults"} and
+            user_defaults.__class__ is dict and
+            result.get("defaults").__class__ is dict and
+            not any(value.__class__ is dict for value in user_defaults.values())
+        ):
+            result["defaults"].update(user_defaults)
+            return result
         
         # Recursively merge user config into defaults
         self._merge_dicts(result, user_config)
@@ -610,37 +505,33 @@ class Config:
             base: Base dictionary to merge into
             override: Dictionary with values to override base
         """
+        dict_keys = self._DICT_KEYS
         for key, value in override.items():
-            # Handle nested dictionaries
+            # Recurse only for known nested sections where both sides are plain dicts;
+            # YAML only produces plain dicts, so exact class checks suffice
             if (
-                key in base and 
-                isinstance(base[key], dict) and 
-                isinstance(value, dict)
+                key in dict_keys
+                and (existing := base.get(key)).__class__ is dict
+                and value.__class__ is dict
             ):
-                self._merge_dicts(base[key], value)
+                self._merge_dicts(existing, value)
             else:
                 # Direct value assignment for non-dict values or when keys don't match
                 base[key] = value
     
-    def _deep_copy(self, obj: Any) -> Any:
+    def _clone_defaults(self) -> Dict[str, Any]:
         """
-        Create a deep copy of an object.
+        Create a fresh, mutable copy of the default configuration.
         
-        This avoids using copy.deepcopy() which can have issues with some objects.
+        Falls back to copy.deepcopy() when DEFAULT_CONFIG has been replaced
+        with something other than the built-in defaults.
         
-        Args:
-            obj: The object to copy
-            
         Returns:
-            A deep copy of the object
+            A copy of the default configuration that is safe to modify
         """
-        if isinstance(obj, dict):
-            return {k: self._deep_copy(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._deep_copy(item) for item in obj]
-        else:
-            # Primitive values are just returned as is
-            return obj
+        if self.DEFAULT_CONFIG is self._BUILTIN_DEFAULT_CONFIG:
+            return _build_default_config()
+        return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """
@@ -657,78 +548,44 @@ class Config:
             
         defaults = config["defaults"]
         
-        # Check enum values
-        if "thickness" in defaults and defaults["thickness"] not in self.VALID_VALUES["thickness"]:
-            valid_values = ", ".join(self.VALID_VALUES["thickness"])
-            raise ConfigError(f"Invalid thickness: {defaults['thickness']}. Valid values: {valid_values}")
-            
-        if "style" in defaults and defaults["style"] not in self.VALID_VALUES["style"]:
-            valid_values = ", ".join(self.VALID_VALUES["style"])
-            raise ConfigError(f"Invalid style: {defaults['style']}. Valid values: {valid_values}")
-        
-        # Check markers config
-        if "markers" in defaults:
-            markers = defaults["markers"]
-            if not isinstance(markers, dict):
-                raise ConfigError("markers must be a dictionary")
-                
-            if "unit" in markers and markers["unit"] not in self.VALID_VALUES["markers.unit"]:
-                valid_values = ", ".join(self.VALID_VALUES["markers.unit"])
-                raise ConfigError(f"Invalid markers.unit: {markers['unit']}. Valid values: {valid_values}")
-        
-        # Check overlay config
-        if "overlay" in defaults:
-            overlay = defaults["overlay"]
-            if not isinstance(overlay, dict):
-                raise ConfigError("overlay must be a dictionary")
-                
-            if "position" in overlay and overlay["position"] not in self.VALID_VALUES["overlay.position"]:
-                valid_values = ", ".join(self.VALID_VALUES["overlay.position"])
-                raise ConfigError(f"Invalid overlay.position: {overlay['position']}. Valid values: {valid_values}")
+        # Nested sections must be dictionaries before their keys can be checked
+        for section in self._SECTIONS:
+            if section in defaults and not isinstance(defaults[section], dict):
+                raise ConfigError(f"{section} must be a dictionary")
+        
+        for key, path, kind in self._CHECKS:
+            value = _walk(config, path)
+            if value is _MISSING:
+                continue
                 
-            if "fields" in overlay:
-                if not isinstance(overlay["fields"], list):
-                    raise ConfigError("overlay.fields must be a list")
+            if kind == "enum":
+                if value not in self.VALID_VALUES[key]:
+                    valid_values = self._VALID_VALUE_STRINGS[key]
+                    raise ConfigError(f"Invalid {key}: {value}. Valid values: {valid_values}")
                     
-                invalid_fields = set(overlay["fields"]) - self.VALID_VALUES["overlay.fields"]
-                if invalid_fields:
-                    valid_values = ", ".join(self.VALID_VALUES["overlay.fields"])
-                    raise ConfigError(f"Invalid overlay.fields: {', '.join(invalid_fields)}. Valid values: {valid_values}")
-        
-        # Check export config
-        if "export" in defaults:
-            export = defaults["export"]
-            if not isinstance(export, dict):
-                raise ConfigError("export must be a dictionary")
-                
-            if "formats" in export:
-                if not isinstance(export["formats"], list):
-                    raise ConfigError("export.formats must be a list")
+            elif kind == "enum_list":
+                if not isinstance(value, list):
+                    raise ConfigError(f"{key} must be a list")
                     
-                invalid_formats = set(export["formats"]) - self.VALID_VALUES["export.formats"]
-                if invalid_formats:
-                    valid_values = ", ".join(self.VALID_VALUES["export.formats"])
-                    raise ConfigError(f"Invalid export.formats: {', '.join(invalid_formats)}. Valid values: {valid_values}")
-            
-            # Check numeric values
-            if "width" in export and not isinstance(export["width"], (int, float)):
-                raise ConfigError("export.width must be a number")
-                
-            if "height" in export and not isinstance(export["height"], (int, float)):
-                raise ConfigError("export.height must be a number")
-                
-            if "dpi" in export and not isinstance(export["dpi"], int):
-                raise ConfigError("export.dpi must be an integer")
-                
-            # Validate numeric ranges
-            if "width" in export and export["width"] <= 0:
-                raise ConfigError("export.width must be positive")
-                
-            if "height" in export and export["height"] <= 0:
-                raise ConfigError("export.height must be positive")
-                
-            if "dpi" in export and export["dpi"] <= 0:
-                raise ConfigError("export.dpi must be positive")
+                # Probe membership directly; the common all-valid case only builds an empty list
+                allowed = self.VALID_VALUES[key]
+                invalid_values = [item for item in value if item not in allowed]
+                if invalid_values:
+                    valid_values = self._VALID_VALUE_STRINGS[key]
+                    invalid_list = ", ".join(dict.fromkeys(invalid_values))
+                    raise ConfigError(f"Invalid {key}: {invalid_list}. Valid values: {valid_values}")
+                    
+            elif kind == "positive_number":
+                if not isinstance(value, (int, float)):
+                    raise ConfigError(f"{key} must be a number")
+                if value <= 0:
+                    raise ConfigError(f"{key} must be positive")
+                    
+            elif kind == "positive_int":
+                if not isinstance(value, int):
+                    raise ConfigError(f"{key} must be an integer")
+                if value <= 0:
+                    raise ConfigError(f"{key} must be positive")
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -743,36 +600,63 @@ class Config:
         Returns:
             Configuration value or default if not found
         """
-        # Start with the full config
-        current = self.config
-        
-        # Split the key path
-        parts = key.split('.')
-        
-        # Navigate through the path
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return default
+        # Leaf values are a single lookup; interior sections fall back to a walk
+        value = self._lookup_tables()[0].get(key, _MISSING)
+        if value is _MISSING:
+            value = self._resolve(key)
+            # A section handed out can be edited in place, which the leaf
+            # table would not see
+            if isinstance(value, dict):
+                self._tables = None
+        return default if value is _MISSING else value
+    
+    def _resolve_uncached(self, key: str) -> Any:
+        """
+        Look up a dotted configuration key by walking the nested config.
         
-        return current
+        Args:
+            key: Configuration key to retrieve
+            
+        Returns:
+            Configuration value, or _MISSING if the key is not found
+        """
+        return _walk(self._config, tuple(key.split('.')))
     
     def get_defaults(self) -> Dict[str, Any]:
         """
         Get the defaults section of the configuration.
         
+        The result is a copy, so callers may modify it freely.
+        
         Returns:
             Dictionary containing default values
         """
-        return self.config.get("defaults", {})
+        return _copy_tree(self._config.get("defaults", {}))
+    
+    def flat_defaults(self) -> Mapping[str, Any]:
+        """
+        Get every leaf value of the defaults section by its dotted key.
+        
+        Keys are relative to the defaults section (e.g. 'markers.unit').
+        The table is built on first use and kept until the configuration
+        is replaced or handed out for editing.
+        
+        Returns:
+            Read-only mapping of dotted keys to values
+        """
+        return self._lookup_tables()[1]
     
-    def generate_sample(self) -> str:
+    @classmethod
+    def generate_sample(cls) -> str:
         """
         Generate a sample configuration file content.
         
+        The output for the built-in defaults is rendered once and cached.
+        
         Returns:
             YAML string with sample configuration
         """
-        return yaml.dump(self.DEFAULT_CONFIG, sort_keys=False, default_flow_style=False)
+        if cls.DEFAULT_CONFIG is cls._BUILTIN_DEFAULT_CONFIG:
+            return _builtin_sample()
+        return _dump_sample(cls.DEFAULT_CONFIG)
 
@@ -5,19 +5,45 @@ This module provides classes and functions for exporting visualizations
 to various file formats.
 """
 
+import functools
+import importlib
 import io
 import os
+import re
+import struct
 import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+import matplotlib
 import matplotlib.figure
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.backends.backend_agg import FigureCanvasAgg
-from matplotlib.backends.backend_pdf import PdfPages
-from PIL import Image
+from matplotlib.transforms import BboxBase
+
+# Region of the figure to save: 'tight', an explicit bounding box in inches, or None for the whole figure
+BboxSpec = Union[str, BboxBase, None]
+
+# Encoded file contents as returned by the various encoders
+Buffer = Union[bytes, memoryview, np.ndarray]
+
+
+# Decimal places kept in SVG path data. Matplotlib writes 6, far finer
+# than the 1/100 pt that is visible at any practical zoom
+SVG_PRECISION = 2
+
+# rcParams for SVG export: write text as <text> elements instead of
+# embedding an outline for every glyph
+_SVG_RC = {'svg.fonttype': 'none'}
+
+_SVG_PATH_DATA = re.compile(rb'(\sd=")([^"]*)"')
+_SVG_NUMBER = re.compile(rb'-?\d+\.\d+')
+
+# End of the PNG signature plus the IHDR chunk, which is always first
+_PNG_IHDR_END = 8 + 12 + 13
 
 
 class ExportError(Exception):
@@ -25,6 +51,86 @@ class ExportError(Exception):
     pass
 
 
+def _compact_svg_paths(svg: bytes, precision: int) -> bytes:
+    """
+    Round the coordinates in SVG path data and collapse its whitespace.
+    
+    Args:
+        svg: SVG document as written by matplotlib
+        precision: Decimal places to keep
+        
+    Returns:
+        The SVG document with compacted path data
+    """
+    number_format = f"%.{precision}f".encode()
+    
+    def round_number(match: re.Match) -> bytes:
+        text = number_format % float(match.group())
+        if b'.' in text:
+            text = text.rstrip(b'0').rstrip(b'.')
+        return b'0' if text == b'-0' else text
+    
+    def compact_path(match: re.Match) -> bytes:
+        data = b' '.join(match.group(2).split())
+        return match.group(1) + _SVG_NUMBER.sub(round_number, data) + b'"'
+    
+    return _SVG_PATH_DATA.sub(compact_path, svg)
+
+
+def _add_png_dpi(png: Buffer, dpi: float) -> bytes:
+    """
+    Insert a pHYs chunk recording the resolution into an encoded PNG.
+    
+    For encoders that cannot write one themselves. The chunk goes right
+    after IHDR, where the PNG specification requires it before image data.
+    
+    Args:
+        png: Encoded PNG file without a pHYs chunk
+        dpi: Resolution in dots per inch
+        
+    Returns:
+        The PNG file with the resolution recorded
+    """
+    png = memoryview(png).cast('B')
+    pixels_per_metre = int(dpi / 0.0254 + 0.5)
+    data = struct.pack('>IIB', pixels_per_metre, pixels_per_metre, 1)
+    chunk = (
+        struct.pack('>I', len(data)) + b'pHYs' + data
+        + struct.pack('>I', zlib.crc32(b'pHYs' + data))
+    )
+    return b''.join((png[:_PNG_IHDR_END], chunk, png[_PNG_IHDR_END:]))
+
+
+@functools.lru_cache(maxsize=None)
+def _import_optional(name: str) -> Optional[ModuleType]:
+    """
+    Import an optional accelerator module.
+    
+    Args:
+        name: Module name to import
+        
+    Returns:
+        The module, or None if it (or a native library it wraps) is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except (ImportError, OSError):
+        return None
+
+
+class _RasterBuffer(io.BytesIO):
+    """Sink for savefig(format='raw') that keeps views of the written buffers instead of copying them."""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.views: List[memoryview] = []
+    
+    def write(self, data) -> int:
+        view = memoryview(data)
+        self.views.append(view)
+        return view.nbytes
+
+
 class ExportFormat(Enum):
     """Supported export formats."""
     PNG = auto()
@@ -45,32 +151,27 @@ class ExportFormat(Enum):
         Raises:
             ExportError: If the file extension is not recognized
         """
-        if isinstance(path, str):
-            path = Path(path)
-            
-        ext = path.suffix.lower()
+        ext = os.path.splitext(path)[1].lower()
         
-        if ext == '.png':
-            return cls.PNG
-        elif ext == '.svg':
-            return cls.SVG
-        elif ext == '.pdf':
-            return cls.PDF
-        else:
-            valid_exts = '.png, .svg, .pdf'
-            raise ExportError(f"Unsupported file extension: {ext}. Must be one of: {valid_exts}")
+        try:
+            return _EXT_MAP[ext]
+        except KeyError:
+            valid_exts = ', '.join(_EXT_MAP)
+            raise ExportError(f"Unsupported file extension: {ext}. Must be one of: {valid_exts}") from None
     
     @property
     def extension(self) -> str:
         """Get the file extension for this format."""
-        if self == ExportFormat.PNG:
-            return '.png'
-        elif self == ExportFormat.SVG:
-            return '.svg'
-        elif self == ExportFormat.PDF:
-            return '.pdf'
-        else:
-            return ''  # Should never happen
+        return _FMT_EXT[self]
+
+
+# Lookup tables between file extensions and export formats
+_EXT_MAP: Dict[str, ExportFormat] = {
+    '.png': ExportFormat.PNG,
+    '.svg': ExportFormat.SVG,
+    '.pdf': ExportFormat.PDF,
+}
+_FMT_EXT: Dict[ExportFormat, str] = {fmt: ext for ext, fmt in _EXT_MAP.items()}
 
 
 class PageSize:
@@ -89,25 +190,37 @@ class PageSize:
     }
     
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def get_size(cls, name: str) -> Tuple[float, float]:
-        """Get page dimensions for a named size."""
-        name = name.lower()
-        if name not in cls.SIZES:
+        """Get page dimensions for a named size (memoized per spelling)."""
+        name = name.casefold()
+        size = cls.SIZES.get(name)
+        if size is None:
             valid_sizes = ', '.join(cls.SIZES.keys())
             raise ValueError(f"Unknown page size: {name}. Valid sizes: {valid_sizes}")
-        return cls.SIZES[name]
+        return size
 
 
 class Exporter:
     """
     Handles exporting matplotlib figures to various file formats.
+    
+    Figures are saved as laid out by default. Passing bbox_inches='tight'
+    crops to the drawn content but costs an extra layout pass per export, so
+    callers should prefer laying the figure out once (e.g. with
+    figure.tight_layout()) before exporting.
     """
     
     def __init__(self):
         """Initialize the exporter."""
         pass
     
-    def _validate_output_directory(self, output_path: Union[str, Path]) -> None:
+    @staticmethod
+    def _coerce_path(path: Union[str, Path]) -> Path:
+        """Convert a caller-supplied path to a Path, passing Path objects through untouched."""
+        return path if isinstance(path, Path) else Path(path)
+    
+    def _validate_output_directory(self, output_path: Path) -> None:
         """
         Validate that the output directory exists and is writable.
         
@@ -117,22 +230,18 @@ class Exporter:
         Raises:
             ExportError: If the directory doesn't exist or isn't writable
         """
-        # Convert to Path object if string
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-            
-        # Get the directory
-        output_dir = output_path.parent
+        # Get the directory (string ops avoid building intermediate Path objects)
+        output_dir = os.path.dirname(output_path) or os.curdir
         
         # Check if directory exists
-        if not output_dir.exists():
+        if not os.path.exists(output_dir):
             raise ExportError(f"Output directory does not exist: {output_dir}")
             
         # Check if directory is writable
         if not os.access(output_dir, os.W_OK):
             raise ExportError(f"Output directory is not writable: {output_dir}")
     
-    def _validate_file_extension(self, output_path: Union[str, Path], expected_format: ExportFormat) -> None:
+    def _validate_file_extension(self, output_path: Path, expected_format: ExportFormat) -> None:
         """
         Validate that the file has the expected extension.
         
@@ -143,17 +252,14 @@ class Exporter:
         Raises:
             ExportError: If the file doesn't have the expected extension
         """
-        # Convert to Path object if string
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-            
         # Check extension
-        if output_path.suffix.lower() != expected_format.extension:
+        ext = os.path.splitext(output_path)[1]
+        if ext.lower() != expected_format.extension:
             raise ExportError(
-                f"Output file must have {expected_format.extension} extension, got: {output_path.suffix}"
+                f"Output file must have {expected_format.extension} extension, got: {ext}"
             )
     
-    def _verify_output_file(self, output_path: Union[str, Path]) -> None:
+    def _verify_output_file(self, output_path: Path) -> None:
         """
         Verify that the output file was created and has a non-zero size.
         
@@ -163,18 +269,223 @@ class Exporter:
         Raises:
             ExportError: If the file wasn't created or has zero size
         """
-        # Convert to Path object if string
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-            
-        # Check if file exists
-        if not output_path.exists():
+        # A single stat() answers both whether the file exists and its size
+        try:
+            size = os.stat(output_path).st_size
+        except FileNotFoundError:
             raise ExportError(f"Output file was not created: {output_path}")
             
         # Check if file has content
-        if output_path.stat().st_size == 0:
+        if size == 0:
             raise ExportError(f"Output file is empty: {output_path}")
     
+    def _render_rgba(
+        self,
+        figure: matplotlib.figure.Figure,
+        dpi: int,
+        bbox_inches: BboxSpec = None
+    ) -> Optional[np.ndarray]:
+        """
+        Rasterize a figure exactly as PNG export would, without encoding it.
+        
+        Args:
+            figure: The matplotlib figure to render
+            dpi: Resolution in dots per inch
+            bbox_inches: Region of the figure to render
+            
+        Returns:
+            Array of shape (height, width, 4) with uint8 RGBA pixels, or None
+            if the backend did not hand over its raster in one piece. The
+            array shares memory with the Agg renderer, so it is only valid
+            until the figure is drawn again.
+        """
+        buffer = _RasterBuffer()
+        figure.savefig(
+            buffer,
+            dpi=dpi,
+            bbox_inches=bbox_inches,
+            pad_inches=0,
+            transparent=True,
+            format='raw'
+        )
+        # The Agg backend writes its whole RGBA buffer in a single call
+        if len(buffer.views) != 1 or buffer.views[0].ndim != 3:
+            return None
+        return np.asarray(buffer.views[0], dtype=np.uint8)
+    
+    def _encode_rgba_png(
+        self,
+        rgba: np.ndarray,
+        dpi: int,
+        compress_level: int,
+        owned: bool = False
+    ) -> Buffer:
+        """
+        Encode rendered pixels as PNG in memory, preferring libvips, then OpenCV, when installed.
+        
+        libvips runs Deflate across multiple threads, which pays off most at
+        high compression levels. Pillow is the fallback. Every encoder
+        releases the GIL while compressing, and none of them touch the
+        figure, so this is safe to run on a worker thread.
+        
+        Args:
+            rgba: Array of shape (height, width, 4) with uint8 RGBA pixels
+            dpi: Resolution in dots per inch, recorded in the file
+            compress_level: zlib compression level (0-9)
+            owned: Whether rgba is a private copy that may be overwritten;
+                otherwise it may be the figure's live render buffer
+            
+        Returns:
+            Buffer holding the complete PNG file
+            
+        Raises:
+            ExportError: If the accelerated encoder fails
+        """
+        height, width, bands = rgba.shape
+        
+        pyvips = _import_optional('pyvips')
+        if pyvips is not None:
+            image = pyvips.Image.new_from_memory(rgba.data, width, height, bands, 'uchar')
+            # libvips keeps resolution in pixels per millimetre and writes it as pHYs
+            image = image.copy(xres=dpi / 25.4, yres=dpi / 25.4)
+            return image.pngsave_buffer(compression=compress_level)
+        
+        cv2 = _import_optional('cv2')
+        if cv2 is not None:
+            # Swap channels in place only in a private copy; the figure's
+            # render buffer must stay RGBA
+            bgra = cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGRA, dst=rgba if owned else None)
+            ok, encoded = cv2.imencode('.png', bgra, [cv2.IMWRITE_PNG_COMPRESSION, compress_level])
+            if not ok:
+                raise ExportError("Failed to encode PNG")
+            # OpenCV writes no resolution metadata
+            return _add_png_dpi(encoded, dpi)
+        
+        from PIL import Image
+        
+        image = Image.frombuffer('RGBA', (width, height), rgba, 'raw', 'RGBA', 0, 1)
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG', compress_level=compress_level, dpi=(dpi, dpi))
+        return buffer.getbuffer()
+    
+    def _start_png(
+        self,
+        figure: matplotlib.figure.Figure,
+        output_path: Path,
+        dpi: Optional[float],
+        compress_level: int,
+        bbox_inches: BboxSpec = None,
+        copy: bool = False,
+        *,
+        _skip_validation: bool = False
+    ) -> Callable[[], Buffer]:
+        """
+        Validate a PNG export and render the figure, deferring the encode.
+        
+        Rendering touches the figure and must run on the caller's thread; the
+        returned function only reads the rendered pixels.
+        
+        Args:
+            figure: The matplotlib figure to export
+            output_path: Path to the output PNG file
+            dpi: Resolution in dots per inch, or None for savefig's default
+            compress_level: zlib compression level (0-9)
+            bbox_inches: Region of the figure to save
+            copy: Copy the pixels so they stay valid if the figure is drawn again
+            _skip_validation: Set by export_multiple, which validates the
+                shared output directory once for the whole batch
+            
+        Returns:
+            Function returning the encoded PNG file
+            
+        Raises:
+            ExportError: If validation or rendering fails
+        """
+        # Validate output path
+        if not _skip_validation:
+            self._validate_output_directory(output_path)
+            self._validate_file_extension(output_path, ExportFormat.PNG)
+        
+        # The encoders record the resolution, so resolve savefig's default
+        # (the savefig.dpi rcParam, or the figure's own) up front
+        if dpi is None:
+            dpi = matplotlib.rcParams['savefig.dpi']
+            if dpi == 'figure':
+                dpi = figure.dpi
+        
+        try:
+            rgba = self._render_rgba(figure, dpi, bbox_inches)
+            if rgba is None:
+                # The backend did not hand over its raster; let matplotlib encode it
+                buffer = io.BytesIO()
+                figure.savefig(
+                    buffer,
+                    dpi=dpi,
+                    bbox_inches=bbox_inches,
+                    pad_inches=0,
+                    transparent=True,
+                    format='png',
+                    pil_kwargs={'compress_level': compress_level}
+                )
+                return buffer.getbuffer
+            
+            if copy:
+                rgba = rgba.copy()
+            return functools.partial(self._encode_rgba_png, rgba, dpi, compress_level, owned=copy)
+            
+        except Exception as e:
+            if isinstance(e, ExportError):
+                raise
+            raise ExportError(f"Failed to export PNG: {str(e)}") from e
+    
+    def _write_png(self, output_path: Path, encode: Callable[[], Buffer]) -> None:
+        """
+        Encode a rendered PNG and move it into place atomically.
+        
+        Args:
+            output_path: Path to the output PNG file
+            encode: Function returning the encoded PNG file, from _start_png()
+            
+        Raises:
+            ExportError: If encoding or writing fails
+        """
+        # Use a temporary file to avoid partial writes on error
+        temp_file = None
+        try:
+            # Encode in memory so the file is written in one call rather than
+            # flushed one chunk at a time by the encoder
+            data = encode()
+            
+            # Write it to a temporary file in the same directory
+            fd, temp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.png')
+            temp_file = Path(temp_path)
+            with open(fd, 'wb') as f:
+                f.write(data)
+            
+            # Verify the temporary file
+            self._verify_output_file(temp_file)
+            
+            # Atomically move the temporary file over the destination
+            os.replace(temp_file, output_path)
+            temp_file = None  # Don't delete in finally block
+            
+        except Exception as e:
+            # Handle encoder or file system errors
+            if isinstance(e, ExportError):
+                # Re-raise our custom errors
+                raise
+            else:
+                # Wrap other errors
+                raise ExportError(f"Failed to export PNG: {str(e)}") from e
+                
+        finally:
+            # Clean up temporary file if it exists
+            if temp_file is not None and temp_file.exists():
+                try:
+                    temp_file.unlink()
+                except Exception:
+                    pass  # Ignore errors in cleanup
+    
     def get_format(self, output_path: Union[str, Path]) -> ExportFormat:
         """
         Determine the export format from the output path.
@@ -192,7 +503,9 @@ class Exporter:
         figure: matplotlib.figure.Figure,
         output_path: Union[str, Path],
         dpi: int = 300,
-        page_size: str = 'letter'
+        page_size: str = 'letter',
+        compress_level: int = 1,
+        bbox_inches: BboxSpec = None
     ) -> None:
         """
         Export a matplotlib figure to the appropriate format based on file extension.
@@ -202,20 +515,26 @@ class Exporter:
             output_path: Path to the output file
             dpi: Resolution in dots per inch (for raster formats)
             page_size: Page size for PDF export
+            compress_level: zlib compression level for PNG and PDF export (0-9)
+            bbox_inches: Region of the figure to save: None for the whole figure, or 'tight'
+                to crop to the drawn content (costs an extra layout pass)
             
         Raises:
             ExportError: If export fails for any reason
         """
+        # Convert once; the format-specific exporters pass Path objects through
+        output_path = self._coerce_path(output_path)
+        
         # Determine format from file extension
         export_format = self.get_format(output_path)
         
         # Call the appropriate export method
         if export_format == ExportFormat.PNG:
-            self.export_png(figure, output_path, dpi)
+            self.export_png(figure, output_path, dpi, compress_level, bbox_inches)
         elif export_format == ExportFormat.SVG:
-            self.export_svg(figure, output_path)
+            self.export_svg(figure, output_path, bbox_inches)
         elif export_format == ExportFormat.PDF:
-            self.export_pdf(figure, output_path, page_size)
+            self.export_pdf(figure, output_path, page_size, compress_level, bbox_inches)
         else:
             # This should never happen due to the check in get_format
             raise ExportError(f"Unsupported export format: {export_format}")
@@ -224,125 +543,94 @@ class Exporter:
         self, 
         figure: matplotlib.figure.Figure, 
         output_path: Union[str, Path], 
-        dpi: int = 300
+        dpi: int = 300,
+        compress_level: int = 1,
+        bbox_inches: BboxSpec = None
     ) -> None:
         """
         Export a matplotlib figure to a PNG file.
         
+        Fast, light compression is used by default; pass compress_level=9
+        for the smallest files at a much higher encoding cost.
+        
         Args:
             figure: The matplotlib figure to export
             output_path: Path to the output PNG file
             dpi: Resolution in dots per inch
+            compress_level: zlib compression level (0-9)
+            bbox_inches: Region of the figure to save: None for the whole figure, or 'tight'
+                to crop to the drawn content (costs an extra layout pass)
             
         Raises:
             ExportError: If export fails for any reason
         """
-        # Convert to Path object if string
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-            
-        # Validate output path
-        self._validate_output_directory(output_path)
-        self._validate_file_extension(output_path, ExportFormat.PNG)
-        
-        # Use a temporary file to avoid partial writes on error
-        temp_file = None
-        try:
-            # Create a temporary file in the same directory
-            fd, temp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.png')
-            os.close(fd)  # Close the file descriptor
-            temp_file = Path(temp_path)
-            
-            # Save figure to temporary file
-            figure.savefig(
-                temp_file,
-                dpi=dpi,
-                bbox_inches='tight',
-                pad_inches=0,
-                transparent=True,
-                format='png'
-            )
-            
-            # Verify the temporary file
-            self._verify_output_file(temp_file)
-            
-            # Move the temporary file to the destination
-            if output_path.exists():
-                output_path.unlink()  # Remove existing file
-            temp_file.rename(output_path)
-            temp_file = None  # Don't delete in finally block
-            
-            # Final verification
-            self._verify_output_file(output_path)
-            
-        except Exception as e:
-            # Handle matplotlib or file system errors
-            if isinstance(e, ExportError):
-                # Re-raise our custom errors
-                raise
-            else:
-                # Wrap other errors
-                raise ExportError(f"Failed to export PNG: {str(e)}") from e
-                
-        finally:
-            # Clean up temporary file if it exists
-            if temp_file is not None and temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except Exception:
-                    pass  # Ignore errors in cleanup
+        output_path = self._coerce_path(output_path)
+        encode = self._start_png(figure, output_path, dpi, compress_level, bbox_inches)
+        self._write_png(output_path, encode)
     
     def export_svg(
         self,
         figure: matplotlib.figure.Figure,
-        output_path: Union[str, Path]
+        output_path: Union[str, Path],
+        bbox_inches: BboxSpec = None,
+        precision: Optional[int] = SVG_PRECISION,
+        *,
+        _skip_validation: bool = False
     ) -> None:
         """
         Export a matplotlib figure to an SVG file.
         
+        Text is written as <text> elements and path coordinates are rounded,
+        which keeps files for long routes several times smaller.
+        
         Args:
             figure: The matplotlib figure to export
             output_path: Path to the output SVG file
+            bbox_inches: Region of the figure to save: None for the whole figure, or 'tight'
+                to crop to the drawn content (costs an extra layout pass)
+            precision: Decimal places kept in path coordinates, or None to keep
+                matplotlib's output unchanged
+            _skip_validation: Internal; set by export_multiple, which validates
+                the shared output directory once for the whole batch
             
         Raises:
             ExportError: If export fails for any reason
         """
-        # Convert to Path object if string
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-            
+        output_path = self._coerce_path(output_path)
+        
         # Validate output path
-        self._validate_output_directory(output_path)
-        self._validate_file_extension(output_path, ExportFormat.SVG)
+        if not _skip_validation:
+            self._validate_output_directory(output_path)
+            self._validate_file_extension(output_path, ExportFormat.SVG)
         
         # Use a temporary file to avoid partial writes on error
         temp_file = None
         try:
-            # Create a temporary file in the same directory
-            fd, temp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.svg')
-            os.close(fd)  # Close the file descriptor
-            temp_file = Path(temp_path)
+            buffer = io.BytesIO()
+            with matplotlib.rc_context(_SVG_RC):
+                figure.savefig(
+                    buffer,
+                    bbox_inches=bbox_inches,
+                    pad_inches=0,
+                    format='svg'
+                )
+            svg = buffer.getvalue()
+            if precision is not None:
+                svg = _compact_svg_paths(svg, precision)
             
-            # Save figure to temporary file
-            figure.savefig(
-                temp_file,
-                bbox_inches='tight',
-                pad_inches=0,
-                format='svg'
-            )
+            # Write into a temporary file in the same directory, keeping the
+            # handle open rather than reopening it by name
+            with tempfile.NamedTemporaryFile(dir=output_path.parent, suffix='.svg', delete=False) as f:
+                temp_file = Path(f.name)
+                f.write(svg)
             
             # Verify the temporary file
             self._verify_output_file(temp_file)
             
-            # Move the temporary file to the destination
-            if output_path.exists():
-                output_path.unlink()  # Remove existing file
-            temp_file.rename(output_path)
+            # Atomically move the temporary file over the destination
+            os.replace(temp_file, output_path)
             temp_file = None  # Don't delete in finally block
             
-            # Final verification
-            self._verify_output_file(output_path)
-            
         except Exception as e:
             # Handle matplotlib or file system errors
             if isinstance(e, ExportError):
@@ -364,7 +652,12 @@ class Exporter:
         self,
         figure: matplotlib.figure.Figure,
         output_path: Union[str, Path],
-        page_size: str = 'letter'
+        page_size: str = 'letter',
+        compress_level: int = 1,
+        bbox_inches: BboxSpec = None,
+        pdf_dpi: int = 150,
+        *,
+        _skip_validation: bool = False
     ) -> None:
         """
         Export a matplotlib figure to a PDF file.
@@ -373,61 +666,67 @@ class Exporter:
             figure: The matplotlib figure to export
             output_path: Path to the output PDF file
             page_size: Name of the page size ('letter', 'a4', 'square-medium', etc.)
+            compress_level: zlib compression level for the PDF streams (0-9)
+            bbox_inches: Region of the figure to save: None for the whole figure, or 'tight'
+                to crop to the drawn content (costs an extra layout pass)
+            pdf_dpi: Resolution for any rasterized artists embedded in the page;
+                vector content is unaffected
+            _skip_validation: Internal; set by export_multiple, which validates
+                the shared output directory once for the whole batch
             
         Raises:
             ExportError: If export fails for any reason
         """
-        # Convert to Path object if string
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-            
+        output_path = self._coerce_path(output_path)
+        
         # Validate output path
-        self._validate_output_directory(output_path)
-        self._validate_file_extension(output_path, ExportFormat.PDF)
+        if not _skip_validation:
+            self._validate_output_directory(output_path)
+            self._validate_file_extension(output_path, ExportFormat.PDF)
         
         # Use a temporary file to avoid partial writes on error
         temp_file = None
         try:
-            # Create a temporary file in the same directory
-            fd, temp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.pdf')
-            os.close(fd)  # Close the file descriptor
-            temp_file = Path(temp_path)
-            
             # Get page dimensions
             try:
                 width, height = PageSize.get_size(page_size)
             except ValueError as e:
                 raise ExportError(str(e))
             
-            # Create a copy of the figure with the right dimensions
-            # Note: we don't modify the original figure
+            # Temporarily adjust figure size to match the requested page size;
+            # the original size is restored even if saving fails
             orig_size = figure.get_size_inches()
+            figure.set_size_inches(width, height)
             
-            # Use PdfPages for PDF export
-            with PdfPages(temp_file) as pdf:
-                # Temporarily adjust figure size to match the requested page size
-                figure.set_size_inches(width, height)
-                # Save the figure directly to PDF with tight bbox
-                pdf.savefig(
-                    figure,
-                    bbox_inches='tight',
-                    pad_inches=0.1
-                )
-                # Restore original size
+            # Save a single vector page with matplotlib's PDF backend, using fast
+            # Deflate for the content streams. The document is built in memory
+            # so it can be written in one call
+            buffer = io.BytesIO()
+            try:
+                with matplotlib.rc_context({'pdf.compression': compress_level}):
+                    figure.savefig(
+                        buffer,
+                        format='pdf',
+                        dpi=pdf_dpi,
+                        bbox_inches=bbox_inches,
+                        pad_inches=0.1
+                    )
+            finally:
                 figure.set_size_inches(orig_size)
             
+            # Write the finished document to a temporary file in the same directory
+            fd, temp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.pdf')
+            temp_file = Path(temp_path)
+            with open(fd, 'wb') as f:
+                f.write(buffer.getbuffer())
+            
             # Verify the temporary file
             self._verify_output_file(temp_file)
             
-            # Move the temporary file to the destination
-            if output_path.exists():
-                output_path.unlink()  # Remove existing file
-            temp_file.rename(output_path)
+            # Atomically move the temporary file over the destination
+            os.replace(temp_file, output_path)
             temp_file = None  # Don't delete in finally block
             
-            # Final verification
-            self._verify_output_file(output_path)
-            
         except Exception as e:
             # Handle matplotlib or file system errors
             if isinstance(e, ExportError):
@@ -451,7 +750,9 @@ class Exporter:
         base_path: Union[str, Path],
         formats: list[str],
         dpi: int = 300,
-        page_size: str = 'letter'
+        page_size: str = 'letter',
+        compress_level: int = 1,
+        bbox_inches: BboxSpec = None
     ) -> list[Path]:
         """
         Export a figure to multiple formats.
@@ -462,6 +763,9 @@ class Exporter:
             formats: List of format names ('png', 'svg', 'pdf')
             dpi: Resolution for raster formats
             page_size: Page size for PDF format
+            compress_level: zlib compression level for PNG and PDF export (0-9)
+            bbox_inches: Region of the figure to save: None for the whole figure, or 'tight'
+                to crop to the drawn content (costs an extra layout pass)
             
         Returns:
             List of paths to exported files
@@ -469,13 +773,14 @@ class Exporter:
         Raises:
             ExportError: If any export fails
         """
-        base_path = Path(base_path) if isinstance(base_path, str) else base_path
+        base_path = self._coerce_path(base_path)
         stem = base_path.stem
         parent = base_path.parent
         
-        # Standardize and validate formats
+        # Standardize and validate formats; a repeated format (e.g. "png,PNG")
+        # would draw the figure again only to overwrite the same file
         valid_formats = {'png', 'svg', 'pdf'}
-        formats = [fmt.lower().strip() for fmt in formats]
+        formats = list(dict.fromkeys(fmt.lower().strip() for fmt in formats))
         invalid_formats = set(formats) - valid_formats
         if invalid_formats:
             raise ExportError(
@@ -483,19 +788,44 @@ class Exporter:
                 f"Supported formats: {', '.join(valid_formats)}"
             )
         
-        # Export each format
+        # Every file goes into the same directory with an extension we chose,
+        # so validate the directory once rather than once per format
+        self._validate_output_directory(parent / stem)
+        
+        # When cropping, PNG and SVG share the same tight bounding box;
+        # measure it once instead of once per format
+        shared_bbox = bbox_inches
+        if bbox_inches == 'tight' and 'png' in formats and 'svg' in formats:
+            figure.draw_without_rendering()
+            shared_bbox = figure.get_tightbbox()
+        
+        # Export each format. Drawing stays on this thread because matplotlib
+        # figures are not thread-safe, but PNG encoding only reads the rendered
+        # pixels, so it runs on a worker while the other formats are drawn
         output_paths = []
-        for fmt in formats:
-            output_path = parent / f"{stem}.{fmt}"
-            
-            if fmt == 'png':
-                self.export_png(figure, output_path, dpi)
-            elif fmt == 'svg':
-                self.export_svg(figure, output_path)
-            elif fmt == 'pdf':
-                self.export_pdf(figure, output_path, page_size)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = []
+            for fmt in formats:
+                output_path = parent / f"{stem}.{fmt}"
                 
-            output_paths.append(output_path)
+                if fmt == 'png':
+                    encode = self._start_png(
+                        figure, output_path, dpi, compress_level, shared_bbox,
+                        copy=True, _skip_validation=True
+                    )
+                    pending.append(pool.submit(self._write_png, output_path, encode))
+                elif fmt == 'svg':
+                    self.export_svg(figure, output_path, shared_bbox, _skip_validation=True)
+                elif fmt == 'pdf':
+                    self.export_pdf(
+                        figure, output_path, page_size, compress_level, bbox_inches, _skip_validation=True
+                    )
+                    
+                output_paths.append(output_path)
+            
+            # Surface any encoding errors from the worker
+            for future in pending:
+                future.result()
             
         return output_paths
 
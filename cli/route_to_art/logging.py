@@ -7,24 +7,196 @@ for file-based and console logging with proper error handling.
 
 import os
 import sys
+import json
+import queue
 import logging
-import traceback
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional, Dict, Any, Iterator, Tuple
 
 # Constants for default log configuration
 DEFAULT_LOG_DIR = os.path.expanduser("~/.route-to-art/logs")
 DEFAULT_LOG_FILE = "route-to-art.log"
 DEFAULT_MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
 DEFAULT_BACKUP_COUNT = 3  # Keep 3 rotated log files
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_BUFFER_CAPACITY = 512  # Records held in memory before writing to the log file
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(module_ctx)s%(message)s"
 ERROR_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s\n%(traceback)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# Global logger instance
+
+class _ModuleFormatter(logging.Formatter):
+    """
+    Formatter for LOG_FORMAT that gives records without a module context an
+    empty one.
+    
+    Records logged with a module name carry a "[module] " module_ctx prefix;
+    everything else still formats without needing a handler filter.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "module_ctx"):
+            record.module_ctx = ""
+        return super().format(record)
+
+
+# Formatter for regular logs, shared by every handler and reconfiguration
+_REGULAR_FORMATTER = _ModuleFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+# Shared encoder for data attached to log messages; json.dumps() with
+# arguments would build a new encoder on every call
+_JSON_ENCODER = json.JSONEncoder(default=str, indent=2)
+
+# Global logger instance and the setup_logging() arguments it was built with
 _logger = None
+_setup_key = None
+
+
+class _LazyJson:
+    """Log argument that serializes its object only when formatted."""
+    
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        try:
+            return _JSON_ENCODER.encode(self.obj)
+        except (TypeError, ValueError):
+            return str(self.obj)
+
+
+def _module_extra(module: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Build the record attributes carrying a module name for LOG_FORMAT.
+    
+    Args:
+        module: Module name for context
+        
+    Returns:
+        The extra mapping for a logging call, or None without a module
+    """
+    if not module:
+        return None
+    return {"module_ctx": f"[{module}] "}
+
+
+class SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that tracks the log size in memory.
+    
+    The stdlib handler seeks the stream to find the file size before every
+    record and writes through a text wrapper that flushes each line. This
+    handler reads the size once when the file is opened, then encodes each
+    record once into a buffered binary stream and counts the bytes, so
+    deciding whether to roll over costs no I/O. The buffer is flushed for
+    errors, on flush() and on close.
+    """
+    
+    BUFFER_SIZE = 64 * 1024
+    
+    _bytes_written = 0
+    
+    def _open(self):
+        stream = open(self.baseFilename, 'ab', buffering=self.BUFFER_SIZE)
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        msg = self.format(record) + self.terminator
+        return msg.encode(self.encoding or 'utf-8', self.errors or 'strict')
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:  # delay was set
+            self.stream = self._open()
+        return self._bytes_written + len(self._encode(record)) >= self.maxBytes
+    
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = self._encode(record)
+            if self.stream is None:  # delay was set
+                self.stream = self._open()
+            if 0 < self.maxBytes <= self._bytes_written + len(data):
+                self.doRollover()
+            self.stream.write(data)
+            self._bytes_written += len(data)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BackgroundHandler(QueueHandler):
+    """
+    Queue handler that passes records to a target handler on a worker thread.
+    
+    Disk writes and rotation then never block the logging thread, and
+    neither does formatting: records are queued unformatted, so message
+    arguments and tracebacks are only rendered on the worker thread, and
+    only for records a handler emits. Closing the handler waits for queued
+    records to be handled and closes the target chain.
+    """
+    
+    def __init__(self, target: logging.Handler):
+        # QueueListener marks each record done on a queue.Queue, which lets
+        # flush() wait on join()
+        super().__init__(queue.Queue())
+        self.target = target
+        self.listener = QueueListener(self.queue, target, respect_handler_level=True)
+        self.listener.start()
+        self._running = True
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Queue the record as it is.
+        
+        QueueHandler.prepare() formats the message and traceback up front so
+        records can cross process boundaries; this queue stays in-process.
+        """
+        return record
+    
+    def flush(self) -> None:
+        """Wait until every queued record has been passed to the target."""
+        self.queue.join()
+    
+    def close(self) -> None:
+        if self._running:
+            self._running = False
+            self.listener.stop()
+        # MemoryHandler.close() drops its target, so walk the chain first
+        handler = self.target
+        while handler is not None:
+            next_handler = getattr(handler, 'target', None)
+            handler.close()
+            handler = next_handler
+        super().close()
+
+
+def _drain_to_file_handler(handler: logging.Handler) -> Optional[RotatingFileHandler]:
+    """
+    Flush queued and buffered records through to the log file.
+    
+    Args:
+        handler: Handler attached to the logger
+        
+    Returns:
+        The rotating file handler behind it, or None if there is none
+    """
+    while isinstance(handler, (BackgroundHandler, MemoryHandler)):
+        handler.flush()
+        handler = handler.target
+    if not isinstance(handler, RotatingFileHandler):
+        return None
+    handler.flush()
+    return handler
 
 
 def get_logger() -> logging.Logger:
@@ -37,10 +209,12 @@ def get_logger() -> logging.Logger:
     Returns:
         The configured logger instance
     """
-    global _logger
-    if _logger is None:
-        _logger = setup_logging()
-    return _logger
+    # setup_logging() stores the logger globally, so only the first call
+    # pays for the branch body; later calls are a single global read
+    logger = _logger
+    if logger is None:
+        logger = setup_logging()
+    return logger
 
 
 def setup_logging(
@@ -72,25 +246,45 @@ def setup_logging(
     Raises:
         OSError: If log directory cannot be created or accessed
     """
-    global _logger
+    global _logger, _setup_key
+    
+    # Reconfiguring reopens the log file, so keep an identical configuration
+    setup_key = (log_dir, log_file, log_level, console_level, max_size, backup_count, console, file)
+    if _logger is not None and _logger.handlers and setup_key == _setup_key:
+        return _logger
+    _setup_key = None
+    
+    # LOG_FORMAT never shows process, thread or task details, so skip
+    # collecting them for every record
+    logging.logProcesses = False
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # Python 3.12+
     
     # Create logger
     logger = logging.getLogger("route-to-art")
-    logger.setLevel(min(log_level, console_level) if console else log_level)
+    
+    # The handlers do the filtering; the logger level is the lowest handler
+    # level so isEnabledFor() tells callers whether any handler wants a record
+    handler_levels = []
+    if console:
+        handler_levels.append(console_level)
+    if file:
+        handler_levels.append(log_level)
+    logger.setLevel(min(handler_levels, default=logging.WARNING))
     
     # Clear existing handlers (in case of reconfiguration)
     if logger.handlers:
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
-    
-    # Formatter for regular logs
-    regular_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+            # Flushes any records still buffered for the log file
+            handler.close()
     
     # Add console handler if requested
     if console:
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(console_level)
-        console_handler.setFormatter(regular_formatter)
+        console_handler.setFormatter(_REGULAR_FORMATTER)
         logger.addHandler(console_handler)
     
     # Add file handler if requested
@@ -104,15 +298,30 @@ def setup_logging(
             os.makedirs(log_dir, exist_ok=True)
             
             # Create rotating file handler
-            file_handler = RotatingFileHandler(
+            file_handler = SizeTrackingRotatingFileHandler(
                 log_path,
                 maxBytes=max_size,
                 backupCount=backup_count,
                 encoding='utf-8'
             )
             file_handler.setLevel(log_level)
-            file_handler.setFormatter(regular_formatter)
-            logger.addHandler(file_handler)
+            file_handler.setFormatter(_REGULAR_FORMATTER)
+            
+            # Buffer records and write them in batches; errors are written
+            # straight away
+            buffered_handler = MemoryHandler(
+                capacity=LOG_BUFFER_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
+            )
+            
+            # Do the file I/O on a worker thread. Console output stays
+            # synchronous; logging.shutdown() closes this handler at exit,
+            # which drains the queue and the buffer
+            background_handler = BackgroundHandler(buffered_handler)
+            background_handler.setLevel(log_level)
+            logger.addHandler(background_handler)
             
             # Log the start of a new session
             logger.info("--- New logging session started ---")
@@ -123,31 +332,65 @@ def setup_logging(
             # Raise an exception only if console logging is not enabled
             if not console:
                 raise
+            logger.setLevel(console_level)
+            # Try file logging again on the next call
+            setup_key = None
     
     # Store the logger globally
     _logger = logger
+    _setup_key = setup_key
     return logger
 
 
-def get_log_files() -> Dict[str, str]:
+def get_module_logger(module: str) -> logging.LoggerAdapter:
     """
-    Get all log files in the log directory.
+    Get a logger that prefixes every message with a module name.
     
+    The prefix is built once and applied by the formatter, the same way the
+    log_* helpers apply their module argument.
+    
+    Args:
+        module: Module name for context
+        
     Returns:
-        Dictionary mapping log file names to absolute paths
+        Logger adapter writing to the configured logger
+    """
+    return logging.LoggerAdapter(get_logger(), _module_extra(module))
+
+
+def iter_log_files() -> Iterator[Tuple[str, str]]:
     """
-    log_dir = DEFAULT_LOG_DIR
-    log_files = {}
+    Iterate over the log files in the log directory.
+    
+    Includes rotated backups such as route-to-art.log.1.
     
+    Yields:
+        (file name, absolute path) pairs
+    """
     try:
-        if os.path.exists(log_dir):
-            for file in os.listdir(log_dir):
-                if file.endswith('.log'):
-                    log_files[file] = os.path.join(log_dir, file)
+        entries = os.scandir(DEFAULT_LOG_DIR)
     except OSError:
-        pass
+        # Missing or unreadable log directory
+        return
+    
+    # DirEntry carries the name, path and file type from the directory
+    # listing itself, so no per-file join or stat is needed
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith('.log') or '.log.' in name:
+                if entry.is_file(follow_symlinks=False):
+                    yield name, entry.path
+
+
+def get_log_files() -> Dict[str, str]:
+    """
+    Get all log files in the log directory.
     
-    return log_files
+    Returns:
+        Dictionary mapping log file names to absolute paths
+    """
+    return dict(iter_log_files())
 
 
 def rotate_logs(max_size: int = DEFAULT_MAX_LOG_SIZE) -> None:
@@ -158,31 +401,56 @@ def rotate_logs(max_size: int = DEFAULT_MAX_LOG_SIZE) -> None:
         max_size: Maximum size in bytes before rotation
     """
     log_file = os.path.join(DEFAULT_LOG_DIR, DEFAULT_LOG_FILE)
-    if os.path.exists(log_file) and os.path.getsize(log_file) > max_size:
-        logger = get_logger()
-        
-        # Find and get the file handler
-        for handler in logger.handlers:
-            if isinstance(handler, RotatingFileHandler):
-                handler.doRollover()
-                logger.info("Log file manually rotated")
-                break
+    try:
+        size = os.path.getsize(log_file)
+    except OSError:
+        # No log file yet
+        return
+    if size <= max_size:
+        return
+    
+    logger = get_logger()
+    
+    # Find and get the file handler
+    for handler in logger.handlers:
+        if not isinstance(handler, RotatingFileHandler):
+            # Write out pending records before they move to the backup
+            handler = _drain_to_file_handler(handler)
+            if handler is None:
+                continue
+        handler.acquire()
+        try:
+            handler.doRollover()
+        finally:
+            handler.release()
+        logger.info("Log file manually rotated")
+        break
 
 
 def clear_logs() -> None:
     """
     Clear all log files.
     """
-    log_files = get_log_files()
+    logger = get_logger()
+    
+    # Write out pending records first so they are cleared with the rest
+    file_handlers = []
+    for handler in logger.handlers:
+        handler = _drain_to_file_handler(handler)
+        if isinstance(handler, SizeTrackingRotatingFileHandler):
+            file_handlers.append(handler)
     
-    for path in log_files.values():
+    for _, path in iter_log_files():
         try:
-            with open(path, 'w') as f:
-                pass
+            os.truncate(path, 0)
         except OSError:
             pass
     
-    logger = get_logger()
+    # The open handlers append, so they carry on at the start of the
+    # emptied file; only their size counters need resetting
+    for handler in file_handlers:
+        handler._bytes_written = 0
+    
     logger.info("Log files cleared")
 
 
@@ -205,19 +473,17 @@ def log_error(
     """
     logger = get_logger()
     
+    # Skip message and traceback formatting if the record would be dropped
+    if not logger.isEnabledFor(level):
+        return
+    
     # Build the log message
     log_message = message or str(error)
-    if module:
-        log_message = f"[{module}] {log_message}"
-    
-    # Include traceback if requested
-    if include_traceback:
-        tb_str = traceback.format_exc()
-        if "NoneType: None" not in tb_str:  # Avoid logging empty tracebacks
-            log_message += f"\n{tb_str}"
     
-    # Log at the specified level
-    logger.log(level, log_message)
+    # Log at the specified level; with exc_info the handlers format the
+    # active traceback only if they emit the record, and skip it if there
+    # is no exception being handled
+    logger.log(level, log_message, exc_info=include_traceback, extra=_module_extra(module))
 
 
 def log_exception(
@@ -250,14 +516,13 @@ def log_warning(
         error: Optional exception related to the warning
     """
     logger = get_logger()
-    
-    if module:
-        message = f"[{module}] {message}"
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     
     if error:
         message += f": {str(error)}"
     
-    logger.warning(message)
+    logger.warning(message, extra=_module_extra(module))
 
 
 def log_info(message: str, module: Optional[str] = None) -> None:
@@ -269,11 +534,10 @@ def log_info(message: str, module: Optional[str] = None) -> None:
         module: Module name for context
     """
     logger = get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    if module:
-        message = f"[{module}] {message}"
-    
-    logger.info(message)
+    logger.info(message, extra=_module_extra(module))
 
 
 def log_debug(message: str, module: Optional[str] = None, data: Any = None) -> None:
@@ -287,18 +551,18 @@ def log_debug(message: str, module: Optional[str] = None, data: Any = None) -> N
     """
     logger = get_logger()
     
-    if module:
-        message = f"[{module}] {message}"
+    # Serializing data is the expensive part; skip it when DEBUG is disabled
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     
     if data is not None:
         try:
-            import json
-            data_str = json.dumps(data, default=str, indent=2)
+            data_str = _JSON_ENCODER.encode(data)
             message += f"\nData: {data_str}"
         except (TypeError, ValueError):
             message += f"\nData: {str(data)}"
     
-    logger.debug(message)
+    logger.debug(message, extra=_module_extra(module))
 
 
 def get_log_path() -> Optional[str]:
@@ -326,26 +590,27 @@ def log_route_art_error(
         module: Module name for context
     """
     logger = get_logger()
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     
-    # Build the log message
-    log_message = str(error)
-    if module:
-        log_message = f"[{module}] {log_message}"
+    # Build the log message; the parts are passed as arguments so the
+    # message text is never treated as a format string
+    msg_format = "%s"
+    args = [str(error)]
     
-    # Add context information
-    if hasattr(error, 'context') and error.context:
-        try:
-            import json
-            context_str = json.dumps(error.context, default=str, indent=2)
-            log_message += f"\nContext: {context_str}"
-        except (TypeError, ValueError):
-            pass
+    # Add context information, serialized only when a handler formats it
+    context = getattr(error, 'context', None)
+    if context:
+        msg_format += "\nContext: %s"
+        args.append(_LazyJson(context))
     
     # Add traceback if available
-    if hasattr(error, 'traceback') and error.traceback:
-        log_message += f"\nTraceback:\n{error.traceback}"
+    tb = getattr(error, 'traceback', None)
+    if tb:
+        msg_format += "\nTraceback:\n%s"
+        args.append(tb)
     
-    logger.error(log_message)
+    logger.error(msg_format, *args, extra=_module_extra(module))
 
 
 def configure_for_cli(
@@ -1,11 +1,19 @@
 import click
+import csv
 import os
 import sys
 import functools
+import importlib
+import re
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import timedelta
-from importlib.metadata import version
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, TypeVar, cast
+from types import MappingProxyType
+from itertools import chain
+from typing import Dict, Iterator, List, Any, Mapping, Optional, Callable, Tuple, TypeVar, Union, cast
+
+import numpy as np
 
 # Import custom error handling and logging
 from route_to_art.config import Config
@@ -13,25 +21,61 @@ from route_to_art.exceptions import (
     RouteArtError, RouteParseError, ValidationError, 
     RenderingError, ExportError, ConfigError
 )
-from route_to_art.exporters import Exporter
 from route_to_art.logging import (
     configure_for_cli, log_info, log_debug, log_error, 
     log_exception, log_warning, log_route_art_error
 )
-from route_to_art.models import Route
-from route_to_art.parsers import RouteParser
-from route_to_art.visualizer import RouteVisualizer
+from route_to_art.models import Route, haversine_distance
+from route_to_art.parsers import RouteParser, iter_coordinates
 
 # Type variables for command handler decorator
 T = TypeVar('T')
 ClickContext = Any  # Type for Click context
 CommandCallback = Callable[..., T]  # Type for command callbacks
 
-# Define the package version - will be used in the CLI's version option
-try:
-    __version__ = version("route-to-art")
-except Exception:
-    __version__ = "0.1.0"  # Default fallback version
+# Package version for the CLI's version option. Read from a constant rather
+# than importlib.metadata, which scans sys.path on every invocation
+from route_to_art._version import __version__
+
+
+# Splits comma-separated option values, trimming whitespace around commas
+_CSV_SPLIT = re.compile(r'\s*,\s*').split
+
+
+# Rendering and export pull in matplotlib, which dominates start-up time,
+# so these are imported on first use; info, validate and init-config never
+# need them
+_LAZY_IMPORTS = {
+    "Exporter": "route_to_art.exporters",
+    "ExportFormat": "route_to_art.exporters",
+    "RouteVisualizer": "route_to_art.visualizer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a lazily loaded name on first attribute access.
+    
+    Args:
+        name: Attribute name
+        
+    Returns:
+        The imported object, which is then cached in the module namespace
+        
+    Raises:
+        AttributeError: If the name is not a lazy import
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Look up a lazily imported name, honouring anything already bound."""
+    return getattr(sys.modules[__name__], name)
 
 
 # Load and store configuration globally
@@ -41,6 +85,10 @@ def get_config(config_path=None):
     """
     Get or initialize the configuration.
     
+    Asking again for the file that is already loaded, as the convert
+    command does after the cli group, reuses the loaded Config without
+    another stat of the file.
+    
     Args:
         config_path: Optional path to a configuration file
         
@@ -48,75 +96,126 @@ def get_config(config_path=None):
         Config object
     """
     global _config
-    if _config is None or config_path:
-        _config = Config(config_path=config_path)
+    if _config is None or (
+        config_path and os.path.abspath(config_path) != _config.config_path
+    ):
+        _config = Config.get_shared(config_path)
     return _config
 
-def get_effective_options(config_path, option_dict):
+# Map config keys to CLI option names; export.width and export.height have
+# no CLI option
+_CONFIG_TO_CLI = MappingProxyType({
+    "thickness": "thickness",
+    "color": "color",
+    "style": "style",
+    "markers.enabled": "markers",
+    "markers.unit": "markers_unit",
+    "markers.interval": "marker_interval",
+    "markers.size": "marker_size",
+    "markers.color": "marker_color",
+    "markers.label_font_size": "label_font_size",
+    "overlay.enabled": "overlay",
+    "overlay.position": "overlay_position",
+    "overlay.font_size": "font_size",
+    "overlay.font_color": "font_color",
+    "overlay.background": "background",
+    "overlay.bg_color": "bg_color",
+    "overlay.bg_alpha": "bg_alpha",
+    "export.formats": "formats",
+    "export.dpi": "dpi",
+    "export.page_size": "page_size"
+})
+
+
+@dataclass(frozen=True)
+class ConvertOptions:
+    """Style and export options given to the convert command; None means unset."""
+    
+    color: Optional[str] = None
+    thickness: Optional[str] = None
+    style: Optional[str] = None
+    dpi: Optional[int] = None
+    formats: Optional[str] = None
+    page_size: Optional[str] = None
+    markers: Optional[bool] = None
+    markers_unit: Optional[str] = None
+    marker_interval: Optional[float] = None
+    marker_size: Optional[float] = None
+    marker_color: Optional[str] = None
+    label_font_size: Optional[int] = None
+    overlay: Optional[str] = None
+    overlay_position: Optional[str] = None
+    font_size: Optional[int] = None
+    font_color: Optional[str] = None
+    background: Optional[bool] = None
+    bg_color: Optional[str] = None
+    bg_alpha: Optional[float] = None
+
+
+# Default --simplify-tolerance in degrees, roughly a metre on the ground
+DEFAULT_SIMPLIFY_TOLERANCE = 1e-5
+
+# Field names of ConvertOptions, looked up once rather than per merge
+_CONVERT_OPTION_NAMES = tuple(f.name for f in fields(ConvertOptions))
+
+
+def get_effective_options(
+    config_path: Optional[str],
+    options: Union[ConvertOptions, Mapping[str, Any]]
+) -> Dict[str, Any]:
     """
     Merge configuration and CLI options, with CLI options taking precedence.
     
     Args:
         config_path: Path to config file or None
-        option_dict: Dictionary of CLI options
+        options: CLI options, as ConvertOptions or a mapping of its field names
         
     Returns:
         Dictionary with effective options (config merged with CLI overrides)
+        
+    Raises:
+        ConfigError: If a mapping contains a name that is not a convert option
     """
+    if not isinstance(options, ConvertOptions):
+        unknown = options.keys() - set(_CONVERT_OPTION_NAMES)
+        if unknown:
+            raise ConfigError(
+                f"Unknown convert options: {', '.join(sorted(unknown))}",
+                suggestion=f"Use only: {', '.join(_CONVERT_OPTION_NAMES)}"
+            )
+        options = ConvertOptions(**options)
+    
     # Load configuration
     config = get_config(config_path)
     defaults = config.get_defaults()
     
+    # CLI options explicitly provided (non-None values only)
+    overrides = {}
+    for name in _CONVERT_OPTION_NAMES:
+        value = getattr(options, name)
+        if value is not None:
+            overrides[name] = value
+    
     # Start with configuration defaults
     result = {}
     
-    # Map config keys to CLI option names
-    config_to_cli = {
-        "thickness": "thickness",
-        "color": "color",
-        "style": "style",
-        "markers.enabled": "markers",
-        "markers.unit": "markers_unit",
-        "markers.interval": "marker_interval",
-        "markers.size": "marker_size",
-        "markers.color": "marker_color",
-        "markers.label_font_size": "label_font_size",
-        "overlay.enabled": "overlay",
-        "overlay.position": "overlay_position",
-        "overlay.font_size": "font_size",
-        "overlay.font_color": "font_color",
-        "overlay.background": "background",
-        "overlay.bg_color": "bg_color",
-        "overlay.bg_alpha": "bg_alpha",
-        "export.formats": "formats",
-        "export.width": None,  # Not directly mapped
-        "export.height": None,  # Not directly mapped
-        "export.dpi": "dpi",
-        "export.page_size": "page_size"
-    }
-    
     # Handle markers enabled special case
-    if "markers" in option_dict and option_dict["markers"] is False:
+    if overrides.get("markers") is False:
         result["markers"] = False
     elif defaults.get("markers", {}).get("enabled", False):
         result["markers"] = True
         
     # Fill in values from config, excluding None values and those
     # that will be overridden by CLI options
-    for config_key, cli_key in config_to_cli.items():
-        if cli_key is None:
-            continue
-            
-        # Skip CLI options explicitly provided
-        if cli_key in option_dict and option_dict[cli_key] is not None:
+    flat_defaults = config.flat_defaults()
+    for config_key, cli_key in _CONFIG_TO_CLI.items():
+        # Skip CLI options explicitly provided; this also covers the
+        # overlay.enabled -> overlay special case
+        if cli_key in overrides:
             continue
             
-        # Special case for overlay fields
-        if config_key == "overlay.enabled" and "overlay" in option_dict and option_dict["overlay"] is not None:
-            continue
-            
-        # Get the config value using dot notation
-        value = config.get(f"defaults.{config_key}")
+        # Get the config value from the pre-flattened defaults table
+        value = flat_defaults.get(config_key)
         if value is not None:
             # Special handling for overlay fields
             if config_key == "overlay.fields" and value:
@@ -125,13 +224,11 @@ def get_effective_options(config_path, option_dict):
             elif config_key == "export.formats" and value:
                 result["formats"] = ",".join(value)
             # Normal case
-            elif cli_key:
+            else:
                 result[cli_key] = value
     
-    # Override with CLI options (non-None values only)
-    for key, value in option_dict.items():
-        if value is not None:
-            result[key] = value
+    # Override with CLI options
+    result.update(overrides)
     
     return result
 
@@ -213,13 +310,19 @@ def handle_command_errors(f: CommandCallback) -> CommandCallback:
     is_flag=True,
     help="Disable logging to file"
 )
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Cache parsed routes so later commands on the same GPX file skip parsing"
+)
 @click.pass_context
-def cli(ctx, config, verbose, debug, no_log_file):
+def cli(ctx, config, verbose, debug, no_log_file, cache):
     """Route-to-Art - Transform GPS routes into artwork."""
     # Initialize context
     ctx.ensure_object(dict)
     ctx.obj["config_path"] = config
     ctx.obj["debug"] = debug
+    ctx.obj["use_cache"] = cache
     
     # Set up logging
     configure_for_cli(
@@ -335,12 +438,20 @@ def cli(ctx, config, verbose, debug, no_log_file):
     type=float,
     help="Transparency of overlay background (0-1, config override)"
 )
+@click.option(
+    "--simplify-tolerance",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_SIMPLIFY_TOLERANCE,
+    show_default=True,
+    help="Drop route points deviating less than this many degrees from the drawn line (0 to disable)"
+)
 @click.pass_context
 @handle_command_errors
 def convert(
     ctx, input_file, output_file, color, thickness, style, dpi, formats, page_size,
     markers, markers_unit, marker_interval, marker_size, marker_color, label_font_size,
-    overlay, overlay_position, font_size, font_color, background, bg_color, bg_alpha
+    overlay, overlay_position, font_size, font_color, background, bg_color, bg_alpha,
+    simplify_tolerance
 ):
     """
     Convert route data from a GPX-format file to artwork in PNG, SVG, or PDF format.
@@ -348,6 +459,9 @@ def convert(
     CLI options override settings from the configuration file.
     Use --config to specify a configuration file.
     """
+    RouteVisualizer = _lazy("RouteVisualizer")
+    Exporter = _lazy("Exporter")
+    
     log_info(f"Converting route from GPX file: {input_file} to {output_file}")
     log_debug("Convert options", data={
         "color": color,
@@ -360,45 +474,43 @@ def convert(
     # Get effective options (config + CLI overrides)
     options = get_effective_options(
         ctx.obj.get("config_path"),
-        {
-            "color": color,
-            "thickness": thickness,
-            "style": style,
-            "dpi": dpi,
-            "formats": formats,
-            "page_size": page_size,
-            "markers": markers,
-            "markers_unit": markers_unit,
-            "marker_interval": marker_interval,
-            "marker_size": marker_size,
-            "marker_color": marker_color,
-            "label_font_size": label_font_size,
-            "overlay": overlay,
-            "overlay_position": overlay_position,
-            "font_size": font_size,
-            "font_color": font_color,
-            "background": background,
-            "bg_color": bg_color,
-            "bg_alpha": bg_alpha
-        }
+        ConvertOptions(
+            color=color,
+            thickness=thickness,
+            style=style,
+            dpi=dpi,
+            formats=formats,
+            page_size=page_size,
+            markers=markers,
+            markers_unit=markers_unit,
+            marker_interval=marker_interval,
+            marker_size=marker_size,
+            marker_color=marker_color,
+            label_font_size=label_font_size,
+            overlay=overlay,
+            overlay_position=overlay_position,
+            font_size=font_size,
+            font_color=font_color,
+            background=background,
+            bg_color=bg_color,
+            bg_alpha=bg_alpha
+        )
     )
     
     # Parse GPX file
     click.echo("Parsing route data from GPX-format file...")
     try:
+        # Stream the GPX file straight into our model, or with --cache reuse
+        # the route cached by an earlier command on the same file
         parser = RouteParser(input_file)
-        route_data = parser.parse()
+        route = parser.parse_route(use_cache=ctx.ensure_object(dict).get("use_cache", False))
         
-        if not route_data:
-            error_msg = parser.get_error()
+        if route is None:
             raise RouteParseError.invalid_route_file(
-                error_msg, 
+                parser.get_error(), 
                 file_path=input_file
             )
         
-        # Convert to internal model
-        route = parser.to_route(route_data)
-        
         # Check if route has any segments
         if not route.segments:
             raise RouteParseError.missing_track(file_path=input_file)
@@ -417,6 +529,14 @@ def convert(
             )
         raise
     
+    # Simplify the geometry before drawing; dense tracks have far more
+    # points than any output format can show
+    if simplify_tolerance:
+        total_points = route.get_total_points()
+        route = route.simplify(simplify_tolerance)
+        log_debug(f"Simplified route from {total_points} to "
+                  f"{sum(len(segment.points) for segment in route.segments)} points")
+    
     # Create visualizer
     click.echo("Rendering route...")
     log_info("Creating visualization")
@@ -438,37 +558,7 @@ def convert(
             line_style=options.get("style")
         )
         
-        # Add distance markers if requested
-        if options.get("markers"):
-            try:
-                log_info("Adding distance markers")
-                visualizer.add_distance_markers(
-                    unit=options.get("markers_unit"),
-                    interval=options.get("marker_interval"),
-                    marker_size=options.get("marker_size"),
-                    marker_color=options.get("marker_color"),
-                    show_labels=True,
-                    label_font_size=options.get("label_font_size")
-                )
-            except Exception as e:
-                log_warning(f"Error adding markers: {str(e)}")
-                click.secho(f"Error adding markers: {str(e)}", fg="yellow")
-                click.echo("Continuing without markers...")
-                
-        # Add information overlay if requested
-        if options.get("overlay"):
-            try:
-                log_info("Adding information overlay")
-                # Parse overlay fields
-                overlay_fields = [field.strip() for field in options.get("overlay").split(',')]
-                
-                visualizer.add_overlay(
-                    fields=overlay_fields,
-                    position=options.get("overlay_position"),
-                    font_size=options.get("font_size")
-                )
-            except Exception as e:
-                log_warning(f"Failed to add overlay: {e}")
+        _add_decorations(visualizer, options)
     except Exception as e:
         log_error(f"Error rendering route: {e}")
         raise RenderingError(f"Failed to render route: {e}")
@@ -479,7 +569,7 @@ def convert(
     
     # If formats are explicitly provided, use those
     if formats:
-        format_list = [f.strip() for f in formats.split(',')]
+        format_list = _CSV_SPLIT(formats.strip())
         try:
             click.echo(f"Exporting to {', '.join(format_list)} formats...")
             exported_files = exporter.export_multiple(
@@ -495,29 +585,7 @@ def convert(
     else:
         # Otherwise, determine format from file extension
         try:
-            export_format = exporter.get_format(output_path)
-            format_name = export_format.name.lower()
-            click.echo(f"Exporting {format_name.upper()}...")
-            
-            # Export based on detected format
-            if export_format == ExportFormat.PNG:
-                exporter.export_png(
-                    figure=visualizer.get_figure(),
-                    output_path=output_path,
-                    dpi=dpi
-                )
-            elif export_format == ExportFormat.SVG:
-                exporter.export_svg(
-                    figure=visualizer.get_figure(),
-                    output_path=output_path
-                )
-            elif export_format == ExportFormat.PDF:
-                exporter.export_pdf(
-                    figure=visualizer.get_figure(),
-                    output_path=output_path,
-                    page_size=page_size
-                )
-            
+            _export_single(exporter, visualizer.get_figure(), output_path, dpi, page_size)
             exported_files = [output_path]
             
         except ExportError as e:
@@ -566,27 +634,270 @@ def convert(
         click.echo(f"Overlay: {', '.join(overlay_info)}")
 
 
-def validate_coordinates(route: Route) -> List[str]:
+def _add_decorations(visualizer: Any, options: Dict[str, Any]) -> None:
+    """
+    Add the distance markers and overlay requested in the effective options.
+    
+    Failures are reported as warnings and the route is kept without them.
+    
+    Args:
+        visualizer: RouteVisualizer with the route already rendered
+        options: Effective options from get_effective_options
+    """
+    # Add distance markers if requested
+    if options.get("markers"):
+        try:
+            log_info("Adding distance markers")
+            visualizer.add_distance_markers(
+                unit=options.get("markers_unit"),
+                interval=options.get("marker_interval"),
+                marker_size=options.get("marker_size"),
+                marker_color=options.get("marker_color"),
+                show_labels=True,
+                label_font_size=options.get("label_font_size")
+            )
+        except Exception as e:
+            log_warning(f"Error adding markers: {str(e)}")
+            click.secho(f"Error adding markers: {str(e)}", fg="yellow")
+            click.echo("Continuing without markers...")
+            
+    # Add information overlay if requested
+    if options.get("overlay"):
+        try:
+            log_info("Adding information overlay")
+            # Parse overlay fields
+            overlay_fields = _CSV_SPLIT(options.get("overlay").strip())
+            
+            visualizer.add_overlay(
+                fields=overlay_fields,
+                position=options.get("overlay_position"),
+                font_size=options.get("font_size")
+            )
+        except Exception as e:
+            log_warning(f"Failed to add overlay: {e}")
+
+
+def _export_single(
+    exporter: Any,
+    figure: Any,
+    output_path: Path,
+    dpi: Optional[int],
+    page_size: Optional[str]
+) -> None:
+    """
+    Export a figure in the format given by the output file's extension.
+    
+    Args:
+        exporter: Exporter instance
+        figure: Figure to export
+        output_path: Output file path; its extension selects the format
+        dpi: Resolution for PNG output
+        page_size: Page size for PDF output
+        
+    Raises:
+        ExportError: If the extension is not supported or export fails
+    """
+    ExportFormat = _lazy("ExportFormat")
+    
+    export_format = exporter.get_format(output_path)
+    format_name = export_format.name.lower()
+    click.echo(f"Exporting {format_name.upper()}...")
+    
+    # Export based on detected format
+    if export_format == ExportFormat.PNG:
+        exporter.export_png(
+            figure=figure,
+            output_path=output_path,
+            dpi=dpi
+        )
+    elif export_format == ExportFormat.SVG:
+        exporter.export_svg(
+            figure=figure,
+            output_path=output_path
+        )
+    elif export_format == ExportFormat.PDF:
+        exporter.export_pdf(
+            figure=figure,
+            output_path=output_path,
+            page_size=page_size
+        )
+
+
+@cli.command("convert-batch")
+@click.argument("manifest", type=click.File("r"))
+@click.option(
+    "--simplify-tolerance",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_SIMPLIFY_TOLERANCE,
+    show_default=True,
+    help="Drop route points deviating less than this many degrees from the drawn line (0 to disable)"
+)
+@click.pass_context
+@handle_command_errors
+def convert_batch(ctx, manifest, simplify_tolerance):
+    """
+    Convert every GPX file listed in MANIFEST, reusing one figure.
+    
+    Each line of the manifest holds an input GPX file and an output file,
+    separated by a comma; the output extension selects the format. Blank
+    lines and lines starting with # are skipped. Styling comes from the
+    configuration file.
+    """
+    RouteVisualizer = _lazy("RouteVisualizer")
+    Exporter = _lazy("Exporter")
+    
+    options = get_effective_options(ctx.obj.get("config_path"), ConvertOptions())
+    exporter = Exporter()
+    
+    # The figure from the first route is cleared and redrawn for the rest,
+    # so matplotlib's figure, canvas and axes are only built once
+    figure = None
+    converted = failed = 0
+    
+    try:
+        for line_number, row in enumerate(csv.reader(manifest), start=1):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            if len(row) != 2:
+                failed += 1
+                click.secho(f"Error: Line {line_number}: expected 'input,output'", fg="red")
+                continue
+            
+            input_file, output_file = (field.strip() for field in row)
+            try:
+                parser = RouteParser(input_file)
+                route = parser.parse_route(use_cache=ctx.ensure_object(dict).get("use_cache", False))
+                if route is None:
+                    raise RouteParseError.invalid_route_file(parser.get_error(), file_path=input_file)
+                if not route.get_total_points():
+                    raise RouteParseError.no_coordinates(file_path=input_file)
+                
+                visualizer = RouteVisualizer(route.simplify(simplify_tolerance))
+                if figure is None:
+                    figure = visualizer.create_figure()
+                else:
+                    visualizer.use_figure(figure)
+                
+                visualizer.render_route(
+                    color=options.get("color"),
+                    thickness=options.get("thickness"),
+                    line_style=options.get("style")
+                )
+                _add_decorations(visualizer, options)
+                _export_single(
+                    exporter, figure, Path(output_file),
+                    options.get("dpi"), options.get("page_size")
+                )
+                converted += 1
+            except Exception as e:
+                failed += 1
+                log_error(
+                    e, f"Error converting {input_file}",
+                    module="convert_batch", include_traceback=False
+                )
+                click.secho(f"Error: {input_file}: {e}", fg="red")
+    finally:
+        if figure is not None:
+            import matplotlib.pyplot as plt
+            plt.close(figure)
+    
+    click.echo(f"Converted {converted} of {converted + failed} files")
+    if failed:
+        sys.exit(1)
+
+
+# Routes with at least this many segments are validated on a thread pool
+PARALLEL_VALIDATION_MIN_SEGMENTS = 4
+MAX_VALIDATION_WORKERS = 8
+
+
+def _map_segments(
+    check: Callable[[int, Any], T],
+    route: Route,
+    executor: Optional[Executor] = None
+) -> Iterator[T]:
+    """
+    Run a per-segment check over a route, optionally on an executor.
+    
+    Args:
+        check: Function taking a segment index and segment
+        route: The Route object to validate
+        executor: Optional executor to run the checks concurrently
+        
+    Returns:
+        Iterator over the check results, in segment order
+    """
+    indexes = range(len(route.segments))
+    if executor is None:
+        return map(check, indexes, route.segments)
+    # map yields results in submission order, keeping output deterministic
+    return executor.map(check, indexes, route.segments)
+
+
+def _check_segments(
+    check: Callable[[int, Any], List[str]],
+    route: Route,
+    executor: Optional[Executor] = None
+) -> List[str]:
+    """
+    Run a per-segment check over a route and collect the issues.
+    
+    Args:
+        check: Function taking a segment index and segment, returning issues
+        route: The Route object to validate
+        executor: Optional executor to run the checks concurrently
+        
+    Returns:
+        Issues from all segments, in segment order
+    """
+    return list(chain.from_iterable(_map_segments(check, route, executor)))
+
+
+def _segment_coordinate_issues(i: int, segment) -> List[str]:
+    """Check one segment for coordinates outside the usable range."""
+    # Latitude and longitude should already be validated on point creation,
+    # but we can do additional checks here if needed. Compare the whole
+    # segment at once and only visit the offending points
+    lats = segment.lat_array
+    return [
+        f"Point {j+1} in segment {i+1} has extreme latitude ({lats[j]})"
+        " which may cause issues with map projections"
+        for j in np.flatnonzero(np.abs(lats) > 85.0)
+    ]
+
+
+def validate_coordinates(route: Route, executor: Optional[Executor] = None) -> List[str]:
     """
     Validate that all coordinates in the route are within valid ranges.
     
     Args:
         route: The Route object to validate
+        executor: Optional executor to check segments concurrently
         
     Returns:
         List of error messages, empty if no issues found
     """
+    return _check_segments(_segment_coordinate_issues, route, executor)
+
+
+def _segment_point_issues(i: int, segment) -> List[str]:
+    """Check that one segment has a usable number of points."""
+    n_points = len(segment.points)
+    
+    # Check if segment has points
+    if n_points == 0:
+        return [f"Segment {i+1} has no points"]
+    
     issues = []
     
-    for i, segment in enumerate(route.segments):
-        for j, point in enumerate(segment.points):
-            # Latitude and longitude should already be validated on point creation,
-            # but we can do additional checks here if needed
-            if abs(point.latitude) > 85.0:
-                issues.append(
-                    f"Point {j+1} in segment {i+1} has extreme latitude ({point.latitude})"
-                    " which may cause issues with map projections"
-                )
+    # Check if segment has enough points for meaningful data
+    if n_points < 2:
+        issues.append(f"Segment {i+1} has only one point - no route data")
+        
+    # Check for excessive points (warning, not error)
+    if n_points > 10000:
+        issues.append(f"Segment {i+1} has {n_points} points, "
+                     "which may cause performance issues")
     
     return issues
 
@@ -601,99 +912,200 @@ def validate_segments(route: Route) -> List[str]:
     Returns:
         List of error messages, empty if no issues found
     """
-    issues = []
-    
     # Check if there are any segments at all
     if not route.segments:
-        issues.append("Route has no segments")
-        return issues
+        return ["Route has no segments"]
     
-    for i, segment in enumerate(route.segments):
-        # Check if segment has points
-        if not segment.points:
-            issues.append(f"Segment {i+1} has no points")
-            continue
+    return _check_segments(_segment_point_issues, route)
+
+
+def _segment_timestamp_issues(i: int, segment) -> List[str]:
+    """Check one segment's timestamps for gaps, ordering and duplicates."""
+    issues = []
+    
+    # Each check below is a single vectorized pass over the segment's
+    # timestamps, with NaT marking points that have none
+    timestamps = segment.ts_array
+    present = ~np.isnat(timestamps)
+    
+    # One count answers both "any timestamps?" and "all timestamps?"
+    known_count = np.count_nonzero(present)
+    
+    # Check if timestamps exist
+    if not known_count:
+        return issues  # Skip further timestamp checks if no timestamps
         
-        # Check if segment has enough points for meaningful data
-        if len(segment.points) < 2:
-            issues.append(f"Segment {i+1} has only one point - no route data")
-            
-        # Check for excessive points (warning, not error)
-        if len(segment.points) > 10000:
-            issues.append(f"Segment {i+1} has {len(segment.points)} points, "
-                         "which may cause performance issues")
+    # Check if all points have timestamps
+    complete = known_count == timestamps.size
+    if not complete:
+        issues.append(f"Segment {i+1} has inconsistent timestamps "
+                     "(some points missing timestamp data)")
+        
+    # Check for timestamp order between neighbouring points; comparisons
+    # involving NaT are false, so gaps are skipped
+    steps = np.diff(timestamps)
+    out_of_order = (steps < np.timedelta64(0)).any()
+    if out_of_order:
+        issues.append(f"Segment {i+1} has out-of-order timestamps")
+        
+    # Check for duplicate timestamps. Once the known timestamps are sorted,
+    # duplicates are neighbours; recorded tracks are almost always sorted
+    # already, gaps or not, so the sort only runs when a step goes backwards
+    if complete:
+        known_sorted = not out_of_order
+    else:
+        steps = np.diff(timestamps[present])
+        known_sorted = not (steps < np.timedelta64(0)).any()
+    if not known_sorted:
+        steps = np.diff(np.sort(timestamps[present]))
+    if (steps == np.timedelta64(0)).any():
+        issues.append(f"Segment {i+1} has duplicate timestamps")
     
     return issues
 
 
-def validate_timestamps(route: Route) -> List[str]:
+def validate_timestamps(route: Route, executor: Optional[Executor] = None) -> List[str]:
     """
     Validate timestamp consistency.
     
     Args:
         route: The Route object to validate
+        executor: Optional executor to check segments concurrently
         
     Returns:
         List of error messages, empty if no issues found
     """
-    issues = []
+    return _check_segments(_segment_timestamp_issues, route, executor)
+
+
+def _segment_all_issues(i: int, segment) -> Tuple[List[str], List[str], List[str]]:
+    """Run the point-count, coordinate and timestamp checks on one segment."""
+    return (
+        _segment_point_issues(i, segment),
+        _segment_coordinate_issues(i, segment),
+        _segment_timestamp_issues(i, segment)
+    )
+
+
+def validate_all(
+    route: Route,
+    executor: Optional[Executor] = None
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Run every validation in one pass over the route's segments.
     
-    for i, segment in enumerate(route.segments):
-        # Check if timestamps exist
-        has_timestamps = any(p.timestamp for p in segment.points)
-        if not has_timestamps:
-            continue  # Skip further timestamp checks if no timestamps
-            
-        # Check if all points have timestamps
-        missing_timestamps = any(p.timestamp is None for p in segment.points)
-        if missing_timestamps:
-            issues.append(f"Segment {i+1} has inconsistent timestamps "
-                         "(some points missing timestamp data)")
-            
-        # Check for timestamp order
-        timestamp_issues = False
-        for j in range(1, len(segment.points)):
-            curr = segment.points[j].timestamp
-            prev = segment.points[j-1].timestamp
-            if curr and prev and curr < prev:
-                timestamp_issues = True
-                break
-                
-        if timestamp_issues:
-            issues.append(f"Segment {i+1} has out-of-order timestamps")
-            
-        # Check for duplicate timestamps
-        timestamps = [p.timestamp for p in segment.points if p.timestamp]
-        unique_timestamps = set(timestamps)
-        if len(unique_timestamps) < len(timestamps):
-            issues.append(f"Segment {i+1} has duplicate timestamps")
+    Each segment gets all its checks while its data is at hand, instead of
+    one walk over the route per validator.
     
-    return issues
+    Args:
+        route: The Route object to validate
+        executor: Optional executor to check segments concurrently
+        
+    Returns:
+        Tuple of (segment, coordinate, timestamp) issue lists, as returned by
+        validate_segments, validate_coordinates and validate_timestamps
+    """
+    if not route.segments:
+        return ["Route has no segments"], [], []
+    
+    segment_issues: List[str] = []
+    coordinate_issues: List[str] = []
+    timestamp_issues: List[str] = []
+    for points, coordinates, timestamps in _map_segments(_segment_all_issues, route, executor):
+        segment_issues.extend(points)
+        coordinate_issues.extend(coordinates)
+        timestamp_issues.extend(timestamps)
+    
+    return segment_issues, coordinate_issues, timestamp_issues
+
+
+# Bounds for --quick-reject: total distance in metres and points per metre
+QUICK_REJECT_MIN_DISTANCE = 500.0
+QUICK_REJECT_MAX_DISTANCE = 100_000.0
+QUICK_REJECT_MIN_POINT_DENSITY = 1 / 100
+
+
+def quick_reject_reason(input_file: str) -> Optional[str]:
+    """
+    Check a GPX file's distance and point density without building a Route.
+    
+    Coordinates are streamed and the distance is summed as they arrive,
+    so files over the maximum distance are rejected without reading the
+    rest of the file.
+    
+    Args:
+        input_file: Path to the GPX file
+        
+    Returns:
+        Reason the file should be rejected, or None if it is within bounds
+        
+    Raises:
+        ValueError: If the document is not GPX or a point is malformed
+        xml.etree.ElementTree.ParseError: If the XML is malformed (lxml.etree.XMLSyntaxError with lxml)
+    """
+    distance = 0.0
+    n_points = 0
+    prev_lat = prev_lon = 0.0
+    
+    for starts_segment, lat, lon in iter_coordinates(input_file):
+        n_points += 1
+        if not starts_segment:
+            distance += haversine_distance(prev_lat, prev_lon, lat, lon)
+            if distance > QUICK_REJECT_MAX_DISTANCE:
+                return f"Route is longer than {format_distance(QUICK_REJECT_MAX_DISTANCE)}"
+        prev_lat, prev_lon = lat, lon
+    
+    if distance < QUICK_REJECT_MIN_DISTANCE:
+        return (f"Route is shorter than {format_distance(QUICK_REJECT_MIN_DISTANCE)} "
+                f"({format_distance(distance)})")
+    if n_points < distance * QUICK_REJECT_MIN_POINT_DENSITY:
+        return (f"Route has {n_points} points over {format_distance(distance)}, "
+                "fewer than one per 100 m")
+    return None
 
 
 @cli.command()
-@click.argument("input_file", type=click.Path(exists=True))
-def validate(input_file):
+@click.argument("input_file", type=click.Path(exists=True, resolve_path=True))
+@click.option(
+    "--quick-reject",
+    is_flag=True,
+    help="Exit with status 2 if the route is under 0.5 km, over 100 km or has "
+         "fewer than one point per 100 m, before full parsing"
+)
+@click.pass_context
+def validate(ctx, input_file, quick_reject):
     """Validate route data from GPX file."""
-    # Parse the GPX file
+    if quick_reject:
+        try:
+            reason = quick_reject_reason(input_file)
+        except Exception as e:
+            click.secho(f"Error: Error parsing GPX file: {e}", fg="red")
+            sys.exit(1)
+        if reason:
+            click.secho(f"Rejected: {reason}", fg="red")
+            sys.exit(2)
+    
+    # Stream the GPX file straight into our model
     parser = RouteParser(input_file)
-    route_data = parser.parse()
+    route = parser.parse_route(use_cache=ctx.ensure_object(dict).get("use_cache", False))
     
-    if not route_data:
+    if route is None:
         click.secho(f"Error: {parser.get_error()}", fg="red")
         sys.exit(1)
     
-    # Convert to our model
-    route = parser.to_route(route_data)
-    
     # Run validation checks
     click.secho("\n=== Route Validation Results ===", fg="blue", bold=True)
-    click.echo(f"File: {click.format_filename(os.path.abspath(input_file))}")
+    click.echo(f"File: {click.format_filename(input_file)}")
     
-    # Run all validations
-    segment_issues = validate_segments(route)
-    coordinate_issues = validate_coordinates(route)
-    timestamp_issues = validate_timestamps(route)
+    # Run all validations in one pass. Segments are independent and the
+    # per-segment checks are mostly NumPy work, so long multi-segment
+    # routes fan out over a thread pool
+    n_segments = len(route.segments)
+    if n_segments >= PARALLEL_VALIDATION_MIN_SEGMENTS:
+        with ThreadPoolExecutor(max_workers=min(MAX_VALIDATION_WORKERS, n_segments)) as executor:
+            segment_issues, coordinate_issues, timestamp_issues = validate_all(route, executor)
+    else:
+        segment_issues, coordinate_issues, timestamp_issues = validate_all(route)
     
     # Combine all issues
     all_issues = segment_issues + coordinate_issues + timestamp_issues
@@ -726,11 +1138,14 @@ def validate(input_file):
         sys.exit(1)
 
 
+# Metres-to-unit factors, so format_distance multiplies instead of divides
+_INV_KM = 1e-3
+_INV_MILE = 1.0 / 1609.34
+
+
 def format_distance(meters):
     """Format distance in both kilometers and miles."""
-    km = meters / 1000
-    miles = meters / 1609.34
-    return f"{km:.2f} km ({miles:.2f} miles)"
+    return f"{meters * _INV_KM:.2f} km ({meters * _INV_MILE:.2f} miles)"
 
 
 def format_duration(duration):
@@ -738,8 +1153,9 @@ def format_duration(duration):
     if not duration:
         return "Unknown"
     
-    days = duration.days
-    hours, remainder = divmod(duration.seconds, 3600)
+    # One integer divmod chain over the whole seconds
+    days, remainder = divmod(int(duration.total_seconds()), 86400)
+    hours, remainder = divmod(remainder, 3600)
     minutes, seconds = divmod(remainder, 60)
     
     parts = []
@@ -775,45 +1191,43 @@ def format_bounds(bounds):
 
 
 @cli.command()
-@click.argument("input_file", type=click.Path(exists=True))
-def info(input_file):
+@click.argument("input_file", type=click.Path(exists=True, resolve_path=True))
+@click.pass_context
+def info(ctx, input_file):
     """Display route information from GPX file."""
-    # Parse the GPX file
+    # Stream the GPX file straight into our model
     parser = RouteParser(input_file)
-    route_data = parser.parse()
+    route = parser.parse_route(use_cache=ctx.ensure_object(dict).get("use_cache", False))
     
-    if not route_data:
+    if route is None:
         click.secho(f"Error: {parser.get_error()}", fg="red")
         sys.exit(1)
     
-    # Convert to our model
-    route = parser.to_route(route_data)
-    
     # Display file information
     click.secho("\n=== Route Information ===", fg="green", bold=True)
-    click.echo(f"File: {click.format_filename(os.path.abspath(input_file))}")
+    click.echo(f"File: {click.format_filename(input_file)}")
     click.echo(f"Name: {route.name or 'Unnamed route'}")
     
+    # All statistics below come from one sweep over the route
+    stats = route.compute_stats()
+    
     # Display basic stats
     click.secho("\n=== Route Statistics ===", fg="green", bold=True)
-    click.echo(f"Distance: {format_distance(route.get_total_distance())}")
-    
-    duration = route.get_total_duration()
-    click.echo(f"Duration: {format_duration(duration)}")
+    click.echo(f"Distance: {format_distance(stats.total_distance)}")
+    click.echo(f"Duration: {format_duration(stats.total_duration)}")
     
     # Display structure information
     click.secho("\n=== Route Structure ===", fg="green", bold=True)
     click.echo(f"Segments: {len(route.segments)}")
-    click.echo(f"Points: {route.get_total_points()}")
+    click.echo(f"Points: {stats.total_points}")
     
     # Display elevation information if available
     click.secho("\n=== Elevation Profile ===", fg="green", bold=True)
-    elevation_stats = route.get_elevation_stats()
-    click.echo(format_elevation(elevation_stats))
+    click.echo(format_elevation(stats.elevation))
     
     # Display geographic bounds
     click.secho("\n=== Geographic Bounds ===", fg="green", bold=True)
-    click.echo(format_bounds(route.get_bounds()))
+    click.echo(format_bounds(stats.bounds))
     
     click.echo("")  # Add a newline at the end
 
@@ -831,7 +1245,7 @@ def info(input_file):
 )
 def init_config(path, force):
     """Initialize a default configuration file."""
-    config = Config()
+    config = Config.get_shared()
     
     # Determine config path
     if not path:
@@ -7,8 +7,22 @@ segments, and complete routes, with methods for calculating metrics.
 
 import math
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime, timedelta, timezone
+from itertools import tee
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+
+T = TypeVar("T")
+
+try:
+    from itertools import pairwise
+except ImportError:  # Python < 3.10
+    def pairwise(iterable: Iterable[T]) -> Iterator[Tuple[T, T]]:
+        """Return successive overlapping pairs taken from the input iterable."""
+        first, second = tee(iterable)
+        next(second, None)
+        return zip(first, second)
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -46,6 +60,94 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return distance
 
 
+def haversine_array(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate great-circle distances between arrays of points.
+    
+    Element-wise NumPy version of haversine_distance.
+    
+    Args:
+        lat1: Latitudes of the first points in degrees
+        lon1: Longitudes of the first points in degrees
+        lat2: Latitudes of the second points in degrees
+        lon2: Longitudes of the second points in degrees
+        
+    Returns:
+        Distances between the point pairs in meters
+    """
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = np.radians(lon2) - np.radians(lon1)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    return 6371000 * 2 * np.arcsin(np.sqrt(a))
+
+
+def rdp_mask(x: np.ndarray, y: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Select the points kept by Ramer-Douglas-Peucker polyline simplification.
+    
+    Runs iteratively over index ranges, with the distances for each range
+    computed in one NumPy expression.
+    
+    Args:
+        x: X coordinates of the polyline
+        y: Y coordinates of the polyline
+        tolerance: Maximum distance of a dropped point from the simplified line,
+            in the units of x and y
+        
+    Returns:
+        Boolean mask of the points to keep; the end points are always kept
+    """
+    n = len(x)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        
+        # Distance of each interior point from the chord start -> end
+        dx = x[end] - x[start]
+        dy = y[end] - y[start]
+        px = x[start + 1:end] - x[start]
+        py = y[start + 1:end] - y[start]
+        chord = math.hypot(dx, dy)
+        if chord == 0:
+            distances = np.hypot(px, py)
+        else:
+            distances = np.abs(dx * py - dy * px) / chord
+        
+        i = int(np.argmax(distances))
+        if distances[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    
+    return keep
+
+
+def _naive_utc(timestamp: Optional[datetime]) -> Optional[datetime]:
+    """
+    Convert a timezone-aware datetime to naive UTC for NumPy.
+    
+    Naive datetimes and None are returned unchanged.
+    """
+    if timestamp is None or timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 @dataclass
 class RoutePoint:
     """A single point in a GPS route with coordinates and optional metadata."""
@@ -74,6 +176,74 @@ class RouteSegment:
     points: List[RoutePoint] = field(default_factory=list)
     name: Optional[str] = None
     
+    @property
+    def lat_array(self) -> np.ndarray:
+        """
+        Latitudes of all points as a contiguous float64 array.
+        
+        Built from the current points on every access, so it always follows
+        changes to the points list; callers needing it repeatedly should
+        keep the array they get.
+        """
+        return np.fromiter((p.latitude for p in self.points), dtype=np.float64, count=len(self.points))
+    
+    @property
+    def lon_array(self) -> np.ndarray:
+        """
+        Longitudes of all points as a contiguous float64 array.
+        
+        Built from the current points on every access like lat_array.
+        """
+        return np.fromiter((p.longitude for p in self.points), dtype=np.float64, count=len(self.points))
+    
+    @property
+    def ele_array(self) -> np.ndarray:
+        """
+        Elevations of all points as a float64 array.
+        
+        Missing elevations are NaN. Built from the current points on every
+        access like lat_array.
+        """
+        return np.fromiter(
+            (np.nan if p.elevation is None else p.elevation for p in self.points),
+            dtype=np.float64,
+            count=len(self.points)
+        )
+    
+    @property
+    def ts_array(self) -> np.ndarray:
+        """
+        Timestamps of all points as a datetime64[us] array.
+        
+        Missing timestamps are NaT and timezone-aware values are converted
+        to UTC. Built from the current points on every access like lat_array.
+        """
+        return np.array([_naive_utc(p.timestamp) for p in self.points], dtype='datetime64[us]')
+    
+    def simplify(self, tolerance: float) -> "RouteSegment":
+        """
+        Simplify the segment with Ramer-Douglas-Peucker on its coordinates.
+        
+        Kept points are the original RoutePoint objects, so elevation and
+        timestamps are preserved.
+        
+        Args:
+            tolerance: Maximum deviation of dropped points, in degrees
+            
+        Returns:
+            A new simplified segment, or this segment if nothing is dropped
+        """
+        n_points = len(self.points)
+        if tolerance <= 0 or n_points < 3:
+            return self
+        
+        indexes = np.flatnonzero(rdp_mask(self.lon_array, self.lat_array, tolerance))
+        if len(indexes) == n_points:
+            return self
+        
+        points = self.points
+        return RouteSegment(points=[points[i] for i in indexes], name=self.name)
+    
     def calculate_distance(self) -> float:
         """
         Calculate the total distance of the segment in meters.
@@ -83,16 +253,10 @@ class RouteSegment:
         """
         if len(self.points) < 2:
             return 0.0
-            
-        total_distance = 0.0
-        for i in range(len(self.points) - 1):
-            p1 = self.points[i]
-            p2 = self.points[i + 1]
-            total_distance += haversine_distance(
-                p1.latitude, p1.longitude, p2.latitude, p2.longitude
-            )
-            
-        return total_distance
+        
+        lats = self.lat_array
+        lons = self.lon_array
+        return float(haversine_array(lats[:-1], lons[:-1], lats[1:], lons[1:]).sum())
     
     def calculate_duration(self) -> Optional[timedelta]:
         """
@@ -102,21 +266,13 @@ class RouteSegment:
             Duration as timedelta if timestamps are available, None otherwise
         """
         # Check if we have timestamps on at least the first and last points
-        if (len(self.points) < 2 or 
-            self.points[0].timestamp is None or 
-            self.points[-1].timestamp is None):
+        if len(self.points) < 2:
             return None
-            
-        # Find the first and last points with valid timestamps
-        first_ts = None
-        last_ts = None
-        
-        for point in self.points:
-            if point.timestamp is not None:
-                if first_ts is None:
-                    first_ts = point.timestamp
-                last_ts = point.timestamp
-                
+        first_ts = self.points[0].timestamp
+        last_ts = self.points[-1].timestamp
+        
+        # Those are then the first and last valid timestamps, so there is no
+        # need to scan the points in between
         if first_ts is None or last_ts is None:
             return None
             
@@ -134,6 +290,115 @@ class Route:
     segments: List[RouteSegment] = field(default_factory=list)
     name: Optional[str] = None
     metadata: Dict = field(default_factory=dict)
+    # Route this one was simplified from, whose statistics it reports
+    simplified_from: Optional["Route"] = field(default=None, repr=False, compare=False)
+    
+    def compute_stats(self) -> "RouteStats":
+        """
+        Compute distance, duration, bounds, elevation and point statistics.
+        
+        All statistics come from one sweep over the segments' NumPy
+        arrays rather than one Python pass over the points per statistic.
+        Nothing is cached, so the result always follows the current
+        segments. A simplified route reports the statistics of the route
+        it was simplified from.
+        
+        Returns:
+            RouteStats for the current segments
+        """
+        if self.simplified_from is not None:
+            return self.simplified_from.compute_stats()
+        
+        total_points = 0
+        total_distance = 0.0
+        first_timestamp = last_timestamp = None
+        min_lat = min_lon = float('inf')
+        max_lat = max_lon = float('-inf')
+        elevations = []
+        
+        for segment in self.segments:
+            if not segment.points:
+                continue
+            total_points += len(segment.points)
+            
+            # Accumulate per segment so the total matches summing
+            # calculate_distance() over the segments
+            total_distance += segment.calculate_distance()
+            
+            lats = segment.lat_array
+            lons = segment.lon_array
+            min_lat = min(min_lat, float(lats.min()))
+            max_lat = max(max_lat, float(lats.max()))
+            min_lon = min(min_lon, float(lons.min()))
+            max_lon = max(max_lon, float(lons.max()))
+            
+            timestamps = segment.ts_array
+            timestamps = timestamps[~np.isnat(timestamps)]
+            if timestamps.size:
+                first = timestamps.min()
+                last = timestamps.max()
+                if first_timestamp is None or first < first_timestamp:
+                    first_timestamp = first
+                if last_timestamp is None or last > last_timestamp:
+                    last_timestamp = last
+            
+            elevations.append(segment.ele_array)
+        
+        if first_timestamp is None:
+            duration = None
+        else:
+            duration = (last_timestamp - first_timestamp).item()
+        
+        if total_points:
+            bounds = (min_lat, max_lat, min_lon, max_lon)
+        else:
+            bounds = (0.0, 0.0, 0.0, 0.0)
+        
+        # Gain and loss run across segment boundaries, over every point that
+        # has an elevation
+        elevation_stats = None
+        if elevations:
+            elevation = np.concatenate(elevations)
+            elevation = elevation[~np.isnan(elevation)]
+            if elevation.size:
+                diffs = np.diff(elevation)
+                elevation_stats = {
+                    'min': float(elevation.min()),
+                    'max': float(elevation.max()),
+                    'gain': float(diffs[diffs > 0].sum()),
+                    'loss': float(np.abs(diffs[diffs < 0]).sum())
+                }
+        
+        return RouteStats(
+            total_points=total_points,
+            total_distance=total_distance,
+            total_duration=duration,
+            bounds=bounds,
+            elevation=elevation_stats
+        )
+    
+    def simplify(self, tolerance: float) -> "Route":
+        """
+        Simplify every segment of the route for drawing.
+        
+        The simplified route reports the statistics of this route, so
+        distances and durations shown with it are not affected.
+        
+        Args:
+            tolerance: Maximum deviation of dropped points, in degrees
+            
+        Returns:
+            A new simplified route, or this route if tolerance is not positive
+        """
+        if tolerance <= 0:
+            return self
+        
+        return Route(
+            segments=[segment.simplify(tolerance) for segment in self.segments],
+            name=self.name,
+            metadata=self.metadata,
+            simplified_from=self
+        )
     
     def get_total_distance(self) -> float:
         """
@@ -142,7 +407,7 @@ class Route:
         Returns:
             Total distance in meters
         """
-        return sum(segment.calculate_distance() for segment in self.segments)
+        return self.compute_stats().total_distance
     
     def get_total_duration(self) -> Optional[timedelta]:
         """
@@ -154,21 +419,7 @@ class Route:
         Returns:
             Total duration as timedelta if timestamps are available, None otherwise
         """
-        first_timestamp = None
-        last_timestamp = None
-        
-        for segment in self.segments:
-            for point in segment.points:
-                if point.timestamp is not None:
-                    if first_timestamp is None or point.timestamp < first_timestamp:
-                        first_timestamp = point.timestamp
-                    if last_timestamp is None or point.timestamp > last_timestamp:
-                        last_timestamp = point.timestamp
-        
-        if first_timestamp is None or last_timestamp is None:
-            return None
-            
-        return last_timestamp - first_timestamp
+        return self.compute_stats().total_duration
     
     def get_bounds(self) -> Tuple[float, float, float, float]:
         """
@@ -178,22 +429,7 @@ class Route:
             Tuple of (min_lat, max_lat, min_lon, max_lon)
             If the route has no points, returns (0, 0, 0, 0)
         """
-        min_lat = min_lon = float('inf')
-        max_lat = max_lon = float('-inf')
-        has_points = False
-        
-        for segment in self.segments:
-            for point in segment.points:
-                has_points = True
-                min_lat = min(min_lat, point.latitude)
-                max_lat = max(max_lat, point.latitude)
-                min_lon = min(min_lon, point.longitude)
-                max_lon = max(max_lon, point.longitude)
-        
-        if not has_points:
-            return (0.0, 0.0, 0.0, 0.0)
-            
-        return (min_lat, max_lat, min_lon, max_lon)
+        return self.compute_stats().bounds
     
     def get_elevation_stats(self) -> Optional[Dict[str, float]]:
         """
@@ -203,40 +439,26 @@ class Route:
             Dictionary with elevation stats (min, max, gain, loss)
             Returns None if no elevation data is available
         """
-        elevations = []
-        
-        for segment in self.segments:
-            for point in segment.points:
-                if point.elevation is not None:
-                    elevations.append(point.elevation)
-        
-        if not elevations:
-            return None
-            
-        # Calculate elevation gain and loss
-        gain = 0.0
-        loss = 0.0
-        
-        for i in range(1, len(elevations)):
-            diff = elevations[i] - elevations[i-1]
-            if diff > 0:
-                gain += diff
-            else:
-                loss -= diff
-                
-        return {
-            'min': min(elevations),
-            'max': max(elevations),
-            'gain': gain,
-            'loss': loss
-        }
+        return self.compute_stats().elevation
     
     def get_total_points(self) -> int:
         """
         Get the total number of points in the route.
         
+        Counting needs no statistics sweep, so this does not compute stats.
+        
         Returns:
             Total number of points across all segments
         """
         return sum(len(segment.points) for segment in self.segments)
 
+
+@dataclass(frozen=True)
+class RouteStats:
+    """Aggregate statistics for a route, as computed by Route.compute_stats."""
+    
+    total_points: int
+    total_distance: float
+    total_duration: Optional[timedelta]
+    bounds: Tuple[float, float, float, float]
+    elevation: Optional[Dict[str, float]]
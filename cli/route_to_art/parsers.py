@@ -3,15 +3,222 @@ GPX parsing functionality for the route-to-art tool.
 Provides classes for loading and validating GPX files.
 """
 
+import functools
+import hashlib
 import os
+import pickle
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-
-import gpxpy
-import gpxpy.gpx
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from route_to_art._version import __version__
+from route_to_art.logging import log_debug
 from route_to_art.models import Route, RoutePoint, RouteSegment
 
+# gpxpy pulls in urllib and the email package, so it is imported only by the
+# code that parses; quick-reject scans, cache hits and --help never load it
+if TYPE_CHECKING:
+    import gpxpy.gpx
+
+# GPX point elements and the containers whose names matter while streaming
+_POINT_TAGS = frozenset({"trkpt", "rtept", "wpt"})
+_METADATA_PARENTS = frozenset({"metadata", "gpx"})
+
+# Directory for pickled routes, so repeated commands on a file parse it once
+ROUTE_CACHE_DIR = os.path.expanduser("~/.cache/gpx-art/routes")
+
+# Most cached routes kept; the least recently written are removed beyond this
+ROUTE_CACHE_MAX_ENTRIES = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _get_iterparse() -> Callable[..., Iterator[Tuple[str, Any]]]:
+    """
+    Get the iterparse implementation used for streaming GPX files.
+    
+    lxml's C parser is used when installed; otherwise ElementTree's.
+    
+    Returns:
+        An iterparse function taking a path and an events tuple
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        return ET.iterparse
+    return etree.iterparse
+
+
+def _release(elem: Any) -> None:
+    """
+    Free a fully processed element during iterparse.
+    
+    Args:
+        elem: Element whose end event has been handled
+    """
+    elem.clear()
+    # lxml keeps cleared elements attached to the tree, so also detach the
+    # earlier siblings, which have all been handled by now
+    if hasattr(elem, "getprevious"):
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag."""
+    return tag.rpartition("}")[2]
+
+
+def iter_coordinates(filepath: str) -> Iterator[Tuple[bool, float, float]]:
+    """
+    Stream the coordinates of every point in a GPX file.
+    
+    Only the lat/lon attributes are read, so callers that just need the
+    geometry can stop early without building any route objects.
+    
+    Args:
+        filepath: Path to the GPX file
+        
+    Yields:
+        Tuples of (starts_segment, latitude, longitude), where starts_segment
+        is True for the first point of each track segment, route or run of
+        waypoints
+        
+    Raises:
+        ValueError: If the document is not GPX or a point is malformed
+        ET.ParseError: If the XML is malformed (lxml.etree.XMLSyntaxError with lxml)
+    """
+    # Open elements, so each point can be matched with its container
+    stack: List[ET.Element] = []
+    last_container = None
+    
+    for event, elem in _get_iterparse()(filepath, events=("start", "end")):
+        if event == "start":
+            if not stack and _local_name(elem.tag) != "gpx":
+                raise ValueError("Document must have a `gpx` root node")
+            stack.append(elem)
+            continue
+        
+        stack.pop()
+        tag = _local_name(elem.tag)
+        if tag in _POINT_TAGS and stack:
+            container = stack[-1]
+            if _local_name(container.tag) in ("trkseg", "rte", "gpx"):
+                yield (
+                    container is not last_container,
+                    float(elem.get("lat")),
+                    float(elem.get("lon"))
+                )
+                last_container = container
+            _release(elem)
+        elif tag in ("trkseg", "rte", "trk"):
+            _release(elem)
+
+
+def _route_cache_prefix(path: str) -> str:
+    """
+    Get the file name prefix of cached routes for a GPX file.
+    
+    The package version is part of the digest, so routes pickled by another
+    version of the models are never loaded.
+    
+    Args:
+        path: Absolute path to the GPX file
+        
+    Returns:
+        Prefix unique to the GPX file path and package version
+    """
+    digest = hashlib.blake2b(f"{__version__}:{path}".encode("utf-8"), digest_size=8).hexdigest()
+    return f"route-{digest}-"
+
+
+def route_cache_path(filepath: str) -> Optional[str]:
+    """
+    Get the cache path for a GPX file in its current state.
+    
+    The path is keyed on the file's absolute path, modification time and
+    size, so an edited file misses the cache.
+    
+    Args:
+        filepath: Path to the GPX file
+        
+    Returns:
+        Path of the cached route inside ROUTE_CACHE_DIR, or None if the file
+        cannot be stat'ed
+    """
+    path = os.path.abspath(filepath)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.join(
+        ROUTE_CACHE_DIR,
+        f"{_route_cache_prefix(path)}{stat.st_mtime_ns}-{stat.st_size}.pkl"
+    )
+
+
+def load_cached_route(cache_path: str) -> Optional[Route]:
+    """
+    Load a cached route, if present.
+    
+    Args:
+        cache_path: Path returned by route_cache_path
+        
+    Returns:
+        The cached Route, or None if it is missing or unreadable
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            route = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log_debug(f"Could not read route cache {cache_path}: {e}", module="parsers")
+        return None
+    return route if isinstance(route, Route) else None
+
+
+def store_cached_route(cache_path: str, route: Route) -> None:
+    """
+    Pickle a parsed route into the cache (best effort).
+    
+    Older cached routes of the same GPX file are removed, and the least
+    recently written routes of other files are removed to keep at most
+    ROUTE_CACHE_MAX_ENTRIES routes.
+    
+    Args:
+        cache_path: Path returned by route_cache_path
+        route: Route parsed from the file
+    """
+    try:
+        os.makedirs(ROUTE_CACHE_DIR, exist_ok=True)
+        # Strip the "<mtime>-<size>.pkl" tail to get the file's prefix
+        prefix = os.path.basename(cache_path).rsplit("-", 2)[0] + "-"
+        others = []
+        with os.scandir(ROUTE_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix):
+                    os.unlink(entry.path)
+                elif entry.name.endswith(".pkl"):
+                    others.append((entry.stat().st_mtime_ns, entry.path))
+        
+        # Make room for the new route
+        others.sort()
+        for _, path in others[:max(0, len(others) - ROUTE_CACHE_MAX_ENTRIES + 1)]:
+            os.unlink(path)
+        
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(route, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+    except Exception as e:
+        log_debug(f"Could not write route cache {cache_path}: {e}", module="parsers")
+
 
 class RouteParser:
     """Parser for GPX files with validation capabilities."""
@@ -25,39 +232,88 @@ class RouteParser:
         """
         self.filepath = filepath
         self._error: Optional[str] = None
-        self._gpx: Optional[gpxpy.gpx.GPX] = None
+        self._gpx: Optional["gpxpy.gpx.GPX"] = None
+        self._route: Optional[Route] = None
         self._parsed = False
 
-    def parse(self) -> Optional[gpxpy.gpx.GPX]:
+    def parse(self) -> Optional["gpxpy.gpx.GPX"]:
         """
         Parse the GPX file and return the parsed object.
 
         Returns:
             GPX object if parsing was successful, None otherwise
         """
+        # Reset state and check the file
+        if not self._start_parse():
+            return None
+
+        # Try to parse the file
+        try:
+            import gpxpy
+            with open(self.filepath, 'r') as gpx_file:
+                self._gpx = gpxpy.parse(gpx_file)
+                return self._gpx
+        except Exception as e:
+            self._error = f"Error parsing GPX file: {str(e)}"
+            return None
+
+    def parse_route(self, use_cache: bool = False) -> Optional[Route]:
+        """
+        Parse the GPX file straight into a Route.
+        
+        The XML is streamed with iterparse and each point is turned into a
+        RoutePoint as soon as its element ends, so the gpxpy document is
+        never built. The result matches to_route(parse()).
+
+        Args:
+            use_cache: Load the route from ROUTE_CACHE_DIR if this version of
+                the file was parsed before, and store it there otherwise
+
+        Returns:
+            Route object if parsing was successful, None otherwise
+        """
+        if not self._start_parse():
+            return None
+
+        cache_path = route_cache_path(self.filepath) if use_cache else None
+        if cache_path:
+            self._route = load_cached_route(cache_path)
+            if self._route is not None:
+                return self._route
+
+        try:
+            self._route = self._stream_route(self.filepath)
+            if cache_path:
+                store_cached_route(cache_path, self._route)
+            return self._route
+        except Exception as e:
+            self._error = f"Error parsing GPX file: {str(e)}"
+            return None
+
+    def _start_parse(self) -> bool:
+        """
+        Reset parser state and check that the file can be parsed.
+
+        Returns:
+            True if the file exists and has a .gpx extension, False otherwise
+        """
         # Reset state
         self._error = None
         self._gpx = None
+        self._route = None
         self._parsed = True
 
         # Check if file exists
         if not os.path.exists(self.filepath):
             self._error = f"File not found: {self.filepath}"
-            return None
+            return False
 
         # Check file extension
         if not self.filepath.lower().endswith('.gpx'):
             self._error = f"File is not a GPX file: {self.filepath}"
-            return None
+            return False
 
-        # Try to parse the file
-        try:
-            with open(self.filepath, 'r') as gpx_file:
-                self._gpx = gpxpy.parse(gpx_file)
-                return self._gpx
-        except Exception as e:
-            self._error = f"Error parsing GPX file: {str(e)}"
-            return None
+        return True
 
     def is_valid(self) -> bool:
         """
@@ -70,8 +326,8 @@ class RouteParser:
         if not self._parsed:
             self.parse()
 
-        # If there's an error or no GPX object, the file is invalid
-        return self._error is None and self._gpx is not None
+        # If there's an error or nothing was parsed, the file is invalid
+        return self._error is None and (self._gpx is not None or self._route is not None)
 
     def get_error(self) -> Optional[str]:
         """
@@ -119,7 +375,7 @@ class RouteParser:
         return RouteSegment(points=points)
     
     @classmethod
-    def _extract_metadata(cls, gpx: gpxpy.gpx.GPX) -> Dict:
+    def _extract_metadata(cls, gpx: "gpxpy.gpx.GPX") -> Dict:
         """
         Extract metadata from a gpxpy GPX object.
         
@@ -159,7 +415,7 @@ class RouteParser:
         return metadata
     
     @classmethod
-    def to_route(cls, gpx: gpxpy.gpx.GPX) -> Route:
+    def to_route(cls, gpx: "gpxpy.gpx.GPX") -> Route:
         """
         Convert a gpxpy GPX object to our internal Route model.
         
@@ -212,3 +468,131 @@ class RouteParser:
         # Create the route object
         return Route(segments=segments, name=route_name, metadata=metadata)
 
+    @staticmethod
+    def _stream_route(filepath: str) -> Route:
+        """
+        Stream a GPX file into a Route using iterparse.
+        
+        Segments are ordered as in to_route: tracks, then routes, then
+        waypoints, whatever their order in the document.
+        
+        Args:
+            filepath: Path to the GPX file
+            
+        Returns:
+            A Route object containing all data from the file
+            
+        Raises:
+            ValueError: If the document is not GPX or a point is malformed
+            ET.ParseError: If the XML is malformed (lxml.etree.XMLSyntaxError with lxml)
+        """
+        # gpxpy's own converters, so values read the same as through parse():
+        # blank <ele> text is an error, while an unparseable <time> is no time
+        from gpxpy.gpxfield import FLOAT_TYPE, TIME_TYPE
+        parse_float = FLOAT_TYPE.from_string
+        parse_time = TIME_TYPE.from_string
+        
+        track_segments: List[RouteSegment] = []
+        route_segments: List[RouteSegment] = []
+        waypoints: List[RoutePoint] = []
+        metadata: Dict = {}
+        track_name = rte_name = None
+        first_track_name = first_rte_name = None
+        points: List[RoutePoint] = []
+        current_track: List[RouteSegment] = []
+        
+        # Tag names of the open elements, for telling what a <name> belongs to
+        stack: List[str] = []
+        
+        for event, elem in _get_iterparse()(filepath, events=("start", "end")):
+            tag = _local_name(elem.tag)
+            
+            if event == "start":
+                if not stack and tag != "gpx":
+                    raise ValueError("Document must have a `gpx` root node")
+                stack.append(tag)
+                if tag == "trk":
+                    track_name = None
+                    current_track = []
+                elif tag in ("trkseg", "rte"):
+                    rte_name = None
+                    points = []
+                continue
+            
+            stack.pop()
+            parent = stack[-1] if stack else None
+            
+            if tag in _POINT_TAGS:
+                if parent not in ("trkseg", "rte", "gpx"):
+                    continue
+                elevation = timestamp = None
+                for child in elem:
+                    child_tag = _local_name(child.tag)
+                    if child_tag == "ele":
+                        elevation = parse_float(child.text)
+                    elif child_tag == "time":
+                        timestamp = parse_time(child.text)
+                point = RoutePoint(
+                    latitude=float(elem.get("lat")),
+                    longitude=float(elem.get("lon")),
+                    elevation=elevation,
+                    timestamp=timestamp
+                )
+                if tag == "wpt":
+                    waypoints.append(point)
+                else:
+                    points.append(point)
+                # Points are fully converted; drop their XML subtree
+                _release(elem)
+            elif tag == "trkseg":
+                current_track.append(RouteSegment(points=points))
+                _release(elem)
+            elif tag == "trk":
+                if track_name:
+                    first_track_name = first_track_name or track_name
+                    for segment in current_track:
+                        segment.name = track_name
+                track_segments.extend(current_track)
+                _release(elem)
+            elif tag == "rte":
+                if points:
+                    route_segments.append(RouteSegment(points=points, name=rte_name))
+                    if rte_name:
+                        first_rte_name = first_rte_name or rte_name
+                _release(elem)
+            elif tag == "name":
+                if parent == "trk":
+                    track_name = elem.text
+                elif parent == "rte":
+                    rte_name = elem.text
+                elif parent in _METADATA_PARENTS and elem.text:
+                    metadata["name"] = elem.text
+                elif parent == "author" and len(stack) >= 2 and stack[-2] == "metadata" and elem.text:
+                    metadata["author"] = elem.text
+            elif parent in _METADATA_PARENTS:
+                if tag == "desc" and elem.text:
+                    metadata["description"] = elem.text
+                elif tag == "author" and parent == "gpx" and elem.text:
+                    # GPX 1.0 keeps the author name as text
+                    metadata["author"] = elem.text
+                elif tag == "time" and (timestamp := parse_time(elem.text)):
+                    metadata["time"] = timestamp
+                elif tag == "keywords" and elem.text:
+                    metadata["keywords"] = elem.text
+                elif tag == "bounds":
+                    metadata["bounds"] = {
+                        'min_latitude': float(elem.get("minlat")),
+                        'max_latitude': float(elem.get("maxlat")),
+                        'min_longitude': float(elem.get("minlon")),
+                        'max_longitude': float(elem.get("maxlon"))
+                    }
+        
+        segments = track_segments + route_segments
+        if waypoints:
+            segments.append(RouteSegment(points=waypoints, name="Waypoints"))
+        
+        return Route(
+            segments=segments,
+            name=first_track_name or first_rte_name,
+            metadata=metadata
+        )
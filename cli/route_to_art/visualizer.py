@@ -17,7 +17,7 @@ import matplotlib.patches as patches
 from matplotlib.figure import Figure
 from matplotlib.text import Text
 
-from route_to_art.models import Route, RoutePoint, RouteSegment
+from route_to_art.models import Route, RoutePoint, RouteSegment, haversine_array, pairwise
 
 
 class OverlayPosition(Enum):
@@ -99,24 +99,20 @@ class OverlayFormatter:
         if not duration:
             return "Unknown duration"
         
-        days = duration.days
-        hours, remainder = divmod(duration.seconds, 3600)
+        # One integer divmod chain over the whole seconds
+        days, remainder = divmod(int(duration.total_seconds()), 86400)
+        hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
         
-        parts = []
+        # Larger units are shown down to minutes once present, and seconds
+        # only for durations under an hour
         if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0 or days > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0 or hours > 0 or days > 0:
-            parts.append(f"{minutes}m")
-        if seconds > 0 and not (hours > 0 or days > 0):
-            parts.append(f"{seconds}s")
-            
-        if not parts:
-            parts = ["0m"]
-            
-        return " ".join(parts)
+            return f"{days}d {hours}h {minutes}m"
+        if hours > 0:
+            return f"{hours}h {minutes}m"
+        if minutes > 0:
+            return f"{minutes}m {seconds}s" if seconds > 0 else f"{minutes}m"
+        return f"{seconds}s" if seconds > 0 else "0m"
     
     @staticmethod
     def format_elevation(stats: Optional[Dict[str, float]]) -> str:
@@ -292,24 +288,45 @@ class RouteVisualizer:
         
         return self._figure
     
-    def _get_projected_coordinates(self, segment: RouteSegment) -> Tuple[List[float], List[float]]:
+    def use_figure(self, figure: Figure) -> Figure:
         """
-        Convert route segment coordinates to projected coordinates.
+        Draw on an existing figure instead of creating a new one.
+        
+        The figure's axes are cleared and set up as in create_figure, so a
+        figure from an earlier route can be reused without rebuilding the
+        figure, canvas and axes.
         
         Args:
-            segment: The RouteSegment to project
+            figure: Figure previously returned by create_figure
             
         Returns:
-            Tuple of (x_coords, y_coords) lists in projected coordinates
+            The same Figure object
+        """
+        self._figure = figure
+        self._ax = figure.axes[0] if figure.axes else figure.add_subplot(111)
+        
+        # clear() also resets the aspect and axis visibility
+        self._ax.clear()
+        self._ax.set_aspect('equal')
+        self._ax.axis('off')
+        
+        return figure
+    
+    def _get_projected_coordinates(self, segment: RouteSegment) -> Tuple[np.ndarray, np.ndarray]:
         """
-        x_coords = []
-        y_coords = []
+        Convert route segment coordinates to projected coordinates.
+        
+        Projects the segment's coordinate arrays in one NumPy pass,
+        using the same formula as mercator_projection.
         
-        for point in segment.points:
-            x, y = mercator_projection(point.latitude, point.longitude)
-            x_coords.append(x)
-            y_coords.append(y)
+        Args:
+            segment: The RouteSegment to project
             
+        Returns:
+            Tuple of (x_coords, y_coords) arrays in projected coordinates
+        """
+        x_coords = np.radians(segment.lon_array)
+        y_coords = np.log(np.tan(np.pi / 4 + np.radians(segment.lat_array) / 2))
         return x_coords, y_coords
     
     def _validate_color(self, color: str) -> str:
@@ -387,26 +404,19 @@ class RouteVisualizer:
         Returns:
             List of distances in meters
         """
-        if len(segment.points) < 2:
-            return [0.0] * len(segment.points)
-            
-        distances = [0.0]  # First point is at distance 0
-        cumulative_distance = 0.0
-        
-        for i in range(1, len(segment.points)):
-            p1 = segment.points[i-1]
-            p2 = segment.points[i]
-            
-            # Calculate distance between consecutive points
-            point_distance = haversine_distance(
-                p1.latitude, p1.longitude, p2.latitude, p2.longitude
-            )
-            
-            # Add to cumulative distance
-            cumulative_distance += point_distance
-            distances.append(cumulative_distance)
-            
-        return distances
+        n_points = len(segment.points)
+        if n_points < 2:
+            return [0.0] * n_points
+        
+        # Distances between consecutive points from the coordinate arrays,
+        # accumulated with the first point at distance 0
+        lats = segment.lat_array
+        lons = segment.lon_array
+        steps = haversine_array(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        distances = np.empty(len(lats))
+        distances[0] = 0.0
+        np.cumsum(steps, out=distances[1:])
+        return distances.tolist()
     
     def _find_marker_positions(
         self, 
@@ -450,14 +460,9 @@ class RouteVisualizer:
         
         for marker_distance in marker_distances:
             # Find the points that bracket this distance
-            for i in range(1, len(distances_unit)):
-                if distances_unit[i-1] <= marker_distance <= distances_unit[i]:
+            for (p1, p2), (d1, d2) in zip(pairwise(segment.points), pairwise(distances_unit)):
+                if d1 <= marker_distance <= d2:
                     # Found the bracketing points
-                    p1 = segment.points[i-1]
-                    p2 = segment.points[i]
-                    d1 = distances_unit[i-1]
-                    d2 = distances_unit[i]
-                    
                     # Interpolate between the points
                     ratio = (marker_distance - d1) / (d2 - d1) if d2 != d1 else 0
                     
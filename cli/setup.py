@@ -2,7 +2,6 @@ from setuptools import setup, find_packages
 
 setup(
     name="route-to-art",
-    version="0.1.0",
     description="Transform GPS routes into artwork",
     author="GPX Art Generator Team",
     packages=find_packages(),
@@ -11,6 +10,14 @@ setup(
         "click>=8.0",
         "gpxpy>=1.6.0",
     ],
+    extras_require={
+        # Faster PNG encoding via libpng; used automatically when installed
+        "opencv": ["opencv-python-headless"],
+        # Multithreaded PNG encoding via libvips; preferred over OpenCV
+        "vips": ["pyvips"],
+        # Faster streaming GPX parsing for info and validate; used automatically when installed
+        "lxml": ["lxml"],
+    },
     entry_points={
         'console_scripts': [
             'route-to-art=route_to_art.main:cli',
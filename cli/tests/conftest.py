@@ -0,0 +1,13 @@
+"""
+Shared fixtures for the route-to-art tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def route_cache_dir(tmp_path, monkeypatch):
+    """Keep cached routes out of the user's cache directory and between tests."""
+    cache_dir = tmp_path / "route-cache"
+    monkeypatch.setattr("route_to_art.parsers.ROUTE_CACHE_DIR", str(cache_dir))
+    return cache_dir
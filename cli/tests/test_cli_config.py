@@ -7,8 +7,9 @@ from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
 from pathlib import Path
 
-from route_to_art.main import cli, get_config, get_effective_options
+from route_to_art.main import ConvertOptions, cli, get_config, get_effective_options
 from route_to_art.config import Config, ConfigError
+from route_to_art import exceptions
 
 
 @pytest.fixture
@@ -114,9 +115,8 @@ def mock_gpx_parser():
         MockParser.return_value = parser_instance
         
         # Set up the mock parser to return a valid route
-        parser_instance.parse.return_value = True
         route_mock = MagicMock()
-        parser_instance.to_route.return_value = route_mock
+        parser_instance.parse_route.return_value = route_mock
         
         # Set up the route to have segments
         route_mock.segments = [MagicMock()]
@@ -196,6 +196,16 @@ class TestEffectiveOptions:
         config3 = get_config("some/path")
         assert config3 is not config1
     
+    def test_get_config_reuses_loaded_file(self, mock_config, valid_config_file):
+        """Test that asking for the loaded config file again skips reloading."""
+        config1 = get_config(valid_config_file)
+        
+        with patch('route_to_art.main.Config.get_shared') as mock_get_shared:
+            config2 = get_config(valid_config_file)
+        
+        assert config2 is config1
+        mock_get_shared.assert_not_called()
+    
     def test_config_defaults_used(self):
         """Test that config default values are used correctly."""
         # Mock the Config class to return known defaults
@@ -211,13 +221,13 @@ class TestEffectiveOptions:
                 "formats": ["png", "svg"]
             }
         }
-        mock_config.get.side_effect = lambda key, default=None: {
-            "defaults.thickness": "thick",
-            "defaults.color": "#FF5500",
-            "defaults.markers.enabled": True,
-            "defaults.markers.unit": "km",
-            "defaults.export.formats": ["png", "svg"]
-        }.get(key, default)
+        mock_config.flat_defaults.return_value = {
+            "thickness": "thick",
+            "color": "#FF5500",
+            "markers.enabled": True,
+            "markers.unit": "km",
+            "export.formats": ["png", "svg"]
+        }
         
         with patch('route_to_art.main.get_config', return_value=mock_config):
             options = get_effective_options(None, {
@@ -243,10 +253,10 @@ class TestEffectiveOptions:
             "thickness": "thick",
             "color": "#FF5500"
         }
-        mock_config.get.side_effect = lambda key, default=None: {
-            "defaults.thickness": "thick",
-            "defaults.color": "#FF5500"
-        }.get(key, default)
+        mock_config.flat_defaults.return_value = {
+            "thickness": "thick",
+            "color": "#FF5500"
+        }
         
         with patch('route_to_art.main.get_config', return_value=mock_config):
             options = get_effective_options(None, {
@@ -259,13 +269,34 @@ class TestEffectiveOptions:
             # But thickness still comes from config
             assert options["thickness"] == "thick"
     
+    def test_convert_options_dataclass(self):
+        """Test that ConvertOptions and an equivalent dict merge the same way."""
+        mock_config = MagicMock()
+        mock_config.get_defaults.return_value = {"thickness": "thick"}
+        mock_config.flat_defaults.return_value = {
+            "thickness": "thick",
+            "color": "#FF5500"
+        }
+        
+        with patch('route_to_art.main.get_config', return_value=mock_config):
+            from_dataclass = get_effective_options(None, ConvertOptions(color="#0000FF", dpi=150))
+            from_dict = get_effective_options(None, {"color": "#0000FF", "dpi": 150})
+            # Keys that are not convert options are rejected, not dropped
+            with pytest.raises(exceptions.ConfigError, match="input_file"):
+                get_effective_options(None, {"color": "#0000FF", "input_file": "route.gpx"})
+        
+        assert from_dataclass == from_dict
+        assert from_dataclass["color"] == "#0000FF"
+        assert from_dataclass["thickness"] == "thick"
+        assert from_dataclass["dpi"] == 150
+    
     def test_overlay_fields_conversion(self):
         """Test that overlay fields list is converted to comma-separated string."""
         mock_config = MagicMock()
         mock_config.get_defaults.return_value = {}
-        mock_config.get.side_effect = lambda key, default=None: {
-            "defaults.overlay.fields": ["distance", "elevation", "name"]
-        }.get(key, default)
+        mock_config.flat_defaults.return_value = {
+            "overlay.fields": ["distance", "elevation", "name"]
+        }
         
         with patch('route_to_art.main.get_config', return_value=mock_config):
             options = get_effective_options(None, {
@@ -279,9 +310,9 @@ class TestEffectiveOptions:
         """Test that export formats list is converted to comma-separated string."""
         mock_config = MagicMock()
         mock_config.get_defaults.return_value = {}
-        mock_config.get.side_effect = lambda key, default=None: {
-            "defaults.export.formats": ["png", "svg", "pdf"]
-        }.get(key, default)
+        mock_config.flat_defaults.return_value = {
+            "export.formats": ["png", "svg", "pdf"]
+        }
         
         with patch('route_to_art.main.get_config', return_value=mock_config):
             options = get_effective_options(None, {
@@ -319,14 +350,14 @@ class TestConvertCommand:
         # Mock the Config class
         mock_config = MagicMock()
         mock_config.get_defaults.return_value = config_data["defaults"]
-        mock_config.get.side_effect = lambda key, default=None: {
-            "defaults.thickness": "thick",
-            "defaults.color": "#FF5500",
-            "defaults.style": "dashed",
-            "defaults.markers.enabled": True,
-            "defaults.markers.unit": "km",
-            "defaults.export.formats": ["png", "svg"]
-        }.get(key, default)
+        mock_config.flat_defaults.return_value = {
+            "thickness": "thick",
+            "color": "#FF5500",
+            "style": "dashed",
+            "markers.enabled": True,
+            "markers.unit": "km",
+            "export.formats": ["png", "svg"]
+        }
         
         with patch('route_to_art.main.get_config', return_value=mock_config):
             output_path = tmp_path / "output"
@@ -370,11 +401,11 @@ class TestConvertCommand:
         # Mock the Config class
         mock_config = MagicMock()
         mock_config.get_defaults.return_value = config_data["defaults"]
-        mock_config.get.side_effect = lambda key, default=None: {
-            "defaults.thickness": "thick",
-            "defaults.color": "#FF5500",
-            "defaults.style": "dashed"
-        }.get(key, default)
+        mock_config.flat_defaults.return_value = {
+            "thickness": "thick",
+            "color": "#FF5500",
+            "style": "dashed"
+        }
         
         with patch('route_to_art.main.get_config', return_value=mock_config):
             output_path = tmp_path / "output"
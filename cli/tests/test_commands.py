@@ -5,6 +5,7 @@ Tests for CLI commands.
 import os
 import tempfile
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -13,7 +14,10 @@ from click.testing import CliRunner
 from PIL import Image
 
 from route_to_art.exporters import ExportError
-from route_to_art.main import cli, convert, info, validate
+from route_to_art.main import (
+    cli, convert, format_duration, info, validate, validate_all,
+    validate_coordinates, validate_segments, validate_timestamps
+)
 from route_to_art.models import Route, RoutePoint, RouteSegment
 
 
@@ -247,8 +251,177 @@ def test_validate_empty_file(runner, empty_gpx_file):
     assert "Route has no segments" in result.output
 
 
+def test_validate_coordinates_extreme_latitude():
+    """Test that only points beyond 85 degrees latitude are reported."""
+    route = Route(segments=[
+        RouteSegment(points=[RoutePoint(latitude=10.0, longitude=0.0)]),
+        RouteSegment(points=[
+            RoutePoint(latitude=45.0, longitude=0.0),
+            RoutePoint(latitude=-86.5, longitude=0.0),
+            RoutePoint(latitude=85.0, longitude=0.0),
+        ]),
+    ])
+    
+    issues = validate_coordinates(route)
+    
+    assert len(issues) == 1
+    assert issues[0].startswith("Point 2 in segment 2 has extreme latitude (-86.5)")
+
+
+def test_validate_timestamps_issues():
+    """Test the missing, out-of-order and duplicate timestamp checks."""
+    base = datetime(2023, 1, 1, 12, 0, 0)
+    route = Route(segments=[
+        # No timestamps at all: nothing to check
+        RouteSegment(points=[RoutePoint(latitude=0.0, longitude=0.0)] * 2),
+        RouteSegment(points=[
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base + timedelta(minutes=2)),
+            RoutePoint(latitude=0.0, longitude=0.0),
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base + timedelta(minutes=1)),
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base + timedelta(minutes=1)),
+        ]),
+        RouteSegment(points=[
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base),
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base + timedelta(seconds=1)),
+        ]),
+        # Complete and sorted, but with a repeated timestamp
+        RouteSegment(points=[
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base),
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base),
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base + timedelta(seconds=1)),
+        ]),
+        # Sorted around a gap, with the repeat on either side of it
+        RouteSegment(points=[
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base),
+            RoutePoint(latitude=0.0, longitude=0.0),
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base),
+        ]),
+    ])
+    
+    issues = validate_timestamps(route)
+    
+    assert issues == [
+        "Segment 2 has inconsistent timestamps (some points missing timestamp data)",
+        "Segment 2 has duplicate timestamps",
+        "Segment 4 has duplicate timestamps",
+        "Segment 5 has inconsistent timestamps (some points missing timestamp data)",
+        "Segment 5 has duplicate timestamps",
+    ]
+
+
+
+def test_validate_with_executor_keeps_segment_order():
+    """Test that validating on a thread pool reports issues in segment order."""
+    base = datetime(2023, 1, 1, 12, 0, 0)
+    route = Route(segments=[
+        RouteSegment(points=[
+            RoutePoint(latitude=86.0 + i / 10, longitude=0.0, timestamp=base),
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base),
+        ])
+        for i in range(12)
+    ])
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        coordinate_issues = validate_coordinates(route, executor)
+        timestamp_issues = validate_timestamps(route, executor)
+    
+    assert coordinate_issues == validate_coordinates(route)
+    assert timestamp_issues == validate_timestamps(route)
+    assert [issue.split()[1] for issue in timestamp_issues] == [str(i + 1) for i in range(12)]
+
+
+
+def test_validate_all_matches_individual_validators():
+    """Test the fused validation pass against the separate validators."""
+    base = datetime(2023, 1, 1, 12, 0, 0)
+    route = Route(segments=[
+        RouteSegment(points=[]),
+        RouteSegment(points=[RoutePoint(latitude=88.0, longitude=0.0, timestamp=base)]),
+        RouteSegment(points=[
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=base),
+            RoutePoint(latitude=-89.0, longitude=0.0, timestamp=base),
+        ]),
+    ])
+    
+    assert validate_all(route) == (
+        validate_segments(route),
+        validate_coordinates(route),
+        validate_timestamps(route),
+    )
+    assert validate_all(Route()) == (["Route has no segments"], [], [])
+
+
+def test_format_duration():
+    """Test duration formatting across day, hour and second boundaries."""
+    assert format_duration(None) == "Unknown"
+    assert format_duration(timedelta(seconds=45)) == "45 seconds"
+    long_duration = timedelta(days=1, hours=2, minutes=1, seconds=5)
+    assert format_duration(long_duration) == "1 day, 2 hours, 1 minute"
+    assert format_duration(timedelta(days=3, microseconds=999999)) == "3 days"
+
+
+def _write_track(path, coords):
+    """Write a single-segment GPX track with the given (lat, lon) points."""
+    points = "".join(f'<trkpt lat="{lat}" lon="{lon}"/>' for lat, lon in coords)
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<gpx version="1.1" creator="gpx-art-test"><trk><trkseg>{points}</trkseg></trk></gpx>'
+    )
+    return str(path)
+
+
+def test_validate_quick_reject(runner, valid_gpx_file, tmp_path):
+    """Test --quick-reject exits with status 2 for out-of-bounds routes."""
+    result = runner.invoke(validate, ["--quick-reject", valid_gpx_file])
+    assert result.exit_code == 2
+    assert "shorter than" in result.output
+    
+    too_long = _write_track(tmp_path / "long.gpx", [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)])
+    result = runner.invoke(validate, ["--quick-reject", too_long])
+    assert result.exit_code == 2
+    assert "longer than" in result.output
+    
+    sparse = _write_track(tmp_path / "sparse.gpx", [(0.0, 0.0), (0.01, 0.0), (0.02, 0.0)])
+    result = runner.invoke(validate, ["--quick-reject", sparse])
+    assert result.exit_code == 2
+    assert "fewer than one per 100 m" in result.output
+    
+    # About 1 km at one point every 50 m passes on to the full validation
+    dense = _write_track(tmp_path / "dense.gpx", [(i * 0.00045, 0.0) for i in range(21)])
+    result = runner.invoke(validate, ["--quick-reject", dense])
+    assert result.exit_code == 0
+    assert "Route data is valid" in result.output
+
+
 # Tests for the convert command
 
+def test_convert_batch_reuses_figure(runner, valid_gpx_file, tmp_path):
+    """Test convert-batch converts each manifest row on a single figure."""
+    from route_to_art.visualizer import RouteVisualizer
+    
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text(
+        "# input,output\n"
+        f"{valid_gpx_file},{tmp_path / 'first.png'}\n"
+        "\n"
+        f"{valid_gpx_file}, {tmp_path / 'second.svg'}\n"
+        f"{tmp_path / 'missing.gpx'},{tmp_path / 'third.png'}\n"
+    )
+    
+    with patch.object(
+        RouteVisualizer, "create_figure", autospec=True,
+        side_effect=RouteVisualizer.create_figure
+    ) as create_figure:
+        result = runner.invoke(cli, ["--no-log-file", "convert-batch", str(manifest)])
+    
+    assert result.exit_code == 1
+    assert "Converted 2 of 3 files" in result.output
+    assert (tmp_path / "first.png").exists()
+    assert (tmp_path / "second.svg").exists()
+    assert not (tmp_path / "third.png").exists()
+    assert create_figure.call_count == 1
+
+
 def test_convert_invalid_extension(runner, valid_gpx_file):
     """Test convert command with invalid output file extension."""
     # Use .jpg extension which is not supported
@@ -97,6 +97,22 @@ class TestConfig:
         assert config.get("defaults.markers.unit") == "miles"
         assert config.get("defaults.export.formats") == ["png"]
     
+    def test_default_config_is_copied(self):
+        """Test that edits to a config loaded from defaults never reach DEFAULT_CONFIG."""
+        config = Config(config_path="/non/existent/path.yml")
+
+        config.config["defaults"]["markers"]["unit"] = "km"
+        config.get("defaults.overlay.fields").append("name")
+        defaults = config.get_defaults()
+        defaults["color"] = "#FFFFFF"
+        defaults["export"]["formats"].append("svg")
+        
+        assert config.get("defaults.color") == "#000000"
+        assert config.get("defaults.export.formats") == ["png"]
+        assert Config.DEFAULT_CONFIG["defaults"]["markers"]["unit"] == "miles"
+        assert Config.DEFAULT_CONFIG["defaults"]["overlay"]["fields"] == ["distance", "date"]
+        assert Config(config_path="/non/existent/path.yml").get_defaults() == Config.DEFAULT_CONFIG["defaults"]
+
     def test_load_valid_config(self, valid_config_file):
         """Test loading a valid configuration file."""
         config = Config(config_path=valid_config_file)
@@ -125,14 +141,27 @@ class TestConfig:
         
         # Test home directory discovery
         monkeypatch.delenv("GPX_ART_CONFIG")
-        home_dir = os.path.expanduser("~")
-        home_config_dir = os.path.join(home_dir, ".gpx-art")
-        monkeypatch.setattr(os.path, "exists", lambda path: path == os.path.join(home_config_dir, "config.yml"))
-        monkeypatch.setattr(Config, "load_config", lambda self: {"defaults": {"thickness": "thin"}})
+        monkeypatch.setattr("route_to_art.config._HOME_CONFIG", valid_config_file)
         config = Config()
         
         # Check that the correct path is used
-        assert config.get_default_path() == os.path.join(home_config_dir, "config.yml")
+        assert config.get_default_path() == valid_config_file
+        assert config.get("defaults.thickness") == "thick"
+        
+        # Test current directory discovery when the home config is missing
+        cwd_config = os.path.join(os.path.dirname(valid_config_file), "gpx-art.yml")
+        with open(cwd_config, "w") as f:
+            yaml.dump({"defaults": {"thickness": "thin"}}, f)
+        monkeypatch.setattr("route_to_art.config._HOME_CONFIG", "/non/existent/config.yml")
+        monkeypatch.chdir(os.path.dirname(valid_config_file))
+        config = Config()
+        
+        assert config.get_default_path() == "./gpx-art.yml"
+        assert config.get("defaults.thickness") == "thin"
+        
+        # Fall back to the home location when nothing exists
+        os.remove(cwd_config)
+        assert Config().get_default_path() == "/non/existent/config.yml"
     
     def test_invalid_config(self, invalid_config_file):
         """Test validation of invalid configuration values."""
@@ -154,6 +183,26 @@ class TestConfig:
             Config(config_path=invalid_config_file)
         assert "Invalid markers.unit: meters" in str(exc_info.value)
     
+    @pytest.mark.parametrize("defaults, message", [
+        ({"markers": "big"}, "markers must be a dictionary"),
+        ({"style": "dotted"}, "Invalid style: dotted. Valid values: dashed, solid"),
+        ({"overlay": {"fields": "distance"}}, "overlay.fields must be a list"),
+        ({"overlay": {"fields": ["distance", "speed"]}}, "Invalid overlay.fields: speed"),
+        ({"export": {"formats": ["gif"]}}, "Invalid export.formats: gif"),
+        ({"export": {"width": "wide"}}, "export.width must be a number"),
+        ({"export": {"height": 0}}, "export.height must be positive"),
+        ({"export": {"dpi": 72.5}}, "export.dpi must be an integer"),
+    ])
+    def test_validation_messages(self, temp_config_dir, defaults, message):
+        """Test the error reported for each kind of invalid value."""
+        config_path = temp_config_dir.join("config.yml")
+        with open(config_path, "w") as f:
+            yaml.dump({"defaults": defaults}, f)
+
+        with pytest.raises(ConfigError) as exc_info:
+            Config(config_path=str(config_path))
+        assert message in str(exc_info.value)
+
     def test_malformed_yaml(self, malformed_config_file):
         """Test handling of malformed YAML files."""
         with pytest.raises(ConfigError) as exc_info:
@@ -214,6 +263,89 @@ class TestConfig:
         assert merged["defaults"]["markers"]["enabled"] is True
         assert merged["defaults"]["markers"]["interval"] == 1.0
     
+    def test_merge_flat_overrides(self):
+        """Test merging a user config that only overrides top-level defaults."""
+        config = Config()
+        merged = config.merge_with_defaults({"defaults": {"color": "#ff0000", "style": "dashed"}})
+
+        assert merged["defaults"]["color"] == "#ff0000"
+        assert merged["defaults"]["style"] == "dashed"
+        assert merged["defaults"]["thickness"] == "medium"
+        assert merged["defaults"]["markers"] == Config.DEFAULT_CONFIG["defaults"]["markers"]
+        assert merged["defaults"]["markers"] is not Config.DEFAULT_CONFIG["defaults"]["markers"]
+
+        # A non-dict value replaces a nested section, as in the recursive merge
+        merged = config.merge_with_defaults({"defaults": {"markers": None}})
+        assert merged["defaults"]["markers"] is None
+
+    def test_merge_does_not_share_default_state(self):
+        """Test that merged configs never alias the class-level defaults."""
+        config = Config()
+        merged = config.merge_with_defaults({"defaults": {"thickness": "thin"}})
+
+        merged["defaults"]["overlay"]["fields"].append("name")
+        merged["defaults"]["markers"]["unit"] = "km"
+
+        assert Config.DEFAULT_CONFIG["defaults"]["overlay"]["fields"] == ["distance", "date"]
+        assert Config.DEFAULT_CONFIG["defaults"]["markers"]["unit"] == "miles"
+        assert config.merge_with_defaults({}) == Config.DEFAULT_CONFIG
+
+    def test_merge_with_substituted_defaults(self, monkeypatch):
+        """Test that a substituted DEFAULT_CONFIG is still deep-copied."""
+        custom_defaults = {"defaults": {"thickness": "thin", "export": {"formats": ["svg"]}}}
+        monkeypatch.setattr(Config, "DEFAULT_CONFIG", custom_defaults)
+
+        merged = Config(config_path="/non/existent/path.yml").merge_with_defaults({})
+        merged["defaults"]["export"]["formats"].append("pdf")
+
+        assert custom_defaults["defaults"]["export"]["formats"] == ["svg"]
+
+    def test_yaml_parse_is_cached(self, valid_config_file):
+        """Test that an unchanged config file is only parsed once."""
+        Config.clear_cache()
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            first = Config(config_path=valid_config_file)
+            second = Config(config_path=valid_config_file)
+
+        assert mock_load.call_count == 1
+        assert first.get("defaults.thickness") == second.get("defaults.thickness") == "thick"
+
+        # Mutating one instance must not leak into the cached parse
+        first.get("defaults.overlay.fields").append("name")
+        assert Config(config_path=valid_config_file).get("defaults.overlay.fields") == ["distance", "elevation"]
+
+    def test_yaml_cache_invalidated_on_change(self, valid_config_file):
+        """Test that editing the config file invalidates the cached parse."""
+        Config.clear_cache()
+        assert Config(config_path=valid_config_file).get("defaults.thickness") == "thick"
+
+        with open(valid_config_file, "w") as f:
+            yaml.dump({"defaults": {"thickness": "thin"}}, f)
+
+        assert Config(config_path=valid_config_file).get("defaults.thickness") == "thin"
+
+    def test_config_removed_after_stat(self, valid_config_file):
+        """Test that a config file deleted before it is read falls back to defaults."""
+        with patch("route_to_art.config._parse_yaml_cached", side_effect=FileNotFoundError):
+            config = Config(config_path=valid_config_file)
+
+        assert config.get("defaults.thickness") == Config.DEFAULT_CONFIG["defaults"]["thickness"]
+
+    def test_get_shared_reuses_instance(self, valid_config_file):
+        """Test that shared configs are reused until the file changes."""
+        Config.clear_cache()
+        shared = Config.get_shared(valid_config_file)
+        assert Config.get_shared(valid_config_file) is shared
+
+        with open(valid_config_file, "w") as f:
+            yaml.dump({"defaults": {"thickness": "thin"}}, f)
+        stat = os.stat(valid_config_file)
+        os.utime(valid_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reloaded = Config.get_shared(valid_config_file)
+        assert reloaded is not shared
+        assert reloaded.get("defaults.thickness") == "thin"
+
     def test_get_method(self, valid_config_file):
         """Test getting configuration values with dot notation."""
         config = Config(config_path=valid_config_file)
@@ -226,6 +358,35 @@ class TestConfig:
         assert config.get("non.existent.key") is None
         assert config.get("non.existent.key", "default") == "default"
     
+    def test_get_cache_reset_on_config_change(self, valid_config_file):
+        """Test that replacing the config invalidates cached lookups."""
+        config = Config(config_path=valid_config_file)
+        assert config.get("defaults.thickness") == "thick"
+        assert config.get("defaults.markers")["unit"] == "km"
+        assert config.get("defaults.thickness.extra") is None
+        assert config.get("defaults.missing", "fallback") == "fallback"
+
+        config.config = {"defaults": {"thickness": "thin", "missing": None}}
+        assert config.get("defaults.thickness") == "thin"
+        assert config.get("defaults.missing", "fallback") is None
+
+    def test_in_place_edits_seen_by_get(self, valid_config_file):
+        """Test that in-place edits to a loaded config are not hidden by the lookup tables."""
+        config = Config(config_path=valid_config_file)
+        assert config.get("defaults.color") == "#FF5500"
+        assert config.flat_defaults()["color"] == "#FF5500"
+        
+        config.config["defaults"]["color"] = "#FFFFFF"
+        assert config.get("defaults.color") == "#FFFFFF"
+        assert config.flat_defaults()["color"] == "#FFFFFF"
+        
+        config.get("defaults.markers")["unit"] = "miles"
+        assert config.get("defaults.markers.unit") == "miles"
+        
+        config.config["defaults"]["overlay"] = {"fields": ["name"]}
+        assert config.get("defaults.overlay.fields") == ["name"]
+        assert config.get("defaults.overlay.position") is None
+    
     def test_get_defaults(self, valid_config_file):
         """Test getting the defaults section."""
         config = Config(config_path=valid_config_file)
@@ -235,6 +396,20 @@ class TestConfig:
         assert defaults["color"] == "#FF5500"
         assert defaults["markers"]["unit"] == "km"
     
+    def test_flat_defaults(self, valid_config_file):
+        """Test the pre-flattened defaults table."""
+        config = Config(config_path=valid_config_file)
+        flat = config.flat_defaults()
+        
+        assert flat["thickness"] == "thick"
+        assert flat["markers.unit"] == "km"
+        assert flat["export.formats"] == ["png", "svg"]
+        assert "markers" not in flat
+        assert flat is config.flat_defaults()
+        
+        config.config = {"defaults": {"thickness": "thin"}}
+        assert dict(config.flat_defaults()) == {"thickness": "thin"}
+    
     def test_generate_sample(self):
         """Test generating a sample configuration file."""
         config = Config()
@@ -249,3 +424,10 @@ class TestConfig:
         assert "overlay" in parsed["defaults"]
         assert "export" in parsed["defaults"]
 
+    def test_generate_sample_is_cached(self, monkeypatch):
+        """Test that the built-in sample is rendered once and substituted defaults are not."""
+        assert Config.generate_sample() is Config.generate_sample()
+
+        monkeypatch.setattr(Config, "DEFAULT_CONFIG", {"defaults": {"thickness": "thin"}})
+        assert yaml.safe_load(Config.generate_sample()) == {"defaults": {"thickness": "thin"}}
+
@@ -5,6 +5,7 @@ Tests for error handling and logging functionality.
 import os
 import tempfile
 import logging
+import threading
 from unittest.mock import patch, MagicMock, mock_open
 
 import pytest
@@ -18,7 +19,7 @@ from route_to_art.exceptions import (
 from route_to_art.logging import (
     configure_for_cli, log_info, log_debug, log_error, 
     log_exception, log_warning, log_route_art_error, 
-    setup_logging
+    setup_logging, get_module_logger
 )
 
 
@@ -38,6 +39,36 @@ def test_setup_logging_file_errors():
         mock_stream.assert_called_once()
 
 
+def test_setup_logging_reuses_identical_configuration(tmp_path):
+    """Test that repeating setup_logging with the same arguments keeps the handlers."""
+    logger = setup_logging(log_dir=str(tmp_path), console=False)
+    try:
+        handlers = list(logger.handlers)
+        assert setup_logging(log_dir=str(tmp_path), console=False) is logger
+        assert logger.handlers == handlers
+        
+        # Different arguments rebuild the handlers
+        setup_logging(log_dir=str(tmp_path), console=True)
+        assert logger.handlers != handlers
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def test_setup_logging_skips_process_details():
+    """Test that records do not collect process and thread details."""
+    with patch('logging.logProcesses', True), \
+         patch('logging.logThreads', True), \
+         patch('logging.logMultiprocessing', True):
+        setup_logging(console=True, file=False)
+        record = logging.makeLogRecord({"msg": "test"})
+    
+    assert record.process is None
+    assert record.thread is None
+    assert record.processName is None
+
+
 def test_logging_with_custom_levels():
     """Test that custom log levels are respected."""
     with patch('logging.Logger.setLevel') as mock_set_level, \
@@ -50,6 +81,15 @@ def test_logging_with_custom_levels():
         mock_set_level.assert_called_with(logging.INFO)
 
 
+def test_logger_level_follows_handlers():
+    """Test that the logger level only admits records some handler will take."""
+    logger = setup_logging(log_level=logging.DEBUG, console_level=logging.WARNING, file=False)
+    
+    # The file level does not apply without a file handler
+    assert not logger.isEnabledFor(logging.INFO)
+    assert logger.isEnabledFor(logging.WARNING)
+
+
 def test_error_template_with_complex_data():
     """Test error templates with complex nested data structures."""
     context = {
@@ -69,15 +109,22 @@ def test_error_template_with_complex_data():
         context=context
     )
     
-    # Test logging with complex context data
-    with patch('json.dumps', side_effect=lambda obj, **kwargs: str(obj)) as mock_json:
+    with patch('route_to_art.logging.get_logger') as mock_get_logger:
+        logger = mock_get_logger.return_value
         log_route_art_error(error)
-        mock_json.assert_called_once()
+        msg_format, *args = logger.error.call_args[0]
         
-    # Test fallback when serialization fails
-    with patch('json.dumps', side_effect=TypeError("Not serializable")):
-        # Should not raise an exception
-        log_route_art_error(error)
+        # Context is serialized only when the record is formatted
+        with patch('route_to_art.logging._JSON_ENCODER') as mock_encoder:
+            mock_encoder.encode.side_effect = str
+            assert str(context) in msg_format % tuple(args)
+            mock_encoder.encode.assert_called_once_with(context)
+        
+        # Test fallback when serialization fails
+        with patch('route_to_art.logging._JSON_ENCODER') as mock_encoder:
+            mock_encoder.encode.side_effect = TypeError("Not serializable")
+            # Should not raise an exception
+            assert str(context) in msg_format % tuple(args)
 
 
 def test_error_hierarchy_inheritance():
@@ -135,14 +182,235 @@ def test_rotate_logs():
             # Should have called doRollover
             handler.doRollover.assert_called_once()
 
+    # A missing or small log file is left alone
+    with patch('os.path.getsize', side_effect=FileNotFoundError), \
+         patch('route_to_art.logging.get_logger') as mock_get_logger:
+        rotate_logs()
+        mock_get_logger.assert_not_called()
+
+
+def test_size_tracking_handler_rolls_over(tmp_path):
+    """Test that the size-tracking handler rotates once maxBytes is reached."""
+    from route_to_art.logging import SizeTrackingRotatingFileHandler
+    
+    log_path = tmp_path / "test.log"
+    log_path.write_text("x" * 50)
+    
+    handler = SizeTrackingRotatingFileHandler(str(log_path), maxBytes=100, backupCount=1)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        # The existing contents count toward the limit
+        assert handler._bytes_written == 50
+        
+        record = logging.makeLogRecord({"msg": "y" * 39})
+        handler.handle(record)
+        assert handler._bytes_written == 90
+        assert not (tmp_path / "test.log.1").exists()
+        
+        # Records are buffered rather than written one at a time
+        assert log_path.read_text() == "x" * 50
+        
+        handler.handle(record)
+        assert (tmp_path / "test.log.1").exists()
+        assert handler._bytes_written == 40
+    finally:
+        handler.close()
+    
+    assert log_path.read_text() == "y" * 39 + "\n"
+
+
+def test_size_tracking_handler_flushes_errors(tmp_path):
+    """Test that error records are written to disk immediately."""
+    from route_to_art.logging import SizeTrackingRotatingFileHandler
+    
+    log_path = tmp_path / "test.log"
+    handler = SizeTrackingRotatingFileHandler(str(log_path), maxBytes=0, encoding='utf-8')
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "caf\u00e9", "levelno": logging.ERROR}))
+        assert log_path.read_text(encoding='utf-8') == "caf\u00e9\n"
+        assert handler._bytes_written == len("caf\u00e9\n".encode('utf-8'))
+    finally:
+        handler.close()
+
+
+def test_file_logging_on_worker_thread(tmp_path):
+    """Test that log file writes happen off the logging thread."""
+    from route_to_art.logging import SizeTrackingRotatingFileHandler
+    
+    threads = []
+    original_emit = SizeTrackingRotatingFileHandler.emit
+    
+    def record_thread(self, record):
+        threads.append(threading.current_thread())
+        original_emit(self, record)
+    
+    with patch.object(SizeTrackingRotatingFileHandler, 'emit', record_thread):
+        logger = setup_logging(log_dir=str(tmp_path), console=False)
+        logger.error("error message")
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+    
+    assert threads
+    assert all(thread is not threading.current_thread() for thread in threads)
+    assert "error message" in (tmp_path / "route-to-art.log").read_text()
+
+
+def test_background_handler_formats_on_worker(tmp_path, monkeypatch):
+    """Test that queued records are formatted on the worker thread, not by the caller."""
+    import threading
+    
+    class Probe:
+        threads = []
+        
+        def __str__(self):
+            self.threads.append(threading.current_thread())
+            return "probe"
+    
+    logger = setup_logging(log_dir=str(tmp_path), console=False)
+    # Keep pytest's capture handler on the root logger from formatting the record
+    monkeypatch.setattr(logger, "propagate", False)
+    try:
+        # Errors are written through to the file by the worker thread
+        logger.error("value: %s", Probe())
+        logger.handlers[0].flush()
+        assert Probe.threads
+        assert all(thread is not threading.current_thread() for thread in Probe.threads)
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+    
+    assert "value: probe" in (tmp_path / "route-to-art.log").read_text()
+
+
+def test_file_logging_is_buffered(tmp_path):
+    """Test that file records are buffered until an error or close."""
+    logger = setup_logging(log_dir=str(tmp_path), console=False)
+    log_path = tmp_path / "route-to-art.log"
+    try:
+        logger.info("buffered message")
+        assert "buffered message" not in log_path.read_text()
+        
+        logger.error("error message")
+        logger.handlers[0].flush()
+        contents = log_path.read_text()
+        assert "buffered message" in contents
+        assert "error message" in contents
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def test_background_flush_keeps_worker(tmp_path):
+    """Test that flushing drains the queue without restarting the worker thread."""
+    import threading
+    
+    logger = setup_logging(log_dir=str(tmp_path), console=False)
+    handler = logger.handlers[0]
+    try:
+        worker = handler.listener._thread
+        
+        def log_and_flush(n):
+            for i in range(20):
+                logger.error("thread %d message %d", n, i)
+                handler.flush()
+        
+        threads = [threading.Thread(target=log_and_flush, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert handler.listener._thread is worker
+        assert handler.queue.empty()
+        contents = (tmp_path / "route-to-art.log").read_text()
+        assert contents.count("ERROR - thread") == 80
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def test_module_logger_prefix(tmp_path):
+    """Test that module loggers and plain records share the log format."""
+    logger = setup_logging(log_dir=str(tmp_path), console=False)
+    try:
+        get_module_logger("parser").info("from module logger")
+        logger.info("from plain logger")
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+    
+    contents = (tmp_path / "route-to-art.log").read_text()
+    assert "INFO - [parser] from module logger" in contents
+    assert "INFO - from plain logger" in contents
+
+
+def test_log_helpers_module_prefix(tmp_path):
+    """Test that the log_* helpers pass their module through the formatter."""
+    import io
+    import logging
+    from route_to_art.logging import log_warning, _REGULAR_FORMATTER
+    
+    logger = setup_logging(log_dir=str(tmp_path), console=False)
+    stream = io.StringIO()
+    plain_handler = logging.StreamHandler(stream)
+    plain_handler.setFormatter(_REGULAR_FORMATTER)
+    logger.addHandler(plain_handler)
+    try:
+        log_warning("from helper", module="exporter")
+        logger.warning("without module")
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+    
+    contents = (tmp_path / "route-to-art.log").read_text()
+    assert "WARNING - [exporter] from helper" in contents
+    output = stream.getvalue()
+    assert "WARNING - [exporter] from helper" in output
+    assert "WARNING - without module" in output
+
+
+def test_clear_logs(tmp_path):
+    """Test that clearing logs empties the files and resets the size counter."""
+    from route_to_art.logging import clear_logs, SizeTrackingRotatingFileHandler
+    
+    logger = setup_logging(log_dir=str(tmp_path), console=False)
+    backup = tmp_path / "route-to-art.log.1"
+    backup.write_text("old records\n")
+    try:
+        logger.info("buffered message")
+        with patch('route_to_art.logging.DEFAULT_LOG_DIR', str(tmp_path)):
+            clear_logs()
+        
+        file_handler = logger.handlers[0].target.target
+        assert isinstance(file_handler, SizeTrackingRotatingFileHandler)
+        assert file_handler._bytes_written == 0
+        assert backup.read_text() == ""
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+    
+    contents = (tmp_path / "route-to-art.log").read_text()
+    assert "buffered message" not in contents
+    assert "Log files cleared" in contents
+
 
-def test_get_log_files():
+def test_get_log_files(tmp_path):
     """Test retrieval of log files."""
     from route_to_art.logging import get_log_files
     
-    with patch('os.path.exists', return_value=True), \
-         patch('os.listdir', return_value=["gpx-art.log", "gpx-art.log.1", "other.txt"]):
-         
+    for name in ["gpx-art.log", "gpx-art.log.1", "other.txt"]:
+        (tmp_path / name).write_text("")
+    (tmp_path / "dir.log").mkdir()
+    
+    with patch('route_to_art.logging.DEFAULT_LOG_DIR', str(tmp_path)):
         log_files = get_log_files()
         
         # Should include only .log files
@@ -153,7 +421,12 @@ def test_get_log_files():
         
         # Should include full paths
         for path in log_files.values():
+            assert os.path.dirname(path) == str(tmp_path)
             assert os.path.basename(path) in ["gpx-art.log", "gpx-art.log.1"]
+    
+    # A missing log directory has no log files
+    with patch('route_to_art.logging.DEFAULT_LOG_DIR', str(tmp_path / "missing")):
+        assert get_log_files() == {}
 
 
 # CLI Error Integration Tests
@@ -212,8 +485,7 @@ def test_error_with_suggestion():
     # Create a mock RouteParseError with a suggestion
     error = RouteParseError.missing_track(file_path="test.gpx")
     
-    with patch('route_to_art.main.RouteParser.parse'), \
-         patch('route_to_art.main.RouteParser.to_route', side_effect=error):
+    with patch('route_to_art.main.RouteParser.parse_route', side_effect=error):
         
         # Run the command
         runner = CliRunner()
@@ -247,8 +519,7 @@ def test_concurrent_errors():
     # Create error scenarios in multiple components
     with patch('route_to_art.exporters.Exporter.export_png',
               side_effect=ExportError("PNG export failed")), \
-         patch('route_to_art.main.RouteParser.parse'), \
-         patch('route_to_art.main.RouteParser.to_route'), \
+         patch('route_to_art.main.RouteParser.parse_route'), \
          patch('route_to_art.main.RouteVisualizer.render_route'), \
          patch('route_to_art.logging.log_error'):
         
@@ -548,20 +819,35 @@ def test_log_error(logger_mock):
     
     # Test without module
     log_error(error, "Custom message")
-    logger_mock.log.assert_called_with(logging.ERROR, "Custom message")
+    logger_mock.log.assert_called_with(
+        logging.ERROR, "Custom message", exc_info=True, extra=None
+    )
     
     # Test with module
     log_error(error, "Module error", module="test_module")
-    logger_mock.log.assert_called_with(logging.ERROR, "[test_module] Module error")
-    
-    # Test with traceback
-    with patch('traceback.format_exc', return_value="Mock traceback"):
-        log_error(error, "Error with traceback", include_traceback=True)
-        logger_mock.log.assert_called_with(logging.ERROR, "Error with traceback\nMock traceback")
+    logger_mock.log.assert_called_with(
+        logging.ERROR, "Module error", exc_info=True, extra={"module_ctx": "[test_module] "}
+    )
     
     # Test without traceback
     log_error(error, "Error without traceback", include_traceback=False)
-    logger_mock.log.assert_called_with(logging.ERROR, "Error without traceback")
+    logger_mock.log.assert_called_with(
+        logging.ERROR, "Error without traceback", exc_info=False, extra=None
+    )
+
+
+def test_log_error_includes_traceback(caplog):
+    """Test that log_error attaches the active exception's traceback."""
+    try:
+        raise ValueError("Test error")
+    except ValueError as e:
+        with caplog.at_level(logging.ERROR, logger="route-to-art"):
+            log_error(e, "Error with traceback")
+    
+    record = caplog.records[-1]
+    assert record.getMessage() == "Error with traceback"
+    assert record.exc_info[0] is ValueError
+    assert "Traceback" in caplog.text
 
 
 def test_log_route_art_error(logger_mock):
@@ -576,14 +862,22 @@ def test_log_route_art_error(logger_mock):
     log_route_art_error(error, module="test_module")
     
     # Verify that the logger was called with the correct message
-    call_args = logger_mock.error.call_args[0][0]
-    assert "[test_module] GPX Art error" in call_args
+    msg_format, *args = logger_mock.error.call_args[0]
+    assert "GPX Art error" in msg_format % tuple(args)
+    assert logger_mock.error.call_args[1] == {"extra": {"module_ctx": "[test_module] "}}
     
     # Test with context serialization
-    with patch('json.dumps', return_value='{"key": "value"}'):
+    with patch('route_to_art.logging._JSON_ENCODER') as mock_encoder:
+        mock_encoder.encode.return_value = '{"key": "value"}'
         log_route_art_error(error)
-        call_args = logger_mock.error.call_args[0][0]
-        assert 'Context: {"key": "value"}' in call_args
+        msg_format, *args = logger_mock.error.call_args[0]
+        assert 'Context: {"key": "value"}' in msg_format % tuple(args)
+    
+    # Nothing is logged when ERROR is disabled
+    logger_mock.reset_mock()
+    logger_mock.isEnabledFor.return_value = False
+    log_route_art_error(error)
+    logger_mock.error.assert_not_called()
 
 
 def test_log_exception(logger_mock):
@@ -604,42 +898,56 @@ def test_log_warning(logger_mock):
     """Test the log_warning function."""
     # Test basic warning
     log_warning("Warning message")
-    logger_mock.warning.assert_called_with("Warning message")
+    logger_mock.warning.assert_called_with("Warning message", extra=None)
     
     # Test with module
     log_warning("Module warning", module="test_module")
-    logger_mock.warning.assert_called_with("[test_module] Module warning")
+    logger_mock.warning.assert_called_with("Module warning", extra={"module_ctx": "[test_module] "})
     
     # Test with error
     error = ValueError("Error details")
     log_warning("Warning with error", error=error)
-    logger_mock.warning.assert_called_with("Warning with error: Error details")
+    logger_mock.warning.assert_called_with("Warning with error: Error details", extra=None)
 
 
 def test_log_info(logger_mock):
     """Test the log_info function."""
     log_info("Info message")
-    logger_mock.info.assert_called_with("Info message")
+    logger_mock.info.assert_called_with("Info message", extra=None)
     
     log_info("Module info", module="test_module")
-    logger_mock.info.assert_called_with("[test_module] Module info")
+    logger_mock.info.assert_called_with("Module info", extra={"module_ctx": "[test_module] "})
 
 
 def test_log_debug(logger_mock):
     """Test the log_debug function."""
     # Test basic debug message
     log_debug("Debug message")
-    logger_mock.debug.assert_called_with("Debug message")
+    logger_mock.debug.assert_called_with("Debug message", extra=None)
     
     # Test with module
     log_debug("Module debug", module="test_module")
-    logger_mock.debug.assert_called_with("[test_module] Module debug")
+    logger_mock.debug.assert_called_with("Module debug", extra={"module_ctx": "[test_module] "})
     
     # Test with data
     data = {"key": "value"}
-    with patch('json.dumps', return_value='{"key": "value"}'):
+    with patch('route_to_art.logging._JSON_ENCODER') as mock_encoder:
+        mock_encoder.encode.return_value = '{"key": "value"}'
         log_debug("Debug with data", data=data)
-        logger_mock.debug.assert_called_with('Debug with data\nData: {"key": "value"}')
+        logger_mock.debug.assert_called_with(
+            'Debug with data\nData: {"key": "value"}', extra=None
+        )
+
+
+def test_log_debug_skips_formatting_when_disabled(logger_mock):
+    """Test that debug data is not serialized when DEBUG is disabled."""
+    logger_mock.isEnabledFor.return_value = False
+    
+    with patch('route_to_art.logging._JSON_ENCODER') as mock_encoder:
+        log_debug("Debug with data", module="test_module", data={"key": "value"})
+    
+    mock_encoder.encode.assert_not_called()
+    logger_mock.debug.assert_not_called()
 
 
 def test_configure_for_cli():
@@ -679,8 +987,7 @@ def test_cli_convert_recover_from_marker_error():
     """Test that convert command recovers from marker rendering errors."""
     with patch('click.echo'), \
          patch('click.secho'), \
-         patch('route_to_art.main.RouteParser.parse'), \
-         patch('route_to_art.main.RouteParser.to_route'), \
+         patch('route_to_art.main.RouteParser.parse_route'), \
          patch('route_to_art.main.RouteVisualizer.render_route'), \
          patch('route_to_art.main.RouteVisualizer.add_distance_markers',
                side_effect=Exception("Marker error")), \
@@ -705,8 +1012,7 @@ def test_cli_convert_recover_from_overlay_error():
     """Test that convert command recovers from overlay rendering errors."""
     with patch('click.echo'), \
          patch('click.secho'), \
-         patch('route_to_art.main.RouteParser.parse'), \
-         patch('route_to_art.main.RouteParser.to_route'), \
+         patch('route_to_art.main.RouteParser.parse_route'), \
          patch('route_to_art.main.RouteVisualizer.render_route'), \
          patch('route_to_art.main.RouteVisualizer.add_overlay',
                side_effect=Exception("Overlay error")), \
@@ -742,8 +1048,7 @@ def test_export_multiple_partial_success():
         
         # Run with config to use our mocked Exporter
         with patch('route_to_art.main.Exporter'), \
-             patch('route_to_art.main.RouteParser.parse'), \
-             patch('route_to_art.main.RouteParser.to_route'), \
+             patch('route_to_art.main.RouteParser.parse_route'), \
              patch('route_to_art.main.RouteVisualizer.render_route'), \
              patch('route_to_art.main.get_effective_options', return_value={}):
             
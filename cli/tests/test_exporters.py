@@ -2,16 +2,20 @@
 Tests for the exporter functionality.
 """
 
+import io
 import os
 import stat
 import re
+import threading
 import xml.etree.ElementTree as ET
 import pytest
 import matplotlib.pyplot as plt
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 from matplotlib.figure import Figure
+from PIL import Image
 import PyPDF2
 
 from route_to_art.exporters import Exporter, ExportError, ExportFormat, PageSize
@@ -71,6 +75,128 @@ def test_export_png_with_custom_dpi(exporter, test_figure, tmp_path):
     assert high_dpi_size > low_dpi_size
 
 
+def test_export_png_compress_level(exporter, test_figure, tmp_path):
+    """Test that a higher PNG compression level produces a smaller file."""
+    fast_path = tmp_path / "fast.png"
+    small_path = tmp_path / "small.png"
+    
+    exporter.export_png(test_figure, fast_path, dpi=150)
+    exporter.export_png(test_figure, small_path, dpi=150, compress_level=9)
+    
+    assert small_path.stat().st_size < fast_path.stat().st_size
+
+
+def test_export_png_default_dpi(exporter, test_figure, tmp_path):
+    """Test that PNG export without a DPI uses the figure's, like savefig."""
+    output_path = tmp_path / "default.png"
+    
+    with patch("route_to_art.exporters._import_optional", return_value=None):
+        exporter.export_png(test_figure, output_path, dpi=None)
+    
+    assert Image.open(output_path).info["dpi"] == pytest.approx((test_figure.dpi,) * 2, abs=0.01)
+
+
+class FakeCV2:
+    """Minimal stand-in for OpenCV's PNG encoding API, backed by Pillow."""
+    COLOR_RGBA2BGRA = 0
+    IMWRITE_PNG_COMPRESSION = 16
+
+    def __init__(self):
+        self.in_place = []
+
+    def cvtColor(self, image, code, dst=None):
+        self.in_place.append(dst is image)
+        if dst is None:
+            return image[..., [2, 1, 0, 3]]
+        dst[...] = image[..., [2, 1, 0, 3]]
+        return dst
+
+    def imencode(self, ext, image, params):
+        buffer = io.BytesIO()
+        Image.fromarray(np.ascontiguousarray(image[..., [2, 1, 0, 3]])).save(buffer, format="PNG")
+        return True, np.frombuffer(buffer.getvalue(), dtype=np.uint8)
+
+
+def test_export_png_with_cv2_matches_matplotlib(exporter, test_figure, tmp_path):
+    """Test that the OpenCV encoder path writes the same pixels as matplotlib."""
+    reference_path = tmp_path / "reference.png"
+    cv2_path = tmp_path / "cv2.png"
+    
+    with patch("route_to_art.exporters._import_optional", return_value=None):
+        exporter.export_png(test_figure, reference_path, dpi=100)
+    cv2 = FakeCV2()
+    modules = {"pyvips": None, "cv2": cv2}
+    with patch("route_to_art.exporters._import_optional", side_effect=modules.get):
+        exporter.export_png(test_figure, cv2_path, dpi=100)
+    
+    reference = np.asarray(Image.open(reference_path))
+    assert np.array_equal(np.asarray(Image.open(cv2_path)), reference)
+    # The pixels are the figure's own render buffer, which must stay RGBA
+    assert cv2.in_place == [False]
+    assert np.array_equal(np.asarray(test_figure.canvas.buffer_rgba()), reference)
+    assert Image.open(cv2_path).info["dpi"] == pytest.approx((100, 100), abs=0.01)
+
+
+class FakeVipsImage:
+    """Minimal stand-in for a pyvips image, backed by Pillow."""
+
+    def __init__(self, data, width, height, bands):
+        self.pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width, bands)
+        self.xres = self.yres = None
+
+    def copy(self, xres, yres):
+        self.xres, self.yres = xres, yres
+        return self
+
+    def pngsave_buffer(self, compression):
+        # Like libvips, only write pHYs when a resolution was set
+        kwargs = {}
+        if self.xres is not None:
+            kwargs["dpi"] = (self.xres * 25.4, self.yres * 25.4)
+        buffer = io.BytesIO()
+        Image.fromarray(self.pixels).save(buffer, format="PNG", compress_level=compression, **kwargs)
+        return buffer.getvalue()
+
+
+class FakePyvips:
+    """Minimal stand-in for the pyvips module."""
+
+    class Image:
+        @staticmethod
+        def new_from_memory(data, width, height, bands, band_format):
+            return FakeVipsImage(data, width, height, bands)
+
+
+def test_export_png_prefers_pyvips(exporter, test_figure, tmp_path):
+    """Test that pyvips is used for PNG encoding when installed."""
+    reference_path = tmp_path / "reference.png"
+    vips_path = tmp_path / "vips.png"
+    modules = {"pyvips": FakePyvips(), "cv2": None}
+    
+    with patch("route_to_art.exporters._import_optional", return_value=None):
+        exporter.export_png(test_figure, reference_path, dpi=100)
+    with patch("route_to_art.exporters._import_optional", side_effect=modules.get) as mock_import:
+        exporter.export_png(test_figure, vips_path, dpi=100)
+    
+    mock_import.assert_called_once_with("pyvips")
+    reference = np.asarray(Image.open(reference_path))
+    assert np.array_equal(np.asarray(Image.open(vips_path)), reference)
+    assert Image.open(vips_path).info["dpi"] == pytest.approx((100, 100), abs=0.01)
+
+
+def test_export_png_bbox_inches(exporter, test_figure, tmp_path):
+    """Test that PNGs keep the full figure by default and crop when asked."""
+    full_path = tmp_path / "full.png"
+    tight_path = tmp_path / "tight.png"
+    
+    exporter.export_png(test_figure, full_path, dpi=100)
+    exporter.export_png(test_figure, tight_path, dpi=100, bbox_inches='tight')
+    
+    assert Image.open(full_path).size == (500, 500)
+    width, height = Image.open(tight_path).size
+    assert width < 500 and height < 500
+
+
 def test_export_png_invalid_directory(exporter, test_figure, tmp_path):
     """Test export to non-existent directory."""
     # Path to non-existent directory
@@ -165,16 +291,10 @@ def test_export_png_cleanup_on_error(exporter, test_figure, tmp_path):
     """Test temporary file cleanup on error."""
     output_path = tmp_path / "output.png"
     
-    # Create a patch that will succeed for the temporary file but fail
-    # during verification to trigger cleanup
-    original_verify = exporter._verify_output_file
-    
+    # Create a patch that fails verification of the temporary file to
+    # trigger cleanup
     def mock_verify(path):
-        # If this is the final verification, raise an error
-        if str(path) == str(output_path):
-            raise ValueError("Mock verification error")
-        # Otherwise, proceed normally
-        return original_verify(path)
+        raise ValueError("Mock verification error")
     
     # Apply the patch
     with patch.object(exporter, '_verify_output_file', side_effect=mock_verify):
@@ -260,6 +380,20 @@ def test_export_svg_vector_quality(exporter, test_figure, tmp_path):
     assert '<image' not in svg_content.lower()
 
 
+def test_export_svg_precision(exporter, test_figure, tmp_path):
+    """Test that SVG path coordinates are rounded unless precision is None."""
+    compact_path = tmp_path / "compact.svg"
+    full_path = tmp_path / "full.svg"
+    
+    exporter.export_svg(test_figure, compact_path)
+    exporter.export_svg(test_figure, full_path, precision=None)
+    
+    compact = compact_path.read_text()
+    assert is_valid_svg(compact_path)
+    assert not re.search(r'\sd="[^"]*\d\.\d{3}', compact)
+    assert compact_path.stat().st_size < full_path.stat().st_size
+
+
 # Tests for PDF export
 
 def is_valid_pdf(file_path):
@@ -307,6 +441,40 @@ def test_export_pdf_page_sizes(exporter, test_figure, tmp_path):
         # Cannot easily check the actual dimensions without more complex PDF parsing
 
 
+def test_export_pdf_compress_level(exporter, test_figure, tmp_path):
+    """Test that the PDF compression level is applied to the output streams."""
+    uncompressed_path = tmp_path / "uncompressed.pdf"
+    compressed_path = tmp_path / "compressed.pdf"
+    
+    exporter.export_pdf(test_figure, uncompressed_path, compress_level=0)
+    exporter.export_pdf(test_figure, compressed_path, compress_level=9)
+    
+    assert is_valid_pdf(compressed_path)
+    assert compressed_path.stat().st_size < uncompressed_path.stat().st_size
+
+
+def test_export_pdf_dpi(exporter, test_figure, tmp_path):
+    """Test that the PDF raster resolution defaults to 150 and can be overridden."""
+    with patch.object(test_figure, 'savefig', wraps=test_figure.savefig) as mock_savefig:
+        exporter.export_pdf(test_figure, tmp_path / "default.pdf")
+        exporter.export_pdf(test_figure, tmp_path / "custom.pdf", pdf_dpi=72)
+    
+    assert [c.kwargs['dpi'] for c in mock_savefig.call_args_list] == [150, 72]
+
+
+def test_export_pdf_restores_figure_size(exporter, test_figure, tmp_path):
+    """Test that PDF export leaves the figure size unchanged, even on failure."""
+    original_size = tuple(test_figure.get_size_inches())
+    
+    exporter.export_pdf(test_figure, tmp_path / "output.pdf", page_size="a4")
+    assert tuple(test_figure.get_size_inches()) == original_size
+    
+    with patch.object(Figure, 'savefig', side_effect=ValueError("Mock savefig error")):
+        with pytest.raises(ExportError):
+            exporter.export_pdf(test_figure, tmp_path / "failed.pdf", page_size="a4")
+    assert tuple(test_figure.get_size_inches()) == original_size
+
+
 def test_export_pdf_invalid_page_size(exporter, test_figure, tmp_path):
     """Test PDF export with invalid page size."""
     output_path = tmp_path / "output.pdf"
@@ -394,6 +562,67 @@ def test_export_multiple_formats(exporter, test_figure, tmp_path):
     assert ".pdf" in extensions
 
 
+def test_export_multiple_measures_bbox_once(exporter, test_figure, tmp_path):
+    """Test that PNG and SVG exports share one tight bounding box measurement."""
+    with patch.object(test_figure, 'get_tightbbox', wraps=test_figure.get_tightbbox) as mock_bbox:
+        output_paths = exporter.export_multiple(
+            figure=test_figure,
+            base_path=tmp_path / "output",
+            formats=["png", "svg"],
+            bbox_inches='tight'
+        )
+    
+    assert mock_bbox.call_count == 1
+    assert all(path.stat().st_size > 0 for path in output_paths)
+
+
+def test_export_multiple_validates_directory_once(exporter, test_figure, tmp_path):
+    """Test that a batch export checks the output directory a single time."""
+    with patch.object(
+        exporter, '_validate_output_directory', wraps=exporter._validate_output_directory
+    ) as mock_validate:
+        exporter.export_multiple(
+            figure=test_figure,
+            base_path=tmp_path / "output",
+            formats=["png", "svg", "pdf"]
+        )
+    
+    assert mock_validate.call_count == 1
+
+
+def test_export_multiple_encodes_png_on_worker(exporter, test_figure, tmp_path):
+    """Test that PNG encoding in a batch runs off the calling thread."""
+    original_write = exporter._write_png
+    threads = []
+    
+    def record_thread(output_path, encode):
+        threads.append(threading.current_thread())
+        return original_write(output_path, encode)
+    
+    with patch.object(exporter, '_write_png', side_effect=record_thread):
+        output_paths = exporter.export_multiple(
+            figure=test_figure,
+            base_path=tmp_path / "output",
+            formats=["png", "pdf"]
+        )
+    
+    assert threads and threads[0] is not threading.main_thread()
+    assert all(path.stat().st_size > 0 for path in output_paths)
+
+
+def test_export_multiple_renders_repeated_format_once(exporter, test_figure, tmp_path):
+    """Test that a format listed twice is exported once."""
+    with patch.object(exporter, 'export_svg', wraps=exporter.export_svg) as export_svg:
+        output_paths = exporter.export_multiple(
+            figure=test_figure,
+            base_path=tmp_path / "output",
+            formats=["svg", "png", " SVG"]
+        )
+    
+    assert output_paths == [tmp_path / "output.svg", tmp_path / "output.png"]
+    assert export_svg.call_count == 1
+
+
 def test_export_multiple_formats_validation(exporter, test_figure, tmp_path):
     """Test validation in multiple format export."""
     base_path = tmp_path / "output"
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 
@@ -22,6 +25,23 @@ def test_version_option(runner):
     assert "version" in result.output.lower()
 
 
+def test_import_does_not_load_matplotlib():
+    """Test that importing the CLI defers the matplotlib-backed modules."""
+    code = (
+        "import sys, route_to_art.main as m; "
+        "assert 'matplotlib' not in sys.modules; "
+        "m.RouteVisualizer; "
+        "assert 'matplotlib' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_does_not_load_gpxpy():
+    """Test that importing the CLI leaves gpxpy until a file is parsed."""
+    code = "import sys, route_to_art.main; assert 'gpxpy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_help_option(runner):
     """Test that --help option shows all three commands."""
     result = runner.invoke(cli, ["--help"])
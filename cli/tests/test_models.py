@@ -3,10 +3,13 @@ Tests for the route data models.
 """
 
 import math
+import numpy as np
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from route_to_art.models import Route, RoutePoint, RouteSegment, haversine_distance
+from route_to_art.models import (
+    Route, RoutePoint, RouteSegment, haversine_array, haversine_distance, rdp_mask
+)
 
 
 class TestHaversineDistance:
@@ -24,6 +27,16 @@ class TestHaversineDistance:
         
         distance = haversine_distance(sf_lat, sf_lon, la_lat, la_lon)
         assert 550000 < distance < 560000  # ~550-560 km
+    
+    def test_array_matches_scalar(self):
+        """Test the array version against the scalar function."""
+        lat1 = np.array([37.7749, 0.0, 45.0])
+        lon1 = np.array([-122.4194, 0.0, -122.0])
+        lat2 = np.array([34.0522, 1.0, 45.0])
+        lon2 = np.array([-118.2437, 1.0, -122.0])
+        
+        expected = [haversine_distance(*args) for args in zip(lat1, lon1, lat2, lon2)]
+        assert haversine_array(lat1, lon1, lat2, lon2) == pytest.approx(expected)
 
 
 class TestRoutePoint:
@@ -151,6 +164,37 @@ class TestRouteSegment:
         assert duration is not None
         assert duration == timedelta(minutes=10)
     
+    def test_lat_array(self, multi_point_segment, empty_segment):
+        """Test that latitudes are exposed as a float array."""
+        lats = multi_point_segment.lat_array
+        assert lats.dtype == np.float64
+        assert lats.tolist() == [37.7749, 37.7750, 37.7751]
+        assert empty_segment.lat_array.size == 0
+    
+    def test_arrays_follow_point_changes(self):
+        """Test that distances and arrays reflect points added after first use."""
+        segment = RouteSegment(points=[RoutePoint(0.0, 0.0), RoutePoint(0.0, 1.0)])
+        assert segment.calculate_distance() == pytest.approx(111194.9, abs=0.1)
+        
+        segment.points.append(RoutePoint(0.0, 2.0))
+        assert segment.lon_array.tolist() == [0.0, 1.0, 2.0]
+        assert segment.calculate_distance() == pytest.approx(2 * 111194.9, abs=0.2)
+    
+    def test_ts_array(self, partial_timed_segment):
+        """Test that timestamps are exposed as datetime64 with NaT gaps."""
+        ts = partial_timed_segment.ts_array
+        assert ts.dtype == np.dtype('datetime64[us]')
+        assert np.isnat(ts).tolist() == [False, True, False]
+        assert ts[0] == np.datetime64('2023-01-01T12:00:00')
+    
+    def test_ts_array_timezone_aware(self):
+        """Test that timezone-aware timestamps are converted to UTC."""
+        tz = timezone(timedelta(hours=2))
+        segment = RouteSegment(points=[
+            RoutePoint(latitude=0.0, longitude=0.0, timestamp=datetime(2023, 1, 1, 12, 0, tzinfo=tz))
+        ])
+        assert segment.ts_array[0] == np.datetime64('2023-01-01T10:00:00')
+    
     def test_partial_timed_segment_duration(self, partial_timed_segment):
         """Test duration calculation when some timestamps are missing."""
         duration = partial_timed_segment.calculate_duration()
@@ -270,7 +314,80 @@ class TestRoute:
         assert stats['gain'] == 10.0  # From 100 to 110
         assert stats['loss'] == 5.0   # From 110 to 105
     
+    def test_route_elevation_stats_skip_missing(self):
+        """Test that gain and loss bridge points and segments without elevation."""
+        route = Route(segments=[
+            RouteSegment(points=[
+                RoutePoint(latitude=0.0, longitude=0.0, elevation=100.0),
+                RoutePoint(latitude=0.0, longitude=0.0),
+            ]),
+            RouteSegment(),
+            RouteSegment(points=[RoutePoint(latitude=0.0, longitude=0.0, elevation=120.0)]),
+        ])
+        
+        assert route.get_elevation_stats() == {'min': 100.0, 'max': 120.0, 'gain': 20.0, 'loss': 0.0}
+        assert str(route.get_elevation_stats()['loss']) == "0.0"
+    
     def test_route_total_points(self, multi_segment_route):
         """Test total points calculation for a route."""
         assert multi_segment_route.get_total_points() == 4
+    
+    def test_route_stats_match_getters(self, multi_segment_route):
+        """Test that one statistics pass agrees with the individual getters."""
+        stats = multi_segment_route.compute_stats()
+        
+        assert stats.total_points == multi_segment_route.get_total_points()
+        assert stats.bounds == multi_segment_route.get_bounds()
+        assert stats.total_distance == multi_segment_route.get_total_distance()
+        assert stats.total_duration == multi_segment_route.get_total_duration()
+    
+    def test_route_stats_follow_segment_changes(self):
+        """Test that statistics reflect segments added after first use."""
+        route = Route(segments=[RouteSegment(points=[RoutePoint(0.0, 0.0), RoutePoint(0.0, 1.0)])])
+        assert route.get_bounds() == (0.0, 0.0, 0.0, 1.0)
+        
+        route.segments.append(RouteSegment(points=[RoutePoint(1.0, 1.0), RoutePoint(1.0, 2.0)]))
+        assert route.get_total_points() == 4
+        assert route.compute_stats().total_points == 4
+        assert route.get_bounds() == (0.0, 1.0, 0.0, 2.0)
+        assert route.get_total_distance() == pytest.approx(
+            sum(segment.calculate_distance() for segment in route.segments)
+        )
+    
+    def test_route_simplify_keeps_stats(self, multi_segment_route):
+        """Test that a simplified route reports the original statistics."""
+        simplified = multi_segment_route.simplify(1.0)
+        
+        assert simplified is not multi_segment_route
+        assert simplified.simplified_from is multi_segment_route
+        assert simplified.get_total_distance() == multi_segment_route.get_total_distance()
+        assert multi_segment_route.simplify(0) is multi_segment_route
 
+
+class TestSimplify:
+    """Tests for Ramer-Douglas-Peucker simplification."""
+    
+    def test_rdp_mask_drops_collinear_points(self):
+        """Test that points within tolerance of the line are dropped."""
+        x = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        y = np.array([0.0, 0.001, 0.0, 2.0, 0.0])
+        
+        assert rdp_mask(x, y, 0.01).tolist() == [True, False, True, True, True]
+        assert rdp_mask(x, y, 0.0).all()
+        assert rdp_mask(x[:0], y[:0], 0.01).tolist() == []
+    
+    def test_segment_simplify_keeps_point_objects(self):
+        """Test that simplification keeps the original points and metadata."""
+        points = [
+            RoutePoint(latitude=0.0, longitude=i * 0.001, elevation=float(i))
+            for i in range(10)
+        ]
+        segment = RouteSegment(points=points, name="Straight")
+        
+        simplified = segment.simplify(1e-5)
+        
+        assert simplified.points == [points[0], points[-1]]
+        assert simplified.points[1] is points[-1]
+        assert simplified.name == "Straight"
+        assert simplified.lat_array.tolist() == [0.0, 0.0]
+        assert segment.simplify(0) is segment
@@ -8,7 +8,7 @@ from pathlib import Path
 
 import pytest
 
-from route_to_art.parsers import RouteParser
+from route_to_art.parsers import RouteParser, route_cache_path
 
 
 @pytest.fixture
@@ -149,3 +149,189 @@ def test_get_error_lazy_parsing(invalid_gpx_file):
     assert "Error parsing GPX file" in error
     assert parser._parsed  # Check that parsing was triggered
 
+
+
+def test_parse_route_matches_to_route(valid_gpx_file):
+    """Test streaming parse produces the same Route as the gpxpy path."""
+    parser = RouteParser(valid_gpx_file)
+    expected = parser.to_route(parser.parse())
+    
+    streamed = RouteParser(valid_gpx_file)
+    route = streamed.parse_route()
+    
+    assert route == expected
+    assert streamed.is_valid()
+    assert route.name == "Test Track"
+    assert route.segments[0].lat_array.tolist() == [37.7749, 37.7750]
+
+
+_GPX11 = 'xmlns="http://www.topografix.com/GPX/1/1" xmlns:gpxtpx="http://www.garmin.com/xmlschemas/TrackPointExtension/v1"'
+
+_PARITY_DOCUMENTS = {
+    "full_1_1": f"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="gpx-art-test" {_GPX11}>
+  <metadata>
+    <name>Metadata Name</name>
+    <desc>A description</desc>
+    <author><name>Author Name</name></author>
+    <time>2023-01-01T08:00:00Z</time>
+    <keywords>one, two</keywords>
+    <bounds minlat="37.0" minlon="-123.0" maxlat="38.0" maxlon="-122.0"/>
+    <extensions><name>Not the route name</name></extensions>
+  </metadata>
+  <wpt lat="37.5" lon="-122.5"><ele>3</ele><name>Start</name></wpt>
+  <trk>
+    <name>First Track</name>
+    <trkseg>
+      <trkpt lat="37.7749" lon="-122.4194">
+        <ele>10.5</ele>
+        <time>2023-01-01T12:00:00.250+02:00</time>
+        <extensions>
+          <gpxtpx:TrackPointExtension><gpxtpx:hr>120</gpxtpx:hr></gpxtpx:TrackPointExtension>
+        </extensions>
+      </trkpt>
+      <trkpt lat="37.7750" lon="-122.4195"><ele>
+        11
+      </ele></trkpt>
+    </trkseg>
+    <trkseg>
+      <trkpt lat="37.7751" lon="-122.4196"><time>2023-01-01T12:02:00Z</time></trkpt>
+    </trkseg>
+    <extensions><name>Not the track name</name></extensions>
+  </trk>
+  <trk>
+    <trkseg><trkpt lat="37.8" lon="-122.3"/></trkseg>
+  </trk>
+  <rte>
+    <name>A Route</name>
+    <rtept lat="37.1" lon="-122.1"><ele>1</ele></rtept>
+    <rtept lat="37.2" lon="-122.2"><time>2023-01-02T00:00:00Z</time></rtept>
+  </rte>
+  <wpt lat="37.6" lon="-122.6"/>
+  <extensions><time>2020-01-01T00:00:00Z</time></extensions>
+</gpx>
+""",
+    "routes_and_waypoints": f"""<?xml version="1.0"?>
+<gpx version="1.1" creator="gpx-art-test" {_GPX11}>
+  <rte><rtept lat="1.0" lon="2.0"/><rtept lat="1.5" lon="2.5"/></rte>
+  <rte><name>Second</name><rtept lat="3.0" lon="4.0"/></rte>
+  <rte><name>Empty</name></rte>
+  <wpt lat="5.0" lon="6.0"><time>2023-05-05T05:05:05Z</time></wpt>
+</gpx>
+""",
+    "waypoints_only": f"""<?xml version="1.0"?>
+<gpx version="1.1" creator="gpx-art-test" {_GPX11}>
+  <wpt lat="5.0" lon="6.0"><ele>7</ele></wpt>
+  <wpt lat="5.5" lon="6.5"/>
+</gpx>
+""",
+    "gpx_1_0": """<?xml version="1.0"?>
+<gpx version="1.0" creator="gpx-art-test" xmlns="http://www.topografix.com/GPX/1/0">
+  <name>Old Style</name>
+  <desc>GPX 1.0 metadata lives on the root</desc>
+  <author>Old Author</author>
+  <time>2022-06-01T10:00:00Z</time>
+  <keywords>legacy</keywords>
+  <bounds minlat="1.0" minlon="2.0" maxlat="3.0" maxlon="4.0"/>
+  <trk>
+    <name>Old Track</name>
+    <trkseg>
+      <trkpt lat="1.0" lon="2.0"><ele>5</ele><time>2022-06-01T10:00:00Z</time><speed>1.5</speed></trkpt>
+      <trkpt lat="1.1" lon="2.1"><ele>6</ele><time>2022-06-01T10:05:00Z</time></trkpt>
+    </trkseg>
+  </trk>
+</gpx>
+""",
+    "blank_and_bad_times": f"""<?xml version="1.0"?>
+<gpx version="1.1" creator="gpx-art-test" {_GPX11}>
+  <metadata><time> </time></metadata>
+  <trk><trkseg>
+    <trkpt lat="1.0" lon="2.0"><ele></ele><time></time></trkpt>
+    <trkpt lat="1.1" lon="2.1"><time> </time></trkpt>
+    <trkpt lat="1.2" lon="2.2"><time> 2023-01-01T00:00:00Z </time></trkpt>
+    <trkpt lat="1.3" lon="2.3"><time>not a time</time></trkpt>
+  </trkseg></trk>
+</gpx>
+""",
+    "blank_elevation": f"""<?xml version="1.0"?>
+<gpx version="1.1" creator="gpx-art-test" {_GPX11}>
+  <trk><trkseg><trkpt lat="1.0" lon="2.0"><ele> </ele></trkpt></trkseg></trk>
+</gpx>
+""",
+    "bad_elevation": f"""<?xml version="1.0"?>
+<gpx version="1.1" creator="gpx-art-test" {_GPX11}>
+  <trk><trkseg><trkpt lat="1.0" lon="2.0"><ele>high</ele></trkpt></trkseg></trk>
+</gpx>
+""",
+}
+
+
+@pytest.mark.parametrize("name", sorted(_PARITY_DOCUMENTS))
+def test_parse_route_matches_to_route_documents(tmp_path, name):
+    """Test streaming parse agrees with the gpxpy path, including on rejected files."""
+    path = tmp_path / f"{name}.gpx"
+    path.write_text(_PARITY_DOCUMENTS[name])
+    
+    parser = RouteParser(str(path))
+    gpx = parser.parse()
+    route = RouteParser(str(path)).parse_route()
+    
+    if gpx is None:
+        assert route is None
+    else:
+        expected = parser.to_route(gpx)
+        assert route == expected
+        assert route.name == expected.name
+        assert [segment.name for segment in route.segments] == [segment.name for segment in expected.segments]
+
+
+def test_parse_route_invalid_gpx(invalid_gpx_file):
+    """Test streaming parse reports malformed files."""
+    parser = RouteParser(invalid_gpx_file)
+    
+    assert parser.parse_route() is None
+    assert "Error parsing GPX file" in parser.get_error()
+
+
+def test_parse_route_cache(valid_gpx_file, route_cache_dir):
+    """Test cached routes are reused until the file changes."""
+    route = RouteParser(valid_gpx_file).parse_route(use_cache=True)
+    assert len(os.listdir(route_cache_dir)) == 1
+    
+    cached = RouteParser(valid_gpx_file).parse_route(use_cache=True)
+    assert cached == route
+    assert cached is not route
+    
+    # Editing the file changes its size and mtime, replacing the cache entry
+    with open(valid_gpx_file, 'r') as f:
+        content = f.read()
+    with open(valid_gpx_file, 'w') as f:
+        f.write(content.replace("Test Track", "Edited Track"))
+    
+    edited = RouteParser(valid_gpx_file).parse_route(use_cache=True)
+    assert edited.name == "Edited Track"
+    assert len(os.listdir(route_cache_dir)) == 1
+
+
+def test_parse_route_cache_is_opt_in(valid_gpx_file, route_cache_dir):
+    """Test that routes are only cached when asked for."""
+    assert RouteParser(valid_gpx_file).parse_route() is not None
+    assert not os.path.exists(route_cache_dir)
+
+
+def test_route_cache_is_bounded(tmp_path, valid_gpx_file, route_cache_dir, monkeypatch):
+    """Test that the oldest cached routes are removed beyond the entry limit."""
+    monkeypatch.setattr("route_to_art.parsers.ROUTE_CACHE_MAX_ENTRIES", 2)
+    with open(valid_gpx_file, 'r') as f:
+        content = f.read()
+    
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"route{i}.gpx"
+        path.write_text(content)
+        paths.append(route_cache_path(str(path)))
+        RouteParser(str(path)).parse_route(use_cache=True)
+        # Distinct write times, whatever the file system's timestamp resolution
+        os.utime(paths[-1], ns=(i * 10**9, i * 10**9))
+    
+    assert sorted(os.listdir(route_cache_dir)) == sorted(os.path.basename(p) for p in paths[1:])